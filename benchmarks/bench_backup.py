@@ -0,0 +1,42 @@
+"""Compare backup strategies on large files.
+
+Usage:
+    python -m benchmarks.bench_backup [files] [megabytes]
+
+Backs up 20 files of 64 MB by default, into a backup folder next to them as the Backup option does, once per strategy
+available: hard link, kernel clone (reflink or copy_file_range) and streaming copy.
+"""
+import os
+from sys import argv
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.models import backup
+
+
+def run(count: int, megabytes: int) -> None:
+    """Time backing up count files of megabytes each with every strategy and print a report."""
+    with TemporaryDirectory() as tmp:
+        block = os.urandom(1 << 20)
+        names = [f"cache_{i:03d}.abc" for i in range(count)]
+        for name in names:
+            with open(join(tmp, name), "wb") as cache:
+                for _ in range(megabytes):
+                    cache.write(block)
+        print(f"{count} files of {megabytes} MB, reflink: {backup.CAN_REFLINK}, "
+              f"copy_file_range: {backup.CAN_COPY_RANGE}")
+        can_reflink, can_copy_range = backup.CAN_REFLINK, backup.CAN_COPY_RANGE
+        for label, link, clone in (("link", True, True), ("clone", False, True), ("copy", False, False)):
+            backup.CAN_REFLINK, backup.CAN_COPY_RANGE = clone and can_reflink, clone and can_copy_range
+            directory = join(tmp, f"backup_{label}")
+            os.mkdir(directory)
+            start = perf_counter()
+            strategies = {backup.backup_file(src=join(tmp, x), dest=join(directory, x), link=link) for x in names}
+            elapsed = perf_counter() - start
+            print(f"{label:>6}: {elapsed * 1000:9.1f} ms ({count * megabytes / elapsed:,.0f} MB/sec), "
+                  f"strategies used: {', '.join(sorted(strategies))}")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 20, megabytes=int(argv[2]) if len(argv) > 2 else 64)
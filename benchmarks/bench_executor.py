@@ -0,0 +1,38 @@
+"""Compare renaming by absolute path against renaming relative to an open directory descriptor.
+
+Usage:
+    python -m benchmarks.bench_executor [files] [depth]
+
+Renames 20k files by default, in a temporary directory nested 30 levels deep so path resolution is visible. Every file
+is renamed forth and back once per executor mode, results are reported per rename.
+"""
+import os
+from sys import argv
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.models.executor import RENAME_DIR_FD, RenameExecutor
+
+
+def run(count: int, depth: int) -> None:
+    """Time both executor modes renaming count files and print a report."""
+    with TemporaryDirectory() as tmp:
+        directory = join(tmp, *(f"level_{i:02d}" for i in range(depth)))
+        os.makedirs(directory)
+        names = [f"plate_{i:07d}.exr" for i in range(count)]
+        for name in names:
+            open(join(directory, name), "w").close()
+        forth = [(name, name + ".tmp") for name in names]
+        back = [(dest, src) for src, dest in forth]
+        print(f"{count} files, {len(directory)} character path, dir_fd renames supported: {RENAME_DIR_FD}")
+        for label, use_dir_fd in (("absolute paths", False), ("directory fd", True)):
+            with RenameExecutor(directory=directory, use_dir_fd=use_dir_fd) as executor:
+                start = perf_counter()
+                renamed = executor.run(steps=forth) + executor.run(steps=back)
+                elapsed = perf_counter() - start
+            print(f"{label:>15}: {elapsed / renamed * 1e6:6.2f} us / rename")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 20000, depth=int(argv[2]) if len(argv) > 2 else 30)
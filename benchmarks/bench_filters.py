@@ -0,0 +1,50 @@
+"""Compare per row re.search against the compiled NameFilter engine.
+
+Usage:
+    python -m benchmarks.bench_filters [names]
+
+Runs each search mode over a synthetic list of render frame names, 1M by default.
+"""
+from re import search
+from sys import argv
+from time import perf_counter
+
+from quick_rename.models.filters import NameFilter, SUBSTRING, GLOB, REGEX
+
+CASES = (
+    (SUBSTRING, "comp"),
+    (GLOB, "*comp*"),
+    (GLOB, "shot01?_comp.*.exr"),
+    (REGEX, r"_comp\.\d{4}\.exr$"),
+)
+
+
+def make_names(count: int) -> list:
+    """Return count synthetic frame names."""
+    layers = ("comp", "bg", "fg", "matte")
+    return [f"shot{i % 97:03d}_{layers[i % 4]}.{i % 10000:04d}.exr" for i in range(count)]
+
+
+def run(count: int) -> None:
+    """Time every filter mode over count names and print a report."""
+    names = make_names(count=count)
+    print(f"{count} names")
+    for mode, pattern in CASES:
+        start = perf_counter()
+        # The previous limit search ran re.search with the raw string per row, comparable for plain text and regex.
+        legacy = [i for i, name in enumerate(names) if search(pattern, name)] if mode != GLOB else None
+        legacy_time = perf_counter() - start
+
+        start = perf_counter()
+        name_filter = NameFilter(pattern=pattern, mode=mode)
+        rows = name_filter.apply(names=names)
+        elapsed = perf_counter() - start
+        assert legacy is None or legacy == rows
+        line = f"{mode:>9} {pattern!r:>24}: {elapsed * 1000:8.1f} ms, {len(rows)} matches"
+        if legacy is not None:
+            line += f" (per row re.search {legacy_time * 1000:.1f} ms)"
+        print(line)
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 1000000)
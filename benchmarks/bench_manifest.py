@@ -0,0 +1,43 @@
+"""Time renaming from a streamed CSV manifest, shot_0000001.exr -> plate_0000001.exr and so on.
+
+Usage:
+    python -m benchmarks.bench_manifest [files] [chunk_size]
+
+Renames 100k files by default, in chunks of 10k rows, with one swap per 1k files so cycles are exercised too. Files are
+created empty in a temporary directory, journals and history are kept there as well. Throughput is printed by the
+command line itself, followed by the peak memory of the process.
+"""
+import os
+import resource
+from sys import argv
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.cli import main
+from quick_rename.defaults import quick_rename_prefs
+
+
+def run(count: int, chunk_size: int) -> None:
+    """Rename count files through a manifest and print a report."""
+    with TemporaryDirectory() as tmp:
+        quick_rename_prefs.JOURNAL_DIR = join(tmp, "journal")
+        quick_rename_prefs.HISTORY_DIR = join(tmp, "history")
+        directory = join(tmp, "shots")
+        os.makedirs(directory)
+        manifest = join(tmp, "manifest.csv")
+        with open(manifest, "w") as stream:
+            stream.write("old,new\n")
+            for i in range(count):
+                name = f"shot_{i:07d}.exr"
+                open(join(directory, name), "w").close()
+                if i % 1000 == 1:
+                    # Swap with the previous file, both rows fall in the same chunk.
+                    stream.write(f"{name},shot_{i - 1:07d}.exr\nshot_{i - 1:07d}.exr,{name}\n")
+                elif i % 1000:
+                    stream.write(f"{name},plate_{i:07d}.exr\n")
+        main(argv=[directory, "--manifest", manifest, "--chunk-size", str(chunk_size), "--results", os.devnull])
+    print(f"peak memory {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 100000, chunk_size=int(argv[2]) if len(argv) > 2 else 10000)
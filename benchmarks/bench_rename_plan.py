@@ -0,0 +1,30 @@
+"""Time naming files with a compiled RenamePlan.
+
+Usage:
+    python -m benchmarks.bench_rename_plan [names]
+
+Names 1M synthetic files by default with every option enabled.
+"""
+from sys import argv
+from time import perf_counter
+
+from quick_rename.models.rename_plan import RenamePlan, compile_plan, plan_names
+
+
+def run(count: int) -> None:
+    """Time compiling and applying a plan to count names and print a report."""
+    names = [f"shot{i % 97:03d}_comp_v001.{i:07d}.exr" for i in range(count)]
+    plan = RenamePlan(new_ext=".tif", find="comp", replace="bg", prefix="v2_", renumber=True, padding=7)
+    start = perf_counter()
+    compile_plan.cache_clear()
+    compile_plan(plan)
+    compiled = perf_counter() - start
+    start = perf_counter()
+    new_names = plan_names(plan=plan, names=names, start=1)
+    elapsed = perf_counter() - start
+    print(f"{count} names: compile {compiled * 1e6:.1f} us, naming {elapsed * 1000:.1f} ms "
+          f"({count / elapsed:,.0f} names/sec), e.g. {names[0]} -> {new_names[0]}")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 1000000)
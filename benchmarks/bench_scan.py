@@ -0,0 +1,83 @@
+"""Compare the listdir + isfile directory scan against the scandir based scanner.
+
+Usage:
+    python -m benchmarks.bench_scan [entries] [directory]
+
+When no directory is given a temporary one is populated with the requested number of empty files. Results are reported
+per 10k entries. Stat calls are counted at the Python level by wrapping os.stat, which is what os.path.isfile uses.
+"""
+import os
+from sys import argv
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.models.model import PreProcessed
+from quick_rename.models.scanner import scan_directory
+
+PER = 10000
+
+
+class StatCounter(object):
+    """Context manager counting calls made to os.stat."""
+
+    def __init__(self):
+        self.calls = 0
+        self._stat = os.stat
+
+    def __enter__(self):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return self._stat(*args, **kwargs)
+        os.stat = counted
+        return self
+
+    def __exit__(self, *exc):
+        os.stat = self._stat
+
+
+def listdir_scan(directory: str) -> PreProcessed:
+    """Previous QuickRenameController.collect_folder_items behaviour."""
+    pre = PreProcessed()
+    dir_list = os.listdir(directory)
+    dir_list.sort()
+    for cur_file in dir_list:
+        pre.add_item(item=cur_file, directory=directory)
+    return pre
+
+
+def scandir_scan(directory: str) -> PreProcessed:
+    """Current QuickRenameController.collect_folder_items behaviour."""
+    pre = PreProcessed()
+    pre.add_items(items=scan_directory(directory=directory))
+    return pre
+
+
+def populate(directory: str, entries: int) -> None:
+    """Create entries empty files in directory."""
+    for i in range(entries):
+        open(join(directory, f"render_{i:07d}.exr"), "w").close()
+
+
+def run(directory: str) -> None:
+    """Time both scanners against directory and print a report."""
+    entries = len(os.listdir(directory))
+    scale = PER / max(entries, 1)
+    print(f"{entries} entries in {directory}")
+    for label, func in (("listdir + isfile", listdir_scan), ("scandir", scandir_scan)):
+        with StatCounter() as counter:
+            start = perf_counter()
+            pre = func(directory)
+            elapsed = perf_counter() - start
+        print(f"{label:>18}: {elapsed * scale * 1000:8.2f} ms / 10k entries, "
+              f"{counter.calls * scale:8.0f} stat calls / 10k entries ({pre.count()} files)")
+
+
+if __name__ == "__main__":
+    count = int(argv[1]) if len(argv) > 1 else PER
+    if len(argv) > 2:
+        run(argv[2])
+    else:
+        with TemporaryDirectory() as tmp:
+            populate(tmp, count)
+            run(tmp)
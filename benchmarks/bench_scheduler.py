@@ -0,0 +1,46 @@
+"""Time scheduling and running an in place shift rename, shot_0000001.exr -> shot_0000002.exr and so on.
+
+Usage:
+    python -m benchmarks.bench_scheduler [files]
+
+Shifts 100k files by default. Files are created empty in a temporary directory, one swap per 1k files is added so cycles
+are exercised too.
+"""
+import os
+from sys import argv
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.models.preflight import find_conflicts
+from quick_rename.models.scheduler import flatten, schedule_renames
+
+
+def run(count: int) -> None:
+    """Time preflight, scheduling and renaming count files and print a report."""
+    names = [f"shot_{i:07d}.exr" for i in range(count)]
+    renames = [(names[i], f"shot_{i + 1:07d}.exr") for i in range(count)]
+    swaps = [(f"swap_{i}_a.exr", f"swap_{i}_b.exr") for i in range(count // 1000)]
+    renames += [pair for a, b in swaps for pair in ((a, b), (b, a))]
+    with TemporaryDirectory() as tmp:
+        for src, dest in renames:
+            open(join(tmp, src), "w").close()
+
+        start = perf_counter()
+        listing = set(os.listdir(tmp))
+        conflicts = find_conflicts(renames=renames, listing=listing)
+        checked = perf_counter() - start
+        start = perf_counter()
+        steps = flatten(schedule_renames(renames=renames, taken=listing))
+        scheduled = perf_counter() - start
+        start = perf_counter()
+        for src, dest in steps:
+            os.rename(join(tmp, src), join(tmp, dest))
+        renamed = perf_counter() - start
+        assert not conflicts and len(os.listdir(tmp)) == len(renames)
+    print(f"{len(renames)} renames, {len(steps) - len(renames)} temporary names: preflight {checked * 1000:.1f} ms, "
+          f"schedule {scheduled * 1000:.1f} ms, rename {renamed:.2f} s ({len(steps) / renamed:,.0f} renames/sec)")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 100000)
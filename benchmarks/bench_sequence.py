@@ -0,0 +1,49 @@
+"""Time detecting, repadding and shifting an image sequence over itself, shot.0001.exr -> shot.0002.exr and so on.
+
+Usage:
+    python -m benchmarks.bench_sequence [frames]
+
+Uses 100k frames by default, one frame in every 100 is left out so the sequence has gaps. Work is done on names only,
+see bench_scheduler for renaming on disk. Every step should grow linearly with the number of frames.
+"""
+from sys import argv
+from time import perf_counter
+
+from quick_rename.models.preflight import find_conflicts
+from quick_rename.models.rename_plan import RenamePlan, plan_names
+from quick_rename.models.scheduler import schedule_renames
+from quick_rename.models.sequence import detect_sequences, find_gaps
+
+
+def run(count: int) -> None:
+    """Time the sequence engine on count frames and print a report."""
+    names = [f"shot.{i:06d}.exr" for i in range(1, count + 1) if i % 100]
+    timings = []
+
+    start = perf_counter()
+    sequence = detect_sequences(names=names)[0]
+    timings.append(("detect", perf_counter() - start))
+    start = perf_counter()
+    gaps = find_gaps(frames=sequence.frames)
+    timings.append(("gaps", perf_counter() - start))
+    start = perf_counter()
+    plan_names(plan=RenamePlan(renumber=True, frame_offset=0, padding=7), names=names, start=1)
+    timings.append(("repad", perf_counter() - start))
+    start = perf_counter()
+    new_names = plan_names(plan=RenamePlan(renumber=True, frame_offset=1), names=names, start=1)
+    renames = list(zip(names, new_names))
+    timings.append(("offset", perf_counter() - start))
+    start = perf_counter()
+    conflicts = find_conflicts(renames=renames, listing=set(names))
+    timings.append(("preflight", perf_counter() - start))
+    start = perf_counter()
+    chains = schedule_renames(renames=renames, taken=names)
+    timings.append(("schedule", perf_counter() - start))
+
+    assert not conflicts
+    report = ", ".join(f"{label} {seconds * 1000:.1f} ms" for label, seconds in timings)
+    print(f"{len(names)} frames, {sequence.missing} missing in {len(gaps)} gaps, {len(chains)} chains: {report}")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 100000)
@@ -0,0 +1,54 @@
+"""Time undoing a renumber from the rename history.
+
+Usage:
+    python -m benchmarks.bench_undo [files]
+
+Renumbers 100k empty files by default in a temporary directory, shifting every number by one, then undoes the batch the
+way QuickRenameController.undo_rename does: preflight, schedule, journal and rename.
+"""
+import os
+from sys import argv
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from os.path import join
+
+from quick_rename.models.batch import run_batch
+from quick_rename.models.history import list_history, read_inverse, record_batch
+from quick_rename.models.journal import scan_inodes
+from quick_rename.models.preflight import find_conflicts
+
+
+def preflight_and_run(directory: str, journal_dir: str, renames: list) -> None:
+    """Preflight, schedule, journal and run a batch of renames."""
+    listing = dict(scan_inodes(directory=directory))
+    assert not find_conflicts(renames=renames, listing=listing)
+    run_batch(directory=directory, renames=renames, listing=listing, journal_dir=journal_dir)
+
+
+def run(count: int) -> None:
+    """Time renumbering count files, recording the batch and undoing it, then print a report."""
+    with TemporaryDirectory() as tmp:
+        directory = join(tmp, "shots")
+        os.mkdir(directory)
+        names = [f"shot_{i:07d}.exr" for i in range(count)]
+        for name in names:
+            open(join(directory, name), "w").close()
+        renames = [(name, f"shot_{i + 1:07d}.exr") for i, name in enumerate(names)]
+
+        start = perf_counter()
+        preflight_and_run(directory=directory, journal_dir=tmp, renames=renames)
+        renamed = perf_counter() - start
+        start = perf_counter()
+        record_batch(history_dir=join(tmp, "history"), name="batch", directory=directory, renames=renames,
+                     max_bytes=1 << 30)
+        recorded = perf_counter() - start
+        start = perf_counter()
+        entry, = list_history(history_dir=join(tmp, "history"), directory=directory)
+        preflight_and_run(directory=directory, journal_dir=tmp, renames=read_inverse(entry=entry))
+        undone = perf_counter() - start
+        assert sorted(os.listdir(directory)) == names
+    print(f"{count} files: rename {renamed:.2f} s, record history {recorded * 1000:.1f} ms, undo {undone:.2f} s")
+
+
+if __name__ == "__main__":
+    run(count=int(argv[1]) if len(argv) > 1 else 100000)
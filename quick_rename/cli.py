@@ -0,0 +1,320 @@
+"""Rename files from the command line, without Qt.
+
+Usage:
+    python -m quick_rename [options] directory [files ...]
+
+    python -m quick_rename directory --manifest manifest.csv [--results results.jsonl]
+
+Offers the options of the RenameOptionsView on top of the engine in models. Renamed files are written to stdout as
+'old name<TAB>new name' lines and errors to stderr, the exit status is 0 on success and 1 when nothing was renamed
+because of an error.
+
+Manifests are streamed in chunks so memory use does not grow with the manifest, see run_manifest.
+"""
+import json
+import sys
+from collections import Counter
+from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
+from os.path import abspath, isdir, join
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+from .defaults import cli_prefs
+from .defaults import quick_rename_prefs as prefs
+from .models.history import record_batch
+from .models.journal import has_pending, read_journal, scan_inodes
+from .models.manifest import (CSV, FAILED, JSONL, PLANNED, RENAMED, UNCHANGED, apply_renames, check_chunk,
+                              interrupted_statuses, iter_chunks, manifest_format, read_manifest)
+from .models.preflight import find_conflicts
+from .models.rename_plan import RenamePlan, plan_names
+from .models.scanner import scan_directory
+
+
+def build_parser() -> ArgumentParser:
+    """Return the parser of the command line options."""
+    parser = ArgumentParser(prog=cli_prefs.PROG, description=cli_prefs.DESCRIPTION, epilog=cli_prefs.EPILOG,
+                            formatter_class=RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help=cli_prefs.DIRECTORY_HELP)
+    parser.add_argument("files", nargs="*", help=cli_prefs.FILES_HELP)
+    parser.add_argument("--prefix", help=cli_prefs.PREFIX_HELP)
+    parser.add_argument("--name", help=cli_prefs.NAME_HELP)
+    parser.add_argument("--find", help=cli_prefs.FIND_HELP)
+    parser.add_argument("--replace", default="", help=cli_prefs.REPLACE_HELP)
+    parser.add_argument("--renumber", action="store_true", help=cli_prefs.RENUMBER_HELP)
+    parser.add_argument("--start", type=int, default=1, help=cli_prefs.START_HELP)
+    parser.add_argument("--padding", type=int, default=0, choices=range(10), metavar="{0-9}",
+                        help=cli_prefs.PADDING_HELP)
+    parser.add_argument("--no-dot", action="store_true", help=cli_prefs.NO_DOT_HELP)
+    parser.add_argument("--keep-frames", action="store_true", help=cli_prefs.KEEP_FRAMES_HELP)
+    parser.add_argument("--frame-offset", type=int, help=cli_prefs.FRAME_OFFSET_HELP)
+    ext = parser.add_mutually_exclusive_group()
+    ext.add_argument("--ext", help=cli_prefs.EXT_HELP)
+    ext.add_argument("--remove-ext", action="store_true", help=cli_prefs.REMOVE_EXT_HELP)
+    parser.add_argument("--backup", action="store_true", help=cli_prefs.BACKUP_HELP)
+    parser.add_argument("--deduplicate", action="store_true", help=cli_prefs.DEDUPLICATE_HELP)
+    parser.add_argument("--workers", type=int, default=1, help=cli_prefs.WORKERS_HELP)
+    parser.add_argument("-n", "--dry-run", action="store_true", help=cli_prefs.DRY_RUN_HELP)
+    parser.add_argument("--manifest", help=cli_prefs.MANIFEST_HELP)
+    parser.add_argument("--format", choices=(CSV, JSONL), help=cli_prefs.FORMAT_HELP)
+    parser.add_argument("--chunk-size", type=int, default=cli_prefs.MANIFEST_CHUNK_SIZE, help=cli_prefs.CHUNK_SIZE_HELP)
+    parser.add_argument("--results", help=cli_prefs.RESULTS_HELP)
+    return parser
+
+
+def get_plan(args: Namespace) -> RenamePlan:
+    """Capture the rename options from parsed command line options.
+
+    Args:
+        args: Options parsed by build_parser.
+    """
+    new_ext = args.ext
+    if new_ext is not None and not new_ext.startswith("."):
+        new_ext = f".{new_ext}"
+    keep_frames = args.keep_frames or args.frame_offset is not None
+    return RenamePlan(remove_ext=args.remove_ext,
+                      new_ext=new_ext,
+                      new_name=args.name,
+                      find=args.find or None,
+                      replace=args.replace,
+                      prefix=args.prefix or None,
+                      renumber=args.renumber or keep_frames,
+                      dot="" if args.no_dot else ".",
+                      padding=args.padding,
+                      frame_offset=(args.frame_offset or 0) if keep_frames else None)
+
+
+def read_names(files: Sequence[str], directory: str, stdin: TextIO) -> List[str]:
+    """Return the names of the files to rename, in renumbering order.
+
+    Args:
+        files: Names given on the command line, - reads one name per line from stdin.
+        directory: Folder holding the files, every file in it sorted by name is used when files is empty.
+        stdin: Stream names are read from.
+    """
+    if not files:
+        return [x.name for x in scan_directory(directory=directory)]
+    names = []
+    for name in files:
+        if name == "-":
+            names.extend(line.rstrip("\r\n") for line in stdin if line.strip())
+        else:
+            names.append(name)
+    return names
+
+
+def run_batch(directory: str, renames: List[Tuple[str, str]], listing: Dict[str, int], backup: bool = False,
+              deduplicate: bool = False, workers: int = 1) -> str:
+    """Journal then run a batch of renames which passed find_conflicts, see models.batch.run_batch.
+
+    Args:
+        directory: Folder holding the files.
+        renames: (current name, new name) pairs of the batch.
+        listing: Inodes of the entries in the directory keyed by name.
+        backup: Copy the files to the backup folder first.
+        deduplicate: Keep the backups in the deduplicated backup store.
+        workers: Files renamed and backed up at the same time.
+
+    Raises:
+        OSError: If the files could not be backed up, journaled or renamed.
+
+    Returns:
+        Name identifying the batch.
+    """
+    # Imported here so previews and --help start without loading the thread pool and backup modules.
+    from .models import batch
+
+    backup_root = join(directory, prefs.BACKUP_DIR) if backup else None
+    store_root = join(backup_root, prefs.BACKUP_STORE_DIR) if backup and deduplicate else None
+    try:
+        return batch.run_batch(directory=directory, renames=renames, listing=listing, journal_dir=prefs.JOURNAL_DIR,
+                               backup_root=backup_root, store_root=store_root, workers=max(workers, 1))
+    except batch.NoSpaceError as err:
+        raise OSError(prefs.BACKUP_SPACE_MSG.format(directory)) from err
+
+
+def failed_statuses(err: OSError, renames: List[Tuple[str, str]], listing: Dict[str, int]) -> List[str]:
+    """Return RENAMED or FAILED for every rename of a chunk whose batch raised err.
+
+    Note:
+        Only a batch which stopped part way renamed any file, found from the journal it left behind. Every rename
+        failed when the journal can not be read.
+
+    Args:
+        err: Error raised by run_batch.
+        renames: (old name, new name) pairs of the batch.
+        listing: Inodes of the entries in the directory keyed by name, from before the batch ran.
+    """
+    from .models.batch import BatchInterrupted
+
+    if isinstance(err, BatchInterrupted):
+        try:
+            return interrupted_statuses(journal=read_journal(path=err.journal), renames=renames, listing=listing)
+        except OSError:
+            pass
+    return [FAILED] * len(renames)
+
+
+def record_history(directory: str, batch: str, renames: List[Tuple[str, str]], stderr: TextIO) -> None:
+    """Record a finished batch so it can be undone from QuickRename, a failure is only reported.
+
+    Args:
+        directory: Folder holding the files.
+        batch: Name identifying the batch, as returned by run_batch.
+        renames: (previous name, new name) pairs of the batch.
+        stderr: Stream errors are written to.
+    """
+    try:
+        record_batch(history_dir=prefs.HISTORY_DIR, name=batch, directory=directory, renames=renames,
+                     max_bytes=prefs.HISTORY_MAX_BYTES)
+    except OSError as err:
+        print(cli_prefs.ERROR.format(prefs.HISTORY_FAILED_MSG.format(prefs.HISTORY_DIR, err)), file=stderr)
+
+
+def run_manifest(args: Namespace, directory: str, stdin: TextIO, stdout: TextIO, stderr: TextIO) -> int:
+    """Rename files following a manifest, chunk by chunk, and write the result of every row as JSONL.
+
+    Note:
+        Only one chunk of rows is held at a time. Every chunk is checked against the directory listing, updated as
+        chunks are renamed, then journaled and renamed as a batch of its own, which can be undone from the gui. Renaming
+        stops at the first chunk which fails, the rows it renamed are found from its journal, see failed_statuses.
+
+    Args:
+        args: Options parsed by build_parser.
+        directory: Folder holding the files.
+        stdin: Stream the manifest is read from when --manifest is -.
+        stdout: Stream results are written to when --results is not given.
+        stderr: Stream errors and the throughput are written to.
+
+    Returns:
+        Exit status, 1 if any row was not renamed.
+    """
+    if args.files:
+        print(cli_prefs.ERROR.format(cli_prefs.MANIFEST_FILES_MSG), file=stderr)
+        return 1
+    manifest = results = None
+    try:
+        listing = dict(scan_inodes(directory=directory))
+        if not args.dry_run and has_pending(journal_dir=prefs.JOURNAL_DIR, directory=directory):
+            print(cli_prefs.ERROR.format(cli_prefs.PENDING_MSG.format(directory)), file=stderr)
+            return 1
+        manifest = stdin if args.manifest == "-" else open(args.manifest, newline="", encoding="utf-8")
+        results = stdout if args.results is None else open(args.results, "w", encoding="utf-8")
+    except OSError as err:
+        if manifest not in (None, stdin):
+            manifest.close()
+        print(cli_prefs.ERROR.format(err), file=stderr)
+        return 1
+
+    renamed = rejected = row = 0
+    error = None
+    start = perf_counter()
+    try:
+        rows = read_manifest(stream=manifest, fmt=args.format or manifest_format(path=args.manifest))
+        for chunk in iter_chunks(rows=rows, size=max(args.chunk_size, 1)):
+            renames, statuses = check_chunk(rows=chunk, listing=listing)
+            outcomes = [PLANNED if args.dry_run else RENAMED] * len(renames)
+            if renames and not args.dry_run:
+                try:
+                    batch = run_batch(directory=directory, renames=renames, listing=listing,
+                                      backup=args.backup or args.deduplicate, deduplicate=args.deduplicate,
+                                      workers=args.workers)
+                except OSError as err:
+                    error = str(err)
+                    outcomes = failed_statuses(err=err, renames=renames, listing=listing)
+                else:
+                    record_history(directory=directory, batch=batch, renames=renames, stderr=stderr)
+            done = [x for x, outcome in zip(renames, outcomes) if outcome != FAILED]
+            apply_renames(renames=done, listing=listing)
+            renamed += len(done)
+
+            lines = []
+            # Renames were accepted in row order, every row without a status of its own is one of them.
+            outcomes = iter(outcomes)
+            for i, pair in enumerate(chunk):
+                old, new = (None, None) if pair is None else pair
+                status = statuses[i] if i in statuses else next(outcomes)
+                result = {"row": row + i, "old": old, "new": new, "status": status}
+                if result["status"] == FAILED:
+                    result["error"] = error
+                elif result["status"] not in (RENAMED, PLANNED, UNCHANGED):
+                    rejected += 1
+                lines.append(json.dumps(result) + "\n")
+            results.writelines(lines)
+            row += len(chunk)
+            if error is not None:
+                break
+    finally:
+        if manifest is not stdin:
+            manifest.close()
+        if results is not stdout:
+            results.close()
+
+    seconds = perf_counter() - start
+    print(cli_prefs.MANIFEST_SUMMARY.format(renamed, rejected, seconds, renamed / seconds if seconds else 0),
+          file=stderr)
+    if error is not None:
+        print(cli_prefs.ERROR.format(error), file=stderr)
+    return 1 if rejected or error is not None else 0
+
+
+def main(argv: Optional[Sequence[str]] = None, stdin: Optional[TextIO] = None, stdout: Optional[TextIO] = None,
+         stderr: Optional[TextIO] = None) -> int:
+    """Rename files following the command line options and return the exit status.
+
+    Args:
+        argv: Command line options, sys.argv when None.
+        stdin: Stream file names are read from, sys.stdin when None.
+        stdout: Stream renamed files are written to, sys.stdout when None.
+        stderr: Stream errors are written to, sys.stderr when None.
+    """
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    stderr = sys.stderr if stderr is None else stderr
+    args = build_parser().parse_args(argv)
+
+    def fail(message: str) -> int:
+        print(cli_prefs.ERROR.format(message), file=stderr)
+        return 1
+
+    directory = abspath(args.directory)
+    if not isdir(directory):
+        return fail(cli_prefs.NOT_A_DIRECTORY_MSG.format(directory))
+    if args.manifest is not None:
+        return run_manifest(args=args, directory=directory, stdin=stdin, stdout=stdout, stderr=stderr)
+    try:
+        names = read_names(files=args.files, directory=directory, stdin=stdin)
+        listing = dict(scan_inodes(directory=directory))
+    except OSError as err:
+        return fail(str(err))
+    if not names:
+        return fail(cli_prefs.NO_FILES_MSG)
+    # A file can only be renamed once, as for manifest rows.
+    duplicates = [name for name, count in Counter(names).items() if count > 1]
+    if duplicates:
+        return fail(cli_prefs.DUPLICATE_FILES_MSG.format(len(duplicates), duplicates[0]))
+    missing = [x for x in names if x not in listing]
+    if missing:
+        return fail(cli_prefs.MISSING_FILES_MSG.format(len(missing), missing[0]))
+
+    plan = get_plan(args=args)
+    if plan.new_name is not None and not plan.renumber and len(names) > 1:
+        return fail(cli_prefs.RENUMBER_MSG)
+    renames = [(name, dest) for name, dest in zip(names, plan_names(plan=plan, names=names, start=args.start))
+               if name != dest]
+    conflicts = find_conflicts(renames=renames, listing=listing)
+    if conflicts:
+        return fail(cli_prefs.CONFLICTS_MSG.format(len(conflicts), renames[conflicts[0]][1]))
+
+    if renames and not args.dry_run:
+        if has_pending(journal_dir=prefs.JOURNAL_DIR, directory=directory):
+            return fail(cli_prefs.PENDING_MSG.format(directory))
+        try:
+            batch = run_batch(directory=directory, renames=renames, listing=listing,
+                              backup=args.backup or args.deduplicate, deduplicate=args.deduplicate,
+                              workers=args.workers)
+        except OSError as err:
+            return fail(str(err))
+        record_history(directory=directory, batch=batch, renames=renames, stderr=stderr)
+
+    stdout.writelines(f"{name}\t{dest}\n" for name, dest in renames)
+    return 0
@@ -1,48 +1,55 @@
-from typing import List
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from views.file_list_view import FileListView
 from defaults import file_list_prefs as prefs
 
 
 class FileListController(object):
-    """Responsible for managing interactions with FileListView."""
-    def __init__(self):
-        self._view = FileListView(controller=self)
+    """Responsible for managing interactions with FileListView.
+
+    Note:
+        Files are referred to by their row in PreProcessed.data.
+    """
+    def __init__(self, source: object):
+        """Instantiation of FileListController.
+
+        Args:
+            source: PreProcessed holding the items shown in the view.
+        """
+        self._view = FileListView(controller=self, source=source)
 
     @property
     def view(self) -> object:
         """View associated with FileListController"""
         return self._view
 
-    def add_item(self, row: int, col: int, view: object) -> None:
-        """Add an FileItemView to the FileListView."""
-        self._view.set_item(row=row, col=col, item=view)
-
-    def all_items(self) -> List[object]:
-        """Return all file items from the file list column (first column)."""
-        items = []
-        for item in self._view.all_items():
-            items.append(item)
-        return items
+    def add_rows(self, start: int, stop: int, shown: Optional[Sequence[bool]] = None) -> None:
+        """Append PreProcessed rows to the end of the FileListView, hiding rows whose shown value is False."""
+        self._view.append_rows(start=start, stop=stop, shown=shown)
 
     def clear(self) -> None:
         """Clear view."""
         self._view.clear()
 
+    def clear_invalid(self) -> None:
+        """Remove invalid highlighting from all files."""
+        self._view.clear_invalid()
+
     def clear_preview_column(self) -> None:
         """Clear items in the preview column."""
         self._view.clear_preview()
 
-    def get_checked_files(self) -> List[object]:
-        """Return all checked files for renaming."""
-        checked_items = []
-        for item in self._view.get_checked_rows():
-            checked_items.append(item)
-        return checked_items
+    def get_checked_files(self) -> List[int]:
+        """Return the PreProcessed rows of all checked files for renaming, in display order."""
+        return self._view.get_checked_rows()
 
     def get_checked_files_count(self) -> int:
         """Return the number of items that are checked for rename."""
-        return len(list(self._view.get_checked_rows()))
+        return len(self._view.get_checked_rows())
+
+    def remap(self, remap: Sequence[int]) -> None:
+        """Follow rows being reordered or removed in PreProcessed."""
+        self._view.remap(remap=remap)
 
     def set_disabled(self) -> None:
         """Disable View."""
@@ -52,14 +59,26 @@ class FileListController(object):
         """Enable View."""
         self._view.set_enable()
 
+    def set_groups(self, groups: Optional[Dict[int, Tuple[str, Sequence[int], Optional[str]]]]) -> None:
+        """Collapse groups of PreProcessed rows into a single row keyed by their first row, None to expand them."""
+        self._view.set_groups(groups=groups)
+
     def set_header_labels(self) -> None:
         """Set header labels in view."""
         self._view.set_header_labels(labels=prefs.HEADERS)
 
-    def set_row_count(self, rows: int) -> None:
-        """Set number of rows in view.
+    def set_invalid(self, rows: Iterable[int]) -> None:
+        """Highlight PreProcessed rows as invalid."""
+        self._view.set_invalid(rows=rows)
 
-        Args:
-            rows: Number of rows in view.
-        """
-        self._view.set_row_count(rows=rows)
+    def set_preview(self, func: Callable[[str, int], str], start: int, names: Optional[Dict[int, str]] = None) -> None:
+        """Show preview names computed by func, names holds any already computed keyed by PreProcessed row."""
+        self._view.set_preview(func=func, start=start, names=names)
+
+    def set_visible(self, rows: Optional[Iterable[int]]) -> None:
+        """Show only the given PreProcessed rows in the FileListView, all rows are shown when rows is None."""
+        self._view.set_visible(rows=rows)
+
+    def sort(self) -> None:
+        """Order the FileListView as PreProcessed is ordered."""
+        self._view.sort_items()
@@ -1,10 +1,5 @@
-from os.path import join, isdir
-from os import makedirs
-from datetime import datetime
-
 from views.folder_picker_view import FolderPickerView
 from widgets.custom_widgets import FileDirectoryDialog
-from defaults.quick_rename_prefs import BACKUP_DIR
 
 
 class FolderPickerController(object):
@@ -35,16 +30,3 @@ class FolderPickerController(object):
     def get_dir_set(self) -> bool:
         """Return if the base dir has been set."""
         return self._view.get_base_dir_set()
-
-    def get_backup_dir(self) -> str:
-        """Format and Return location where backup are stored for rename.
-
-        Note:
-            If the folder does not exist, it will be created.
-        """
-        date = datetime.now()
-        date_folder = f"{date.year}_{date.month}_{date.day}_{date.minute}{date.second}"
-        directory = join(self.base_dir(), BACKUP_DIR, date_folder)
-        if not isdir(directory):
-            makedirs(directory)
-        return directory
@@ -1,4 +1,7 @@
+from typing import FrozenSet, Optional
+
 from views.limit_options_view import LimitOptionsView
+from models.model import parse_extensions
 from defaults import limit_options_prefs as prefs
 
 
@@ -43,10 +46,19 @@ class LimitOptionsController(object):
         else:
             self._view.set_search_style(style=prefs.COLOR_VALID)
 
-    def get_extension(self) -> str:
-        """Return formatted extension from self._view.limit_type"""
-        ext = self._view.get_limit_type()
-        return f".{ext}" if ext else None
+    def get_extension(self) -> Optional[FrozenSet[str]]:
+        """Return formatted extensions from self._view.limit_type.
+
+        Note:
+            Several extensions can be given separated by commas or spaces, for example "exr,tif,png". Extensions are
+            lower cased so they can be matched case insensitively.
+        """
+        exts = parse_extensions(value=self._view.get_limit_type())
+        return exts if exts else None
+
+    def collapse(self) -> bool:
+        """Return if self.view's collapse sequences is checked."""
+        return self._view.get_do_collapse()
 
     @staticmethod
     def is_default_file_type(value: str) -> bool:
@@ -70,6 +82,10 @@ class LimitOptionsController(object):
         """Return if the self.view's  search is checked."""
         return self._view.get_do_search()
 
+    def search_mode(self) -> str:
+        """Return how self.view's search is matched, see models.filters.MODES."""
+        return self._view.get_search_mode()
+
     def search_for(self) -> str:
         """Return the value self.view's search is set to."""
         return self._view.get_search()
@@ -0,0 +1,57 @@
+from typing import Callable, Optional
+
+from PySide2.QtCore import QTimer
+
+from defaults import quick_rename_prefs as prefs
+
+
+class PreviewScheduler(object):
+    """Coalesces bursts of preview requests into a single preview.
+
+    Note:
+        Every request restarts a short single shot timer, so signals fired together (or keystrokes typed quickly) only
+        run the preview once, after the burst ends.
+
+    Attributes:
+        requested (int): Number of previews requested.
+        executed (int): Number of previews actually run.
+    """
+    def __init__(self, callback: Callable[[], object], delay: int = prefs.PREVIEW_DELAY_MS,
+                 cancel: Optional[Callable[[], object]] = None):
+        """Initialization of PreviewScheduler.
+
+        Args:
+            callback: Function running the preview.
+            delay: Milliseconds to wait for further requests before running the preview.
+            cancel: Called on every request, abandons a preview which is still being computed.
+        """
+        self._callback = callback
+        self._cancel = cancel
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._execute)
+        self.requested = 0
+        self.executed = 0
+
+    def flush(self) -> None:
+        """Run a pending preview now."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._execute()
+
+    def pending(self) -> bool:
+        """Return if a preview is waiting to run."""
+        return self._timer.isActive()
+
+    def request(self, *args) -> None:
+        """Ask for a preview, signal arguments are ignored."""
+        self.requested += 1
+        if self._cancel is not None:
+            self._cancel()
+        self._timer.start()
+
+    def _execute(self) -> None:
+        """Run the preview."""
+        self.executed += 1
+        self._callback()
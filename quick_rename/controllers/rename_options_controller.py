@@ -1,8 +1,7 @@
 from typing import Union
 
-from os.path import splitext
-
 from views.rename_options_view import RenameOptionsView
+from models.rename_plan import RenamePlan, compile_plan
 from defaults import rename_options_prefs as prefs
 
 
@@ -27,6 +26,7 @@ class RenameOptionsController(object):
         self._view.find.editingFinished.connect(self.check_search_and_replace_name)
         self._view.replace.editingFinished.connect(self.check_search_and_replace_name)
         self._view.renumber_cb.clicked.connect(self.toggle_renumber)
+        self._view.keep_frames_cb.clicked.connect(self.toggle_renumber)
         self._view.change_ext_cb.clicked.connect(self.toggle_change_ext)
 
     def add_prefix(self) -> bool:
@@ -80,43 +80,23 @@ class RenameOptionsController(object):
     def configure_name(self, item_name: str, pad_number: int) -> Union[str, None]:
         """Configure name of item based on settings.
 
+        Note:
+            This reads every option from the view, use get_plan and compile_plan when naming many items.
+
         Args:
             item_name: the item to rename
             pad_number: padding
         """
-        parts = splitext(item_name)
-        item_name = parts[0]
-        if self._view.get_remove_ext():
-            ext = ""
-        elif not self._view.get_do_change_ext():
-            ext = parts[-1]
-        else:
-            ext = self._view.get_new_ext()
-
-        if self._view.get_do_rename():
-            item_name = self._view.get_new_name()
-        # Search and Replace if the user is not doing a full name. This options comes second to a full rename.
-        elif self._view.get_do_search():
-            search_for = self._view.get_find()
-            if search_for in item_name:
-                item_name = item_name.replace(search_for, self._view.get_replace())
-        if self._view.get_add_prefix():
-            item_name = f"{self._view.get_prefix()}{item_name}"
-        if self._view.get_do_renumber():
-            dot = self._view.get_dot()
-            if self._view.get_do_padding():
-                padding_ = self.apply_padding(num=pad_number, pad=self._view.get_padding())
-                new_name = f"{item_name}{dot}{padding_}{ext}"
-            else:
-                new_name = f"{item_name}{dot}{pad_number}{ext}"
-        else:
-            new_name = f"{item_name}{ext}"
-        return new_name
+        return compile_plan(self.get_plan())(item_name, pad_number)
 
     def do_backup(self) -> bool:
         """Return if end user wants to backup files."""
         return self._view.get_do_backup()
 
+    def do_deduplicate(self) -> bool:
+        """Return if end user wants backups kept in the deduplicated backup store."""
+        return self.do_backup() and self._view.get_do_deduplicate()
+
     def do_preview(self) -> bool:
         """Return if the end user wants to preview changes."""
         return self._view.get_do_preview()
@@ -129,6 +109,22 @@ class RenameOptionsController(object):
         """Return if the end user wants to renumber."""
         return self._view.get_do_renumber()
 
+    def get_plan(self) -> RenamePlan:
+        """Capture the current rename options from the view."""
+        view = self._view
+        do_search = view.get_do_search()
+        padding = min(max(view.get_padding(), prefs.MIN_PADDING), prefs.MAX_PADDING) if view.get_do_padding() else 0
+        return RenamePlan(remove_ext=view.get_remove_ext(),
+                          new_ext=view.get_new_ext() if view.get_do_change_ext() else None,
+                          new_name=view.get_new_name() if view.get_do_rename() else None,
+                          find=view.get_find() if do_search else None,
+                          replace=view.get_replace() if do_search else "",
+                          prefix=view.get_prefix() if view.get_add_prefix() else None,
+                          renumber=view.get_do_renumber(),
+                          dot=view.get_dot(),
+                          padding=padding,
+                          frame_offset=view.get_frame_offset() if view.get_do_keep_frames() else None)
+
     def padding(self) -> int:
         """Return the current padding value."""
         return self._view.get_padding()
@@ -145,6 +141,10 @@ class RenameOptionsController(object):
         """Return start number from view."""
         return self._view.get_start_num()
 
+    def workers(self) -> int:
+        """Return how many files are renamed and backed up at the same time."""
+        return self._view.get_workers()
+
     def toggle_change_ext(self) -> None:
         """Toggle the change extension feature."""
         if self._view.get_change_ext():
@@ -171,12 +171,21 @@ class RenameOptionsController(object):
         """Toggle the renumber feature."""
         if self._view.get_do_renumber():
             self._view.enable_padding()
-            self._view.enable_start_num()
             self._view.enable_dot()
+            self._view.enable_keep_frames()
+            # Kept frame numbers are shifted by the frame offset, the start number only applies to numbering in order.
+            if self._view.get_do_keep_frames():
+                self._view.disable_start_num()
+                self._view.enable_frame_offset()
+            else:
+                self._view.enable_start_num()
+                self._view.disable_frame_offset()
         else:
             self._view.disable_padding()
             self._view.disable_start_num()
             self._view.disable_dot()
+            self._view.disable_keep_frames()
+            self._view.disable_frame_offset()
 
     def toggle_search_and_replace(self) -> None:
         """Toggle the search and replace feature."""
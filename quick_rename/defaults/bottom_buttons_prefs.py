@@ -1,3 +1,5 @@
 PREVIEW = "preview"
 PREVIEW_TOOLTIP = "When pressed show a preview of what the end result of the renaming will look like"
 RENAME = "rename"
+UNDO = "undo"
+UNDO_TOOLTIP = "Undo the last rename made in the selected folder"
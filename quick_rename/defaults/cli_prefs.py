@@ -0,0 +1,48 @@
+PROG = "python -m quick_rename"
+DESCRIPTION = ("Rename files without opening the QuickRename window.\n"
+               "Every renamed file is written to stdout as 'old name<TAB>new name'.")
+EPILOG = ("Examples:\n"
+          "  python -m quick_rename /shots --name plate --renumber --padding 4\n"
+          "  ls /shots | grep exr | python -m quick_rename /shots - --keep-frames --frame-offset 100 --dry-run\n"
+          "  python -m quick_rename /shots --manifest renames.csv --results results.jsonl")
+
+DIRECTORY_HELP = "Folder holding the files to rename."
+FILES_HELP = ("Names of the files to rename, in renumbering order. Use - to read one name per line from stdin. "
+              "Every file in the folder, sorted by name, when left out.")
+PREFIX_HELP = "Add a prefix to the files being renamed."
+NAME_HELP = "Completely rename the files, use with --renumber when renaming more than one file."
+FIND_HELP = "Search for this text in the names and replace it with --replace."
+REPLACE_HELP = "Text replacing --find."
+RENUMBER_HELP = "Add a number to the names, in the order the files are given."
+START_HELP = "Number to start with when renumbering."
+PADDING_HELP = "Pad numbers to this many digits, 0 to not pad."
+NO_DOT_HELP = "Do not separate the number from the name with a dot."
+KEEP_FRAMES_HELP = "Keep the frame number of every file when renumbering instead of numbering them in order."
+FRAME_OFFSET_HELP = "Shift kept frame numbers by this many frames, implies --keep-frames."
+EXT_HELP = "Replace the extension of the files."
+REMOVE_EXT_HELP = "Remove the extension of the files."
+BACKUP_HELP = "Back up the files before renaming."
+DEDUPLICATE_HELP = "Keep a single copy of identical backed up files, implies --backup."
+WORKERS_HELP = "Rename and back up this many files at the same time, raise on network shares."
+DRY_RUN_HELP = "Print the new names without renaming anything."
+MANIFEST_HELP = ("Rename files following a CSV manifest of old,new rows, or a JSONL manifest of "
+                 "{\"old\": .., \"new\": ..} rows, instead of the rename options. Use - to read it from stdin. "
+                 "The result of every row is written as JSONL.")
+FORMAT_HELP = "Format of the manifest, read from its file name when left out, csv for stdin."
+CHUNK_SIZE_HELP = ("Manifest rows checked and renamed together. Swaps and cycles must fall within a chunk, memory use "
+                   "grows with the chunk size.")
+RESULTS_HELP = "File the manifest results are written to, stdout when left out."
+
+MANIFEST_CHUNK_SIZE = 10000
+
+ERROR = "quick_rename: {}"
+NOT_A_DIRECTORY_MSG = "{} is not a folder."
+NO_FILES_MSG = "No files to rename."
+DUPLICATE_FILES_MSG = "{} file name(s) given more than once, first: {}"
+MISSING_FILES_MSG = "{} file(s) not found in the folder, first: {}"
+PENDING_MSG = ("A rename in {} is running or did not finish. "
+               "If it stopped, open QuickRename to resume or roll it back.")
+RENUMBER_MSG = "Use --renumber when completely renaming more than one file."
+MANIFEST_FILES_MSG = "File names can not be given with --manifest."
+MANIFEST_SUMMARY = "{} renamed, {} rejected in {:.2f} s ({:,.0f} files/sec)"
+CONFLICTS_MSG = "{} file(s) would be renamed to a name already taken in the folder or by another file, first: {}"
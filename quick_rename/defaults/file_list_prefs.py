@@ -1,4 +1,6 @@
 HEADERS = ("Original Files", "New Name - Preview")
 ITEM_ROWS = 1
 ITEM_COLS = 2
+# Preview of a collapsed image sequence, new names of its first and last frames.
+GROUP_PREVIEW = "{} .. {}"
 MIN_HEIGHT = 300
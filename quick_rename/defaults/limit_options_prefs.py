@@ -1,12 +1,19 @@
 COLOR_DISABLED = "color: gray"
 COLOR_INVALID = "color: #ab1128"
 COLOR_VALID = "color:black"
+COLLAPSE = "Collapse Sequences"
+COLLAPSE_TOOLTIP = ("When checked show image sequences as a single row, e.g. shot010_comp.####.exr [1-2400].\n"
+                    "Checking a sequence renames every frame.")
 LIMIT = "Limit File Type"
-LIMIT_TOOLTIP = "When checked only show parse type files"
+LIMIT_TOOLTIP = "When checked only show files of the given types.\nSeparate several types with commas, e.g. exr,tif,png"
 LIMIT_DEFAULT = "...file type"
 SEARCH = "Limit file text"
 SEARCH_TOOLTIP = "When checked only show matching files."
 SEARCH_DEFAULT = "...search str"
+SEARCH_MODE_TOOLTIP = ("How the search text is matched.\n"
+                       "substring: text appears anywhere in the name.\n"
+                       "glob: shell style wildcards, e.g. shot*_comp.*.exr\n"
+                       "regex: regular expression searched anywhere in the name.")
 TITLE = "FILE DISPLAY OPTIONS"
 
 ITEM_SPACING = (20, 5)
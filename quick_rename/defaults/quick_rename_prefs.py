@@ -1,3 +1,5 @@
+from os.path import expanduser, join
+
 INSTRUCTIONS = "CHECK ITEMS TO RENAME, DRAG AND DROP IN THE ORDER YOU WANT TO RENUMBER"
 INSTRUCTIONS_NAME = "instructions"
 INVALID_FOLDER = "Invalid Folder"
@@ -11,9 +13,62 @@ RENUMBER_MSG = "Please turn on Renumber when completely renaming more that one o
 RENAME_FILES = "Rename Files?"
 RENAME_FILES_MSG = "Are you sure you want to rename the selected files?"
 BACKUP_DIR = "quick_rename_backup"
+# Deduplicated backup store, inside BACKUP_DIR.
+BACKUP_STORE_DIR = "store"
 MISSING_FOLDER = "Missing Folder"
+SCAN_FAILED = "Unable To List Files"
+SCAN_FAILED_MSG = "Not every file in {} could be listed.\n{}"
+# Label of a collapsed image sequence with frames missing between its first and last frame.
+MISSING_FRAMES = "{} ({} missing)"
+# Tooltip of a collapsed image sequence listing its runs of missing frames, at most MISSING_FRAMES_RANGES of them.
+MISSING_FRAMES_TIP = "Missing frames: {}"
+MISSING_FRAMES_MORE = " and {} more ranges"
+MISSING_FRAMES_RANGES = 20
 BACKUP_DIR_NOT_FOUND = "backup directory not found {}. Stopping rename."
+BACKUP_FAILED = "Unable To Backup"
+BACKUP_SPACE_MSG = "There is not enough free space in {} to back up the selected files. Stopping rename."
 DUPLICATES = "Duplicate Items Found."
 DUPLICATES_MSG = "Duplicate items found in the rename!!!\nPlease fix any duplicate names are retry."
+CONFLICTS = "Existing Items Found."
+CONFLICTS_MSG = ("{} item(s) are no longer in the folder or would be renamed to a name already in the folder.\n"
+                 "Please refresh the folder or fix the highlighted names and retry.")
+
+RECOVER = "Interrupted Rename"
+RECOVER_MSG = "Renaming {} file(s) in {} did not finish.\nResume the rename or roll back the files already renamed?"
+RECOVER_FAILED = "Recovery Failed"
+RECOVER_CONFLICTS_MSG = ("{} file(s) in {} were removed, renamed or would be renamed over another file since the "
+                         "rename stopped, first: {}\nNothing was renamed.")
+PENDING_MSG = ("Renaming {} file(s) in {} did not finish, it must be resumed or rolled back before renaming there "
+               "again.\nResume the rename or roll back the files already renamed?")
+RUNNING_MSG = "A rename in {} is still running.\nWait for it to finish and retry."
+RESUME = "Resume"
+ROLLBACK = "Roll Back"
+IGNORE = "Ask Later"
+JOURNAL_FAILED = "Unable To Journal"
+JOURNAL_FAILED_MSG = "The rename could not be recorded in {}. Stopping rename.\n{}"
+RENAME_FAILED = "Rename Failed"
+RENAME_FAILED_MSG = "No file was renamed.\n{}"
+INTERRUPTED_MSG = ("Renaming files in {} stopped part way.\n{}\n"
+                   "Resume the rename or roll back the files already renamed?")
+UNDO = "Undo Rename"
+UNDO_MSG = "Undo renaming {} file(s) in {}?"
+UNDO_CONFLICTS_MSG = ("{} file(s) of the rename were removed, renamed or would be renamed over another file since.\n"
+                      "Nothing was renamed back.")
+CANCEL = "Cancel"
+NOTHING_TO_UNDO = "Nothing To Undo"
+NOTHING_TO_UNDO_MSG = "No rename made in this folder is left to undo."
+HISTORY_FAILED = "Unable To Record Undo"
+HISTORY_FAILED_MSG = "The rename finished but could not be recorded for undo in {}.\n{}"
+FORGET_FAILED_MSG = "The undo finished but could not be removed from the history in {}.\n{}"
 
 SPACING = 10, 30
+
+STATE_DIR = join(expanduser("~"), ".quick_rename")
+# Every batch is written here before renaming, so interrupted renames can be resumed or rolled back.
+JOURNAL_DIR = join(STATE_DIR, "journal")
+# Inverse of every completed batch, the oldest batches are evicted once the history grows past HISTORY_MAX_BYTES.
+HISTORY_DIR = join(STATE_DIR, "history")
+HISTORY_MAX_BYTES = 64 * 1024 ** 2
+
+SCAN_BATCH_SIZE = 1000
+PREVIEW_DELAY_MS = 50
@@ -9,6 +9,15 @@ COLOR_VALID = "color:black"
 COMPLETE_RENAME = "Complete Rename:"
 COMPLETE_RENAME_DEFAULT = "...new name"
 COMPLETE_RENAME_TOOLTIP = "When checked the selected items will be completely renamed."
+DEDUPLICATE = "Deduplicate Backups"
+DEDUPLICATE_TOOLTIP = ("Keep a single copy of identical backed up files.\n"
+                       "Backing up files which did not change since their last backup costs no space.")
+FRAME_OFFSET = "Frame Offset:"
+FRAME_OFFSET_TOOLTIP = "Shift every kept frame number by this many frames, negative values shift backwards."
+KEEP_FRAMES = "Keep Frame Numbers"
+KEEP_FRAMES_TOOLTIP = ("When checked files keep their frame number instead of being numbered in order.\n"
+                       "Padding re-pads the frame numbers, a padding of 0 keeps their current padding.\n"
+                       "Example: shot.0001.exr -> shot.00011.exr with a frame offset of 10 and a padding of 5.")
 OPTIONS = "OPTIONS"
 PADDING = "Padding:"
 PADDING_TOOLTIP = "Set the padding to apply to the renumbering."
@@ -28,6 +37,9 @@ SEARCH_AND_REPLACE_DEFAULT = "...search for"
 SEARCH_AND_REPLACE_TOOLTIP = "When Checked search for a string of text and replace with a new string."
 START_NUM = "Starting Number:"
 START_NUM_TOOLTIP = "Set the start number for the renaming utilize."
+WORKERS = "Parallel Renames:"
+WORKERS_TOOLTIP = ("Rename and back up this many files at the same time.\n"
+                   "Raise on network shares, where every rename waits on a round trip to the server.")
 USE_DOT = "Use Dot Numbering"
 USE_DOT_TOOLTIP = "Use a dot notation when numbering.\nExample: name.001.ext."
 
@@ -36,6 +48,12 @@ DOT_WIDTH = 200
 PADDING_MIN_WIDTH = 50
 START_NUM_MIN_WIDTH = 50
 START_NUM_DEFAULT = 1
+FRAME_OFFSET_MIN_WIDTH = 50
+FRAME_OFFSET_DEFAULT = 0
+FRAME_OFFSET_MAX = 999999999
+WORKERS_DEFAULT = 1
+WORKERS_MAX = 64
+WORKERS_MIN_WIDTH = 50
 REPLACE_WIDTH = 200
 FIND_WIDTH = 200
 NEW_NAME_WIDTH = 200
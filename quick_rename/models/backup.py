@@ -0,0 +1,260 @@
+import json
+import os
+from datetime import datetime
+from errno import EEXIST
+from os.path import abspath, dirname, exists, join
+from shutil import copy, copymode
+from sys import platform
+from tempfile import mkstemp
+from typing import Dict, Iterable, Optional
+
+try:
+    from fcntl import ioctl
+except ImportError:
+    ioctl = None
+
+# Backup strategies, cheapest first.
+LINK = "link"
+REFLINK = "reflink"
+COPY_RANGE = "copy_range"
+COPY = "copy"
+
+# Backup session folders sort in the order they were made.
+SESSION_FORMAT = "%Y%m%d_%H%M%S_%f"
+MANIFEST = "manifest.jsonl"
+MANIFEST_VERSION = 1
+
+# Linux ioctl sharing the extents of one file with another on copy on write file systems (btrfs, xfs).
+FICLONE = 0x40049409
+CAN_REFLINK = ioctl is not None and platform.startswith("linux")
+CAN_COPY_RANGE = hasattr(os, "copy_file_range")
+
+
+def backup_file(src: str, dest: str, link: bool = True) -> str:
+    """Back up a file using the cheapest strategy the file system allows.
+
+    Note:
+        A hard link costs no data, but shares the file with its backup, so changes made to the file in place later on
+        show in the backup too. Renaming does not change the file. Reflinks are copy on write and copy_file_range lets
+        the kernel copy, or clone, without the data passing through Python. A streaming copy is the last resort.
+
+    Args:
+        src: File to back up.
+        dest: Path of the backup, which must not exist.
+        link: Try a hard link first.
+
+    Returns:
+        Strategy used, one of LINK, REFLINK, COPY_RANGE or COPY.
+    """
+    if link:
+        try:
+            os.link(src, dest)
+            return LINK
+        except OSError as err:
+            # Other file systems, or file systems without hard links, fall through to a copy.
+            if err.errno == EEXIST:
+                raise
+    strategy = _clone(src=src, dest=dest)
+    if strategy is None:
+        copy(src, dest)
+        strategy = COPY
+    return strategy
+
+
+def link_device(root: str) -> Optional[int]:
+    """Return the device of a backup root if hard links work on it, tried once with a probe file.
+
+    Note:
+        File systems such as SMB shares refuse hard links, backups there are full copies.
+
+    Args:
+        root: Directory holding backups, created if missing.
+
+    Returns:
+        Device files on it can be hard linked from, None if hard links do not work.
+    """
+    os.makedirs(root, exist_ok=True)
+    fd, probe = mkstemp(dir=root, prefix=".link_probe")
+    os.close(fd)
+    try:
+        os.link(probe, probe + ".link")
+    except OSError:
+        return None
+    else:
+        os.remove(probe + ".link")
+    finally:
+        os.remove(probe)
+    return os.stat(root).st_dev
+
+
+def _nearest(path: str) -> str:
+    """Return path, or its closest parent which exists."""
+    path = abspath(path)
+    while not exists(path) and dirname(path) != path:
+        path = dirname(path)
+    return path
+
+
+def _dumps(record: list) -> str:
+    """Return a record as a compact manifest line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _clone(src: str, dest: str) -> Optional[str]:
+    """Copy a file in the kernel, returning the strategy used, None if neither reflink nor copy_file_range worked."""
+    if not (CAN_REFLINK or CAN_COPY_RANGE):
+        return None
+    strategy = None
+    with open(src, "rb") as source, open(dest, "xb") as target:
+        if CAN_REFLINK:
+            try:
+                ioctl(target.fileno(), FICLONE, source.fileno())
+                strategy = REFLINK
+            except OSError:
+                pass
+        if strategy is None and CAN_COPY_RANGE:
+            try:
+                remaining = os.fstat(source.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+                if not remaining:
+                    strategy = COPY_RANGE
+            except OSError:
+                pass
+    if strategy is None:
+        os.remove(dest)
+    else:
+        copymode(src, dest)
+    return strategy
+
+
+class BackupSession(object):
+    """Backup folder shared by every file of a rename batch.
+
+    Note:
+        The folder is named after the time the session opens, down to the microsecond, so sessions never share a folder
+        and sort oldest first. A manifest listing every file backed up and the strategy used is written on close. Use
+        as a context manager so the manifest is written.
+        Given a BlobStore, file contents are kept in the store and the session folder only holds the manifest, which
+        maps every file to the digest of its blob.
+
+    Attributes:
+        directory (str): Directory holding the files backed up.
+        root (str): Directory holding every backup session.
+        path (str): Folder of this session, None until opened.
+    """
+
+    def __init__(self, directory: str, root: str, link: bool = True, store: Optional[object] = None):
+        """Initialization of BackupSession.
+
+        Args:
+            directory: Directory holding the files backed up.
+            root: Directory holding every backup session.
+            link: Back up by hard link where possible, see backup_file. Not used with a store.
+            store: Content addressed store keeping the file contents, see models.blob_store.
+        """
+        self.directory = directory
+        self.root = root
+        self.path = None
+        self._link = link and store is None
+        self._store = store
+        self._sizes = {}
+        self._strategies = {}
+        self._digests = {}
+
+    def __enter__(self) -> "BackupSession":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def strategies(self) -> Dict[str, str]:
+        """Backup strategy used keyed by file name."""
+        return self._strategies
+
+    def backup(self, name: str) -> str:
+        """Back up a file into the session folder, may be called from several threads.
+
+        Args:
+            name: Name of the file.
+
+        Returns:
+            Backup strategy used.
+        """
+        if self._store is not None:
+            self._digests[name], strategy = self._store.put(path=join(self.directory, name))
+        else:
+            strategy = backup_file(src=join(self.directory, name), dest=join(self.path, name), link=self._link)
+        self._strategies[name] = strategy
+        return strategy
+
+    def close(self) -> None:
+        """Write the manifest of the session."""
+        if self.path is None:
+            return None
+        with open(join(self.path, MANIFEST), "w", encoding="utf-8") as manifest:
+            manifest.write(_dumps(["H", MANIFEST_VERSION, self.directory]))
+            manifest.writelines(_dumps(["F", name, strategy, self._sizes.get(name), self._digests.get(name)])
+                                for name, strategy in self._strategies.items())
+        if self._store is not None:
+            self._store.save()
+
+    def free_bytes(self) -> Optional[int]:
+        """Return the space available to the session, None where it cannot be found."""
+        if not hasattr(os, "statvfs"):
+            return None
+        # The backup root is only created when the first session opens.
+        st = os.statvfs(_nearest(self.root))
+        return st.f_bavail * st.f_frsize
+
+    def has_space(self, names: Iterable[str]) -> bool:
+        """Return if there is room to back up the files, with a single statvfs call.
+
+        Args:
+            names: Names of the files to back up.
+        """
+        free = self.free_bytes()
+        return free is None or self.required_bytes(names=names) <= free
+
+    def open(self) -> str:
+        """Create the session folder and return its path."""
+        stamp = datetime.now().strftime(SESSION_FORMAT)
+        counter = 0
+        while self.path is None:
+            path = join(self.root, f"{stamp}_{counter}" if counter else stamp)
+            try:
+                os.makedirs(path)
+                self.path = path
+            except FileExistsError:
+                counter += 1
+        return self.path
+
+    def required_bytes(self, names: Iterable[str]) -> int:
+        """Return the space needed to back up the files.
+
+        Note:
+            Files on the device of the backup root are hard linked when hard links have been shown to work there, and
+            files whose digest is cached and already in the store are deduplicated, so they do not need any space.
+            Every other file is copied in full.
+
+        Args:
+            names: Names of the files to back up.
+        """
+        device = link_device(root=self.root) if self._link else None
+        required = 0
+        for name in names:
+            st = os.stat(join(self.directory, name))
+            self._sizes[name] = st.st_size
+            if st.st_dev == device:
+                continue
+            if self._store is not None:
+                digest = self._store.cached_digest(st=st)
+                if digest is not None and self._store.has_blob(digest=digest):
+                    continue
+            required += st.st_size
+        return required
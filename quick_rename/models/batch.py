@@ -0,0 +1,154 @@
+import os
+from time import time
+from os.path import join
+from typing import Dict, List, Optional, Tuple
+
+from .backup import BackupSession
+from .blob_store import BlobStore
+from .executor import RenameExecutor
+from .journal import (JOURNAL_SUFFIX, Journal, commit_journal, lock_journal, resume_steps, rollback_steps, scan_inodes,
+                      write_journal)
+from .preflight import find_conflicts
+from .scheduler import net_renames, schedule_renames
+
+
+class BackupError(OSError):
+    """Files of a batch could not be backed up, no file was renamed."""
+
+
+class NoSpaceError(BackupError):
+    """There is not enough free space to back up the files of a batch, no file was backed up or renamed."""
+
+
+class JournalError(OSError):
+    """A batch could not be journaled, no file was renamed."""
+
+
+class ConflictError(OSError):
+    """Files of a batch are missing or would be renamed over other files, no file was renamed.
+
+    Attributes:
+        conflicts: (current name, new name) pairs which conflict.
+    """
+    def __init__(self, conflicts: List[Tuple[str, str]]):
+        super(ConflictError, self).__init__(f"{len(conflicts)} conflicting rename(s), first: {conflicts[0][0]}")
+        self.conflicts = conflicts
+
+
+class BatchInterrupted(OSError):
+    """Renaming a batch stopped part way, its journal is left behind to resume or roll back the batch.
+
+    Attributes:
+        journal: Journal of the batch.
+    """
+    def __init__(self, journal: str, message: str):
+        super(BatchInterrupted, self).__init__(message)
+        self.journal = journal
+
+
+def batch_name() -> str:
+    """Return a new name identifying a batch, names sort oldest first."""
+    return f"{int(time() * 1e9):020d}"
+
+
+def run_batch(directory: str, renames: List[Tuple[str, str]], listing: Dict[str, int], journal_dir: str,
+              backup_root: Optional[str] = None, store_root: Optional[str] = None, workers: int = 1) -> str:
+    """Back up, journal then run a batch of renames which passed models.preflight.find_conflicts.
+
+    Note:
+        The batch is checked against listing again so a missing file is reported before anything is done. Files are
+        backed up before the journal is written, so a failing backup leaves nothing to recover. Once the journal is
+        written any failure leaves it behind, see models.journal.resume_steps and rollback_steps.
+
+    Args:
+        directory: Directory the files are renamed in.
+        renames: (current name, new name) pairs of the batch.
+        listing: Inode of every entry in the directory keyed by name.
+        journal_dir: Directory holding journals.
+        backup_root: Backup folder, None to not back up the files.
+        store_root: Deduplicated backup store, None to copy every file into the backup session.
+        workers: Renames and backup copies running at the same time.
+
+    Raises:
+        ConflictError: If a file is missing from listing or would be renamed over another one.
+        NoSpaceError: If the backup folder does not have room for the files.
+        BackupError: If the files could not be backed up.
+        JournalError: If the batch could not be journaled.
+        BatchInterrupted: If renaming stopped part way.
+        OSError: If the directory could not be opened.
+
+    Returns:
+        Name identifying the batch.
+    """
+    conflicts = find_conflicts(renames=renames, listing=listing)
+    if conflicts:
+        raise ConflictError(conflicts=[renames[i] for i in conflicts])
+
+    names = [name for name, dest in renames]
+    session = None
+    if backup_root is not None:
+        store = BlobStore(root=store_root) if store_root is not None else None
+        session = BackupSession(directory=directory, root=backup_root, store=store)
+        try:
+            has_space = session.has_space(names=names)
+        except OSError as err:
+            raise BackupError(str(err)) from err
+        if not has_space:
+            raise NoSpaceError(directory)
+
+    with RenameExecutor(directory=directory, workers=workers) as executor:
+        if session is not None:
+            try:
+                # One folder and one manifest for the whole batch.
+                with session:
+                    executor.run_backups(session=session, names=names)
+            except OSError as err:
+                raise BackupError(str(err)) from err
+
+        batch = batch_name()
+        # Chains and swaps within the batch are ordered so no file is renamed over another one.
+        chains = schedule_renames(renames=renames, taken=listing)
+        journal = join(journal_dir, batch + JOURNAL_SUFFIX)
+        try:
+            os.makedirs(journal_dir, exist_ok=True)
+            lock = write_journal(path=journal, directory=directory, chains=chains, inodes=listing)
+        except OSError as err:
+            raise JournalError(str(err)) from err
+
+        # The journal stays locked until the batch is committed or abandoned, so it is not taken as interrupted.
+        with lock:
+            try:
+                executor.run_chains(chains=chains)
+                commit_journal(path=journal)
+            except OSError as err:
+                raise BatchInterrupted(journal=journal, message=str(err)) from err
+    return batch
+
+
+def recover_batch(journal: Journal, resume: bool, workers: int = 1) -> None:
+    """Resume or roll back an interrupted batch, then commit its journal.
+
+    Note:
+        Files may have been added, removed or renamed since the batch stopped. What is left to rename is checked against
+        the directory as it is now, and nothing is renamed if a file is missing or would be renamed over another one.
+
+    Args:
+        journal: Interrupted batch, see models.journal.pending_journals.
+        resume: Finish the batch, False rolls back the files already renamed.
+        workers: Renames running at the same time.
+
+    Raises:
+        BlockingIOError: If the batch is still being run, resumed or rolled back.
+        ConflictError: If a file is missing or would be renamed over another one.
+        OSError: If renaming or committing failed, the journal is left behind to try again.
+    """
+    # Locked so another QuickRename does not recover the same batch at the same time.
+    with lock_journal(path=journal.path):
+        chains = resume_steps(journal=journal) if resume else rollback_steps(journal=journal)
+        renames = net_renames(chains=chains)
+        conflicts = find_conflicts(renames=renames, listing=dict(scan_inodes(directory=journal.directory)))
+        if conflicts:
+            raise ConflictError(conflicts=[renames[i] for i in conflicts])
+        with RenameExecutor(directory=journal.directory, workers=workers) as executor:
+            executor.run_chains(chains=chains)
+        commit_journal(path=journal.path)
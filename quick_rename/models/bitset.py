@@ -0,0 +1,60 @@
+from typing import Iterable, Iterator
+
+
+class BitSet(object):
+    """Compact set of non negative integers stored one bit per value.
+
+    Note:
+        Used to track per row flags, such as check state, for very large file lists without an object per row.
+    """
+    __slots__ = ("_bits", "_count")
+
+    def __init__(self, values: Iterable[int] = ()):
+        """Initialization of BitSet.
+
+        Args:
+            values: Values initially in the set.
+        """
+        self._bits = bytearray()
+        self._count = 0
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value: int) -> bool:
+        byte = value >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (value & 7)))
+
+    def __iter__(self) -> Iterator[int]:
+        """Yield values in ascending order."""
+        for byte, bits in enumerate(self._bits):
+            if bits:
+                base = byte << 3
+                for bit in range(8):
+                    if bits & (1 << bit):
+                        yield base + bit
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, value: int) -> None:
+        """Add value to the set."""
+        byte = value >> 3
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(byte + 1 - len(self._bits)))
+        mask = 1 << (value & 7)
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self._count += 1
+
+    def clear(self) -> None:
+        """Remove all values from the set."""
+        self._bits = bytearray()
+        self._count = 0
+
+    def discard(self, value: int) -> None:
+        """Remove value from the set if present."""
+        byte = value >> 3
+        mask = 1 << (value & 7)
+        if byte < len(self._bits) and self._bits[byte] & mask:
+            self._bits[byte] &= ~mask & 0xFF
+            self._count -= 1
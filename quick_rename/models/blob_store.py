@@ -0,0 +1,138 @@
+import json
+import os
+from hashlib import sha256
+from os.path import isfile, join
+from threading import get_ident
+from typing import Dict, Optional, Tuple
+
+from .backup import backup_file
+
+# Files are read and hashed this many bytes at a time.
+CHUNK_SIZE = 1 << 20
+BLOBS = "blobs"
+DIGESTS = "digests.json"
+# Strategy reported when the contents were already in the store.
+DEDUPLICATED = "deduplicated"
+
+
+def hash_file(path: str, chunk_size: int = CHUNK_SIZE) -> str:
+    """Return the hex sha256 digest of a file, read in chunks into a single buffer.
+
+    Args:
+        path: File to hash.
+        chunk_size: Bytes read at a time.
+    """
+    digest = sha256()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as source:
+        while True:
+            read = source.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+    return digest.hexdigest()
+
+
+class BlobStore(object):
+    """Content addressed store keeping a single copy of every distinct file backed up.
+
+    Note:
+        Blobs are stored under their digest, so backing up a file which is already in the store costs a lookup. Digests
+        are cached by device, inode, size and modification time, an unchanged file is therefore not even read again.
+        Blobs are never hard linked to the files they back up, changing a file in place would change its blob too.
+
+    Attributes:
+        root (str): Directory holding the blobs and the digest cache.
+    """
+
+    def __init__(self, root: str):
+        """Initialization of BlobStore.
+
+        Args:
+            root: Directory holding the blobs and the digest cache.
+        """
+        self.root = root
+        self._digests = None
+
+    def blob_path(self, digest: str) -> str:
+        """Return the path of the blob holding contents with a given digest.
+
+        Args:
+            digest: Hex digest of the contents.
+        """
+        return join(self.root, BLOBS, digest[:2], digest)
+
+    def cached_digest(self, st: os.stat_result) -> Optional[str]:
+        """Return the digest of a file from the cache, None if the file is new or changed since it was hashed.
+
+        Args:
+            st: Result of stat on the file.
+        """
+        return self._cache().get(self._key(st=st))
+
+    def digest(self, path: str) -> str:
+        """Return the digest of a file, hashing it only if it changed since it was last hashed.
+
+        Args:
+            path: File to hash.
+        """
+        key = self._key(st=os.stat(path))
+        cache = self._cache()
+        digest = cache.get(key)
+        if digest is None:
+            digest = cache[key] = hash_file(path=path)
+        return digest
+
+    def has_blob(self, digest: str) -> bool:
+        """Return if contents with a given digest are in the store.
+
+        Args:
+            digest: Hex digest of the contents.
+        """
+        return isfile(self.blob_path(digest=digest))
+
+    def put(self, path: str) -> Tuple[str, str]:
+        """Store the contents of a file, may be called from several threads.
+
+        Args:
+            path: File to store.
+
+        Returns:
+            Digest of the file and the strategy used to store it, DEDUPLICATED if it was already stored.
+        """
+        digest = self.digest(path=path)
+        blob = self.blob_path(digest=digest)
+        if isfile(blob):
+            return digest, DEDUPLICATED
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        # Copy next to the blob then move it in place, a blob is never seen half written.
+        temp = f"{blob}.{os.getpid()}.{get_ident()}.tmp"
+        strategy = backup_file(src=path, dest=temp, link=False)
+        os.replace(temp, blob)
+        return digest, strategy
+
+    def save(self) -> None:
+        """Write the digest cache."""
+        if self._digests is None:
+            return None
+        os.makedirs(self.root, exist_ok=True)
+        path = join(self.root, DIGESTS)
+        with open(path + ".tmp", "w", encoding="utf-8") as cache:
+            json.dump(self._digests, cache, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+    def _cache(self) -> Dict[str, str]:
+        """Return the digest cache, read on first use."""
+        if self._digests is None:
+            try:
+                with open(join(self.root, DIGESTS), "r", encoding="utf-8") as cache:
+                    self._digests = json.load(cache)
+            except (OSError, ValueError):
+                self._digests = {}
+        return self._digests
+
+    @staticmethod
+    def _key(st: os.stat_result) -> str:
+        """Return the digest cache key of a file."""
+        return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from .backup import BackupSession
+from .scheduler import flatten
+
+# Renames can be resolved against an open directory, rather than resolving the full path twice per rename.
+RENAME_DIR_FD = os.rename in os.supports_dir_fd
+
+
+class RenameExecutor(object):
+    """Runs renames inside a single directory.
+
+    Note:
+        The directory is opened once and every rename is issued relative to it where the platform supports it, otherwise
+        absolute paths are used. Use as a context manager so the directory is closed again.
+        With more than one worker, independent chains of renames and backups are spread over a thread pool. That
+        only pays off where every call is a round trip, such as network shares.
+
+    Attributes:
+        directory (str): Directory files are renamed in.
+        workers (int): Number of renames or copies run at the same time.
+    """
+
+    def __init__(self, directory: str, use_dir_fd: Optional[bool] = None, workers: int = 1):
+        """Initialization of RenameExecutor.
+
+        Args:
+            directory: Directory files are renamed in.
+            use_dir_fd: Rename relative to an open directory, defaults to if the platform supports it.
+            workers: Number of renames or copies run at the same time.
+        """
+        self.directory = directory
+        self.workers = max(1, workers)
+        self._use_dir_fd = RENAME_DIR_FD if use_dir_fd is None else use_dir_fd and RENAME_DIR_FD
+        self._fd = None
+
+    def __enter__(self) -> "RenameExecutor":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def uses_dir_fd(self) -> bool:
+        """If renames are issued relative to an open directory."""
+        return self._use_dir_fd
+
+    def close(self) -> None:
+        """Close the directory."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def backup(self, session: BackupSession, name: str) -> str:
+        """Back up a file of the directory.
+
+        Args:
+            session: Open backup session of the batch.
+            name: Name of the file.
+
+        Returns:
+            Backup strategy used.
+        """
+        return session.backup(name=name)
+
+    def open(self) -> None:
+        """Open the directory, renames are resolved against it until closed."""
+        if self._use_dir_fd and self._fd is None:
+            self._fd = os.open(self.directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+    def path(self, name: str) -> str:
+        """Return the full path of a file in the directory.
+
+        Args:
+            name: Name of the file.
+        """
+        return join(self.directory, name)
+
+    def rename(self, src: str, dest: str) -> None:
+        """Rename a file.
+
+        Args:
+            src: Current name of the file.
+            dest: New name of the file.
+        """
+        if self._fd is not None:
+            os.rename(src, dest, src_dir_fd=self._fd, dst_dir_fd=self._fd)
+        else:
+            os.rename(self.path(src), self.path(dest))
+
+    def run(self, steps: Iterable[Tuple[str, str]]) -> int:
+        """Run renames one after another.
+
+        Args:
+            steps: (current name, new name) pairs in the order they must run, see models.scheduler.
+
+        Returns:
+            Number of files renamed.
+        """
+        count = 0
+        for src, dest in steps:
+            self.rename(src, dest)
+            count += 1
+        return count
+
+    def run_chains(self, chains: Sequence[Sequence[Tuple[str, str]]]) -> int:
+        """Run scheduled chains of renames, steps of a chain always run in order.
+
+        Args:
+            chains: Chains returned by models.scheduler.schedule_renames.
+
+        Returns:
+            Number of files renamed.
+        """
+        return self._spread(func=lambda part: self.run(steps=flatten(part)), items=chains)
+
+    def run_backups(self, session: BackupSession, names: Sequence[str]) -> Dict[str, str]:
+        """Back up files of the directory.
+
+        Args:
+            session: Open backup session of the batch.
+            names: Names of the files.
+
+        Returns:
+            Backup strategy used keyed by file name.
+        """
+        def backup_all(part: Sequence[str]) -> int:
+            for name in part:
+                self.backup(session=session, name=name)
+            return len(part)
+        self._spread(func=backup_all, items=names)
+        return session.strategies
+
+    def _spread(self, func: Callable[[Sequence], int], items: Sequence) -> int:
+        """Split items between the workers, the first error raised by a worker is raised once every worker is done.
+
+        Args:
+            func: Processes part of the items and returns how many it processed.
+            items: Independent items to process.
+        """
+        workers = min(self.workers, len(items))
+        if workers <= 1:
+            return func(items)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(func, items[i::workers]) for i in range(workers)]
+        return sum(x.result() for x in futures)
@@ -0,0 +1,95 @@
+from re import compile, escape
+from fnmatch import translate
+from functools import lru_cache
+from typing import Callable, List, Sequence
+
+SUBSTRING = "substring"
+GLOB = "glob"
+REGEX = "regex"
+MODES = (SUBSTRING, GLOB, REGEX)
+
+GLOB_MAGIC = frozenset("*?[")
+
+
+@lru_cache(maxsize=32)
+def compile_filter(pattern: str, mode: str = SUBSTRING) -> Callable[[str], bool]:
+    """Compile a search pattern into a predicate accepting a file name.
+
+    Note:
+        Globs of the form *text* and regular expressions without special characters are reduced to a substring test.
+
+    Args:
+        pattern: Text to search for.
+        mode: One of SUBSTRING, GLOB or REGEX.
+
+    Raises:
+        ValueError: If mode is unknown.
+        re.error: If pattern is not a valid regular expression in REGEX mode.
+    """
+    literal = _literal(pattern=pattern, mode=mode)
+    if literal is not None:
+        return lambda name: literal in name
+    if mode == GLOB:
+        match = compile(translate(pattern)).match
+    else:
+        match = compile(pattern).search
+    return lambda name: match(name) is not None
+
+
+def _literal(pattern: str, mode: str) -> str:
+    """Return the substring pattern reduces to, None if it needs the regex engine.
+
+    Args:
+        pattern: Text to search for.
+        mode: One of SUBSTRING, GLOB or REGEX.
+    """
+    if mode == SUBSTRING:
+        return pattern
+    if mode == GLOB:
+        inner = pattern[1:-1] if len(pattern) >= 2 and pattern[0] == pattern[-1] == "*" else None
+        return inner if inner is not None and not GLOB_MAGIC.intersection(inner) else None
+    if mode == REGEX:
+        return pattern if escape(pattern) == pattern else None
+    raise ValueError(f"Unknown filter mode {mode}, expected one of {MODES}")
+
+
+class NameFilter(object):
+    """Search limit compiled once and applied to many file names.
+
+    Attributes:
+        pattern (str): Text searched for.
+        mode (str): One of SUBSTRING, GLOB or REGEX.
+    """
+    __slots__ = ("pattern", "mode", "_literal", "_match")
+
+    def __init__(self, pattern: str, mode: str = SUBSTRING):
+        """Initialization of NameFilter.
+
+        Args:
+            pattern: Text to search for.
+            mode: One of SUBSTRING, GLOB or REGEX.
+
+        Raises:
+            ValueError: If mode is unknown.
+            re.error: If pattern is not a valid regular expression in REGEX mode.
+        """
+        self.pattern = pattern
+        self.mode = mode
+        self._literal = _literal(pattern=pattern, mode=mode)
+        self._match = compile_filter(pattern=pattern, mode=mode)
+
+    def __call__(self, name: str) -> bool:
+        """Return if name matches the filter."""
+        return self._match(name)
+
+    def apply(self, names: Sequence[str]) -> List[int]:
+        """Return the indices of all names matching the filter.
+
+        Args:
+            names: File names to filter.
+        """
+        literal = self._literal
+        if literal is not None:
+            return [i for i, name in enumerate(names) if literal in name]
+        match = self._match
+        return [i for i, name in enumerate(names) if match(name)]
@@ -0,0 +1,123 @@
+import json
+import os
+from os.path import getsize, join
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+HISTORY_SUFFIX = ".history"
+HISTORY_VERSION = 1
+
+# Record types, one JSON array per line.
+HEADER = "H"
+UNDO = "U"
+
+
+class HistoryEntry(NamedTuple):
+    """Completed rename batch which can be undone.
+
+    Attributes:
+        path: History file.
+        directory: Directory the files were renamed in.
+        count: Number of files renamed.
+    """
+    path: str
+    directory: str
+    count: int
+
+
+def _dumps(record: list) -> str:
+    """Return a record as a compact history line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def record_batch(history_dir: str, name: str, directory: str, renames: Iterable[Tuple[str, str]],
+                 max_bytes: int) -> str:
+    """Store the inverse of a completed batch, then evict the oldest batches over the size limit.
+
+    Args:
+        history_dir: Directory holding the history.
+        name: File name of the entry, entries sort oldest first by name.
+        directory: Directory the files were renamed in.
+        renames: (previous name, new name) pairs of the batch, unchanged names are skipped.
+        max_bytes: Total size the history is kept under, the newest entry is always kept.
+
+    Returns:
+        Path of the new entry.
+    """
+    inverse = [(dest, src) for src, dest in renames if src != dest]
+    os.makedirs(history_dir, exist_ok=True)
+    path = join(history_dir, name + HISTORY_SUFFIX)
+    with open(path, "x", encoding="utf-8") as history:
+        history.write(_dumps([HEADER, HISTORY_VERSION, directory, len(inverse)]))
+        history.writelines(_dumps([UNDO, dest, src]) for dest, src in inverse)
+    evict(history_dir=history_dir, max_bytes=max_bytes)
+    return path
+
+
+def evict(history_dir: str, max_bytes: int) -> List[str]:
+    """Remove the oldest entries until the history fits in max_bytes, the newest entry is always kept.
+
+    Args:
+        history_dir: Directory holding the history.
+        max_bytes: Total size the history is kept under.
+
+    Returns:
+        Paths of the removed entries.
+    """
+    paths = [join(history_dir, x) for x in sorted(os.listdir(history_dir)) if x.endswith(HISTORY_SUFFIX)]
+    sizes = [getsize(x) for x in paths]
+    total = sum(sizes)
+    removed = []
+    for path, size in zip(paths[:-1], sizes):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        removed.append(path)
+        total -= size
+    return removed
+
+
+def list_history(history_dir: str, directory: Optional[str] = None) -> List[HistoryEntry]:
+    """Return batches which can be undone, newest first.
+
+    Note:
+        Only the first line of every entry is read.
+
+    Args:
+        history_dir: Directory holding the history.
+        directory: Only return batches renamed in this directory, every batch when None.
+    """
+    try:
+        names = sorted((x for x in os.listdir(history_dir) if x.endswith(HISTORY_SUFFIX)), reverse=True)
+    except OSError:
+        return []
+    entries = []
+    for name in names:
+        path = join(history_dir, name)
+        try:
+            with open(path, "r", encoding="utf-8") as history:
+                kind, version, entry_dir, count = json.loads(history.readline())
+        except (OSError, ValueError):
+            continue
+        if directory is None or entry_dir == directory:
+            entries.append(HistoryEntry(path=path, directory=entry_dir, count=count))
+    return entries
+
+
+def read_inverse(entry: HistoryEntry) -> List[Tuple[str, str]]:
+    """Return the renames undoing a batch, as (current name, previous name) pairs.
+
+    Args:
+        entry: Batch to undo.
+    """
+    with open(entry.path, "r", encoding="utf-8") as history:
+        history.readline()
+        return [(x[1], x[2]) for x in map(json.loads, history)]
+
+
+def forget(entry: HistoryEntry) -> None:
+    """Remove a batch from the history, once it has been undone.
+
+    Args:
+        entry: Batch to remove.
+    """
+    os.remove(entry.path)
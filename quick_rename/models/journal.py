@@ -0,0 +1,293 @@
+import json
+import os
+from os.path import join
+from typing import Iterable, List, Mapping, NamedTuple, Sequence, TextIO, Tuple
+
+try:
+    from fcntl import LOCK_EX, LOCK_NB, flock
+except ImportError:
+    flock = None
+
+JOURNAL_SUFFIX = ".journal"
+# Journals are written under this suffix then renamed, so they are locked from the moment they can be found.
+PARTIAL_SUFFIX = ".partial"
+JOURNAL_VERSION = 1
+
+# Record types, one JSON array per line.
+HEADER = "H"
+CHAIN = "C"
+STEP = "R"
+PLANNED = "P"
+COMMIT = "E"
+
+
+class Journal(NamedTuple):
+    """Rename batch read back from a journal.
+
+    Attributes:
+        path: Journal file.
+        directory: Directory the files are renamed in.
+        chains: Scheduled chains of (current name, new name, inode of the file moved) steps.
+        planned: If the whole plan was written, renames only start once it is.
+        committed: If every rename finished.
+    """
+    path: str
+    directory: str
+    chains: List[List[Tuple[str, str, int]]]
+    planned: bool
+    committed: bool
+
+
+def _dumps(record: list) -> str:
+    """Return a record as a compact journal line."""
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _sync_directory(directory: str) -> None:
+    """Make a new directory entry durable, where directories can be opened."""
+    try:
+        fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return None
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_journal(path: str, directory: str, chains: Sequence[Sequence[Tuple[str, str]]],
+                  inodes: Mapping[str, int]) -> TextIO:
+    """Write a batch to a journal before any file is renamed.
+
+    Note:
+        Every record is written then synced to disk with a single fsync, rather than one per file. Each step stores
+        the inode of the file it moves, so the progress of an interrupted batch is read back from the directory itself.
+
+        The journal is locked while the batch runs, see is_running. The lock is released when the returned journal is
+        closed, or when the process ends.
+
+    Args:
+        path: Journal file to create.
+        directory: Directory the files are renamed in.
+        chains: Chains returned by models.scheduler.schedule_renames.
+        inodes: Inode of every file in the directory keyed by name.
+
+    Returns:
+        The journal, open and locked, close it once the batch is committed or abandoned.
+    """
+    count = 0
+    partial = path + PARTIAL_SUFFIX
+    journal = open(partial, "x", encoding="utf-8")
+    try:
+        if flock is not None:
+            flock(journal.fileno(), LOCK_EX)
+        journal.write(_dumps([HEADER, JOURNAL_VERSION, directory]))
+        for chain in chains:
+            journal.write(_dumps([CHAIN]))
+            # Temporary names are not in the directory yet, they take the inode of the file moved to them.
+            moved = {}
+            for src, dest in chain:
+                inode = moved.pop(src, None)
+                if inode is None:
+                    inode = inodes[src]
+                moved[dest] = inode
+                journal.write(_dumps([STEP, src, dest, inode]))
+                count += 1
+        journal.write(_dumps([PLANNED, count]))
+        journal.flush()
+        os.fsync(journal.fileno())
+        os.rename(partial, path)
+    except BaseException:
+        journal.close()
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+    _sync_directory(directory=os.path.dirname(path) or ".")
+    return journal
+
+
+def commit_journal(path: str) -> None:
+    """Mark a batch as finished and remove its journal.
+
+    Args:
+        path: Journal file.
+    """
+    with open(path, "a", encoding="utf-8") as journal:
+        journal.write(_dumps([COMMIT]))
+        journal.flush()
+        os.fsync(journal.fileno())
+    os.remove(path)
+
+
+def read_journal(path: str) -> Journal:
+    """Read a batch back from a journal.
+
+    Note:
+        A journal cut short while the plan was written is read as not planned, no file was renamed for it.
+
+    Args:
+        path: Journal file.
+    """
+    directory = None
+    chains = []
+    planned = committed = False
+    with open(path, "r", encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            kind = record[0]
+            if kind == STEP:
+                chains[-1].append((record[1], record[2], record[3]))
+            elif kind == CHAIN:
+                chains.append([])
+            elif kind == HEADER:
+                directory = record[2]
+            elif kind == PLANNED:
+                planned = record[1] == sum(len(x) for x in chains)
+            elif kind == COMMIT:
+                committed = True
+    return Journal(path=path, directory=directory, chains=chains, planned=planned, committed=committed)
+
+
+def lock_journal(path: str) -> TextIO:
+    """Open and lock the journal of an interrupted batch, while it is resumed or rolled back.
+
+    Args:
+        path: Journal file.
+
+    Raises:
+        BlockingIOError: If the batch is still being run, resumed or rolled back.
+
+    Returns:
+        The journal, close it to release the lock.
+    """
+    journal = open(path, "r", encoding="utf-8")
+    if flock is not None:
+        try:
+            flock(journal.fileno(), LOCK_EX | LOCK_NB)
+        except OSError:
+            journal.close()
+            raise
+    return journal
+
+
+def is_running(path: str) -> bool:
+    """Return if the batch of a journal is still being run, by this or another process.
+
+    Note:
+        Platforms without flock can not tell running batches apart, every batch is then taken as interrupted.
+
+    Args:
+        path: Journal file.
+    """
+    try:
+        lock_journal(path=path).close()
+    except BlockingIOError:
+        return True
+    except OSError:
+        # Committed and removed in the meantime.
+        return False
+    return False
+
+
+def pending_journals(journal_dir: str, running: bool = False) -> List[Journal]:
+    """Return journals of batches which were interrupted, oldest first.
+
+    Args:
+        journal_dir: Directory holding journals.
+        running: Also return batches which are still being run, see is_running.
+    """
+    try:
+        names = sorted(x for x in os.listdir(journal_dir) if x.endswith(JOURNAL_SUFFIX))
+    except OSError:
+        return []
+    journals = []
+    for name in names:
+        path = join(journal_dir, name)
+        if not running and is_running(path=path):
+            continue
+        try:
+            journal = read_journal(path=path)
+        except OSError:
+            continue
+        if not journal.committed:
+            journals.append(journal)
+    return journals
+
+
+def has_pending(journal_dir: str, directory: str) -> bool:
+    """Return if a batch in directory is running, or was interrupted and not yet resumed or rolled back.
+
+    Args:
+        journal_dir: Directory holding journals.
+        directory: Directory the files are renamed in.
+    """
+    return any(x.directory == directory for x in pending_journals(journal_dir=journal_dir, running=True))
+
+
+def completed_steps(journal: Journal) -> List[int]:
+    """Return how many steps of every chain were done, read from the inodes found in the directory.
+
+    Note:
+        Steps of a chain run in order, so the last step whose new name holds the inode it moved marks every step
+        before it done too.
+
+    Args:
+        journal: Interrupted batch.
+    """
+    done = []
+    for chain in journal.chains:
+        count = 0
+        for i in range(len(chain) - 1, -1, -1):
+            src, dest, inode = chain[i]
+            try:
+                if os.lstat(join(journal.directory, dest)).st_ino == inode:
+                    count = i + 1
+                    break
+            except OSError:
+                pass
+        done.append(count)
+    return done
+
+
+def resume_steps(journal: Journal) -> List[List[Tuple[str, str]]]:
+    """Return the chains of renames left to finish an interrupted batch.
+
+    Args:
+        journal: Interrupted batch.
+    """
+    if not journal.planned:
+        return []
+    chains = ([(src, dest) for src, dest, inode in chain[done:]]
+              for chain, done in zip(journal.chains, completed_steps(journal=journal)))
+    return [x for x in chains if x]
+
+
+def rollback_steps(journal: Journal) -> List[List[Tuple[str, str]]]:
+    """Return the chains of renames undoing the part of an interrupted batch which was done.
+
+    Args:
+        journal: Interrupted batch.
+    """
+    if not journal.planned:
+        return []
+    chains = ([(dest, src) for src, dest, inode in reversed(chain[:done])]
+              for chain, done in zip(journal.chains, completed_steps(journal=journal)))
+    return [x for x in chains if x]
+
+
+def scan_inodes(directory: str) -> Iterable[Tuple[str, int]]:
+    """Yield (name, inode) of every entry in a directory, inodes come with the listing on most platforms.
+
+    Args:
+        directory: Directory to list.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            yield entry.name, entry.inode()
@@ -0,0 +1,174 @@
+import csv
+import json
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, TextIO, Tuple
+
+from .journal import Journal, completed_steps
+from .preflight import find_conflicts
+
+CSV = "csv"
+JSONL = "jsonl"
+# Status of every manifest row, written to the results.
+RENAMED = "renamed"
+PLANNED = "planned"
+UNCHANGED = "unchanged"
+INVALID = "invalid"
+MISSING = "missing"
+CONFLICT = "conflict"
+FAILED = "failed"
+# First CSV row skipped as a header.
+HEADER = ("old", "new")
+
+
+def manifest_format(path: str) -> str:
+    """Return the format of a manifest from its file name, CSV unless it ends in .jsonl or .json.
+
+    Args:
+        path: Manifest file name.
+    """
+    return JSONL if path.lower().endswith((".jsonl", ".json")) else CSV
+
+
+def read_manifest(stream: TextIO, fmt: str = CSV) -> Iterator[Optional[Tuple[str, str]]]:
+    """Yield the (old name, new name) pair of every manifest row, one row at a time.
+
+    Note:
+        CSV rows hold two columns, a first row of old,new is skipped. JSONL rows hold either {"old": .., "new": ..}
+        or ["old", "new"]. Rows which can not be read, including CSV rows the csv module rejects, yield None, so results
+        keep matching manifest rows.
+
+    Args:
+        stream: Manifest to read.
+        fmt: CSV or JSONL.
+    """
+    if fmt == JSONL:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                if isinstance(row, dict):
+                    row = row["old"], row["new"]
+            except (ValueError, KeyError, TypeError):
+                yield None
+                continue
+            yield _pair(row)
+        return
+
+    rows = csv.reader(stream)
+    first = True
+    while True:
+        try:
+            row = next(rows)
+        except StopIteration:
+            return
+        except csv.Error:
+            # The reader starts over on the next line, e.g. after a field over csv.field_size_limit.
+            first = False
+            yield None
+            continue
+        if row and not (first and tuple(x.strip().lower() for x in row) == HEADER):
+            yield _pair(row)
+        first = False
+
+
+def _pair(row: Sequence) -> Optional[Tuple[str, str]]:
+    """Return a row as an (old name, new name) pair, None if it does not hold two names."""
+    if len(row) != 2 or not all(isinstance(x, str) for x in row):
+        return None
+    return row[0], row[1]
+
+
+def iter_chunks(rows: Iterable, size: int) -> Iterator[List]:
+    """Yield lists of up to size rows.
+
+    Args:
+        rows: Rows to split.
+        size: Most rows in a chunk.
+    """
+    rows = iter(rows)
+    chunk = list(islice(rows, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(rows, size))
+
+
+def _is_name(name: str) -> bool:
+    """Return if name is a plain file name, not a path."""
+    return bool(name) and name not in (".", "..") and "/" not in name and "\0" not in name
+
+
+def check_chunk(rows: Sequence[Optional[Tuple[str, str]]],
+                listing: MutableMapping[str, int]) -> Tuple[List[Tuple[str, str]], Dict[int, str]]:
+    """Split a chunk of manifest rows into renames safe to run together and rejected rows.
+
+    Note:
+        Conflicts are found with models.preflight.find_conflicts, as for renames made from the gui. Dropping a
+        conflicting rename keeps its file in place, which may take the name another rename was moving into, so the
+        check is repeated until no conflict is left. Swaps and cycles are safe within a chunk, ordering them is left to
+        models.scheduler.schedule_renames.
+
+    Args:
+        rows: (old name, new name) pairs as yielded by read_manifest.
+        listing: Inodes of the entries in the directory keyed by name, with earlier chunks already applied.
+
+    Returns:
+        Renames to run, and the status of every other row keyed by its index in rows.
+    """
+    statuses = {}
+    accepted = []
+    sources = {}
+    for i, row in enumerate(rows):
+        if row is None or not _is_name(row[0]) or not _is_name(row[1]):
+            statuses[i] = INVALID
+        elif row[0] not in listing:
+            statuses[i] = MISSING
+        elif row[0] == row[1]:
+            statuses[i] = UNCHANGED
+        else:
+            sources.setdefault(row[0], []).append(i)
+            accepted.append(i)
+    # A file can only be moved once, every row moving it is rejected.
+    for indexes in sources.values():
+        if len(indexes) > 1:
+            statuses.update((x, CONFLICT) for x in indexes)
+    accepted = [x for x in accepted if x not in statuses]
+
+    while True:
+        conflicts = find_conflicts(renames=[rows[i] for i in accepted], listing=listing)
+        if not conflicts:
+            break
+        for index in conflicts:
+            statuses[accepted[index]] = CONFLICT
+        accepted = [x for x in accepted if x not in statuses]
+    return [rows[i] for i in accepted], statuses
+
+
+def apply_renames(renames: Iterable[Tuple[str, str]], listing: MutableMapping[str, int]) -> None:
+    """Update a directory listing after a chunk of renames ran.
+
+    Args:
+        renames: (old name, new name) pairs which ran.
+        listing: Inodes of the entries in the directory keyed by name.
+    """
+    moved = [(dest, listing.pop(src)) for src, dest in renames]
+    listing.update(moved)
+
+
+def interrupted_statuses(journal: Journal, renames: Sequence[Tuple[str, str]],
+                         listing: Mapping[str, int]) -> List[str]:
+    """Return RENAMED or FAILED for every rename of a chunk whose batch stopped part way.
+
+    Note:
+        Done steps are read from the journal left behind, see models.journal.completed_steps. A file moved aside to a
+        temporary name to break a cycle has not reached its new name, so its row failed.
+
+    Args:
+        journal: Journal of the interrupted batch.
+        renames: (old name, new name) pairs of the batch.
+        listing: Inodes of the entries in the directory keyed by name, from before the batch ran.
+    """
+    done = set()
+    for chain, count in zip(journal.chains, completed_steps(journal=journal)):
+        done.update((dest, inode) for src, dest, inode in chain[:count])
+    return [RENAMED if (dest, listing[src]) in done else FAILED for src, dest in renames]
@@ -1,11 +1,27 @@
-from typing import Type, Optional
-from collections import namedtuple
+from typing import Type, Optional, Iterable, Iterator, Union, List, FrozenSet
+from collections import namedtuple, defaultdict
+from heapq import merge
+from re import split
 from os.path import join, splitext, isfile
 
+from .sequence import ImageSequence, detect_sequences
+
 
 PreProcessedData = namedtuple("pre_processed_data", "name path ext")
 
 
+def parse_extensions(value: str) -> FrozenSet[str]:
+    """Return a set of lower case extensions, with a leading dot, from a comma or space separated string.
+
+    Example:
+        "exr, .TIF png" -> {".exr", ".tif", ".png"}
+
+    Args:
+        value: Extensions entered by the end user.
+    """
+    return frozenset(f".{x.lstrip('.').lower()}" for x in split(r"[,;\s]+", value) if x.lstrip("."))
+
+
 class RenameItem(object):
     """Model which holds renamed items."""
     __slots__ = ("col", "row", "name", "src", "dest")
@@ -23,6 +39,7 @@ class PreProcessed(object):
 
     def __init__(self):
         self._data = []
+        self._ext_index = defaultdict(list)
 
     @property
     def data(self) -> Type[PreProcessedData]:
@@ -42,22 +59,116 @@ class PreProcessed(object):
         """
         path = join(directory, item)
         if isfile(path):
-            self._data.append(PreProcessedData(name=item, path=path, ext=splitext(item)[-1]))
+            ext = splitext(item)[-1]
+            self._ext_index[ext.lower()].append(len(self._data))
+            self._data.append(PreProcessedData(name=item, path=path, ext=ext))
             return True
         return False
 
+    def add_items(self, items: Iterable[PreProcessedData]) -> None:
+        """Add already scanned items to the structure.
+
+        Args:
+            items: PreProcessedData records, see models.scanner.
+        """
+        start = len(self._data)
+        self._data.extend(items)
+        self._index(start=start)
+
+    def _index(self, start: int = 0) -> None:
+        """Add rows from start onwards to the extension index.
+
+        Args:
+            start: First row to index.
+        """
+        index = self._ext_index
+        data = self._data
+        for i in range(start, len(data)):
+            index[data[i].ext.lower()].append(i)
+
     def clear(self) -> None:
         """Clear PreProcessed data."""
         self._data = []
+        self._ext_index = defaultdict(list)
+
+    def indices(self, ext: Union[str, Iterable[str]]) -> List[int]:
+        """Return the rows of items with the given extension(s) in ascending order.
 
-    def count(self, ext: Optional[str] = None) -> int:
+        Args:
+            ext: Extension, or extensions, to consider. Matching is case insensitive.
+        """
+        index = self._ext_index
+        if isinstance(ext, str):
+            return list(index.get(ext.lower(), ()))
+        rows = [index[x] for x in {x.lower() for x in ext} if x in index]
+        return rows[0][:] if len(rows) == 1 else list(merge(*rows))
+
+    def items(self, ext: Union[str, Iterable[str]]) -> Iterator[PreProcessedData]:
+        """Yield items with the given extension(s) in row order.
+
+        Args:
+            ext: Extension, or extensions, to consider. Matching is case insensitive.
+        """
+        data = self._data
+        for i in self.indices(ext=ext):
+            yield data[i]
+
+    def remove_items(self, names: Iterable[str]) -> List[int]:
+        """Remove items from the structure.
+
+        Args:
+            names: File names to remove.
+
+        Returns:
+            New row of every item indexed by its previous row, -1 for removed items.
+        """
+        names = set(names)
+        remap = []
+        data = []
+        for item in self._data:
+            if item.name in names:
+                remap.append(-1)
+            else:
+                remap.append(len(data))
+                data.append(item)
+        self._data = data
+        self._ext_index = defaultdict(list)
+        self._index()
+        return remap
+
+    def sequences(self, min_length: int = 2) -> List[ImageSequence]:
+        """Return the image sequences found among the items, see models.sequence.detect_sequences.
+
+        Args:
+            min_length: Fewest frames making a sequence.
+        """
+        return detect_sequences(names=[x.name for x in self._data], min_length=min_length)
+
+    def sort(self) -> List[int]:
+        """Sort PreProcessed data by name.
+
+        Returns:
+            New row of every item indexed by its previous row.
+        """
+        data = self._data
+        order = sorted(range(len(data)), key=lambda i: data[i].name)
+        self._data = [data[i] for i in order]
+        remap = [0] * len(order)
+        for new, old in enumerate(order):
+            remap[old] = new
+        self._ext_index = defaultdict(list)
+        self._index()
+        return remap
+
+    def count(self, ext: Optional[Union[str, Iterable[str]]] = None) -> int:
         """Return number of PreProcess items.
 
         Args:
-            ext: Extension to consider.
+            ext: Extension, or extensions, to consider. Matching is case insensitive.
         """
-        if ext is not None:
-            count = len([x for x in self._data if x.ext == ext])
-        else:
-            count = len(self._data)
-        return count
+        if ext is None:
+            return len(self._data)
+        index = self._ext_index
+        if isinstance(ext, str):
+            return len(index.get(ext.lower(), ()))
+        return sum(len(index[x]) for x in {x.lower() for x in ext} if x in index)
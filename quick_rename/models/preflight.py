@@ -0,0 +1,33 @@
+from typing import Iterable, List, Sequence, Tuple
+
+
+def find_conflicts(renames: Sequence[Tuple[str, str]], listing: Iterable[str]) -> List[int]:
+    """Return every rename whose file is missing or whose new name is already taken, in a single pass over the batch.
+
+    Note:
+        A name is taken if another rename in the batch claims it, or if it is in the directory listing and not being
+        vacated by the batch. Names vacated by the batch are free no matter the order the renames run in, ordering them
+        safely is left to the rename scheduler. A file is missing if its current name is not in the listing, e.g. it was
+        removed since the folder was scanned.
+
+    Args:
+        renames: (current name, new name) pairs of the batch.
+        listing: Every name in the directory, files and folders.
+
+    Returns:
+        Ascending indexes into renames of the conflicting renames.
+    """
+    vacated = {src for src, dest in renames if src != dest}
+    present = set(listing)
+    occupied = present - vacated
+    claimed = {}
+    conflicts = set()
+    for i, (src, dest) in enumerate(renames):
+        if src == dest:
+            continue
+        if dest in occupied or src not in present:
+            conflicts.add(i)
+        owner = claimed.setdefault(dest, i)
+        if owner != i:
+            conflicts.update((owner, i))
+    return sorted(conflicts)
@@ -0,0 +1,68 @@
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from .rename_plan import RenamePlan, compile_plan, plan_paddings
+
+# Number of names computed between checks for cancellation.
+CHECK_INTERVAL = 4096
+
+
+class Preview(NamedTuple):
+    """New names of the checked files under a RenamePlan.
+
+    Attributes:
+        plan: Rename options applied.
+        start: Renumbering number of the first file.
+        names: New names keyed by PreProcessed row, in renumbering order.
+        duplicates: PreProcessed rows sharing a new name with another row.
+    """
+    plan: RenamePlan
+    start: int
+    names: Dict[int, str]
+    duplicates: List[int]
+
+    def matches(self, plan: RenamePlan, start: int, rows: Sequence[int]) -> bool:
+        """Return if the preview was computed for the given options and checked rows, in the same order.
+
+        Args:
+            plan: Current rename options.
+            start: Current renumbering number of the first file.
+            rows: PreProcessed rows currently checked, in renumbering order.
+        """
+        return (plan == self.plan and start == self.start and len(rows) == len(self.names) and
+                all(x == y for x, y in zip(rows, self.names)))
+
+
+def build_preview(plan: RenamePlan, start: int, rows: Sequence[int], names: Sequence[str],
+                  interrupted: Optional[Callable[[], bool]] = None) -> Optional[Preview]:
+    """Compute the new name of every checked file and find duplicates in a single pass.
+
+    Note:
+        Only plain Python data is touched so this may run on a worker thread.
+
+    Args:
+        plan: Rename options to apply.
+        start: Renumbering number of the first file.
+        rows: PreProcessed rows of the checked files, in renumbering order.
+        names: Current names of the checked files, matching rows.
+        interrupted: Polled while computing, the preview is abandoned once it returns True.
+
+    Returns:
+        Preview, None if interrupted.
+    """
+    name_for = compile_plan(plan)
+    paddings = plan_paddings(plan=plan, names=names)
+    new_names = {}
+    owners = {}
+    duplicates = []
+    flagged = set()
+    for i, (row, name) in enumerate(zip(rows, names)):
+        if interrupted is not None and not i % CHECK_INTERVAL and interrupted():
+            return None
+        dest = new_names[row] = name_for(name, start + i, paddings.get(name))
+        owner = owners.setdefault(dest, row)
+        if owner != row:
+            if owner not in flagged:
+                flagged.add(owner)
+                duplicates.append(owner)
+            duplicates.append(row)
+    return Preview(plan=plan, start=start, names=new_names, duplicates=duplicates)
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .sequence import format_frame, frame_paddings, parse_frame
+
+
+class RenamePlan(NamedTuple):
+    """Immutable, hashable, snapshot of the rename options.
+
+    Attributes:
+        remove_ext: Remove the extension.
+        new_ext: Extension replacing the current one, None keeps the current extension.
+        new_name: Name replacing the current one, None keeps the current name.
+        find: Text to search for in the current name, None to not search and replace.
+        replace: Text replacing find.
+        prefix: Prefix to add, None to not add a prefix.
+        renumber: Add a number to the name.
+        dot: Separator placed between the name and the number.
+        padding: Pad numbers to this many digits, 0 to not pad.
+        frame_offset: When renumbering, keep the frame number of every file shifted by this offset instead of numbering
+            files by position. Files without a frame number are numbered by position. None numbers every file by
+            position.
+    """
+    remove_ext: bool = False
+    new_ext: Optional[str] = None
+    new_name: Optional[str] = None
+    find: Optional[str] = None
+    replace: str = ""
+    prefix: Optional[str] = None
+    renumber: bool = False
+    dot: str = "."
+    padding: int = 0
+    frame_offset: Optional[int] = None
+
+    @property
+    def keep_frames(self) -> bool:
+        """Return if files are numbered by their own frame number rather than by position."""
+        return self.renumber and self.frame_offset is not None
+
+
+def split_ext(name: str) -> Tuple[str, str]:
+    """Split a file name into stem and extension, as os.path.splitext does for names without a directory.
+
+    Args:
+        name: File name to split.
+    """
+    stem, dot, ext = name.rpartition(".")
+    # Leading dots mark hidden files, not extensions.
+    if not dot or not stem.strip("."):
+        return name, ""
+    return stem, dot + ext
+
+
+@lru_cache(maxsize=16)
+def compile_plan(plan: RenamePlan) -> Callable[..., str]:
+    """Compile a RenamePlan into a function returning the new name of a file.
+
+    Note:
+        The returned function takes the current file name, its renumbering number and optionally the padding of its
+        image sequence, see plan_paddings. It only does string work, so it is safe to call from any thread.
+
+    Args:
+        plan: Rename options to apply.
+    """
+    remove_ext, new_ext, new_name, find, replace, prefix, renumber, dot, padding, frame_offset = plan
+    prefix = prefix or ""
+    keep_frames = plan.keep_frames
+
+    def name_for(item_name: str, number: int, frame_padding: Optional[int] = None) -> str:
+        stem, ext = split_ext(item_name)
+        sep, pad = dot, padding
+        if keep_frames:
+            parsed = parse_frame(item_name)
+            if parsed is not None:
+                head, frame, ext = parsed
+                # A dot before the frame number is replaced by dot, any other separator stays with the name.
+                stem, sep = (head[:-1], dot) if head.endswith(".") else (head, "")
+                number = int(frame) + frame_offset
+                # Kept frame numbers keep the padding of their sequence unless re-padded.
+                pad = padding or (len(frame) if frame_padding is None else frame_padding)
+        if remove_ext:
+            ext = ""
+        elif new_ext is not None:
+            ext = new_ext
+
+        if new_name is not None:
+            stem, sep = new_name, dot
+        # Search and Replace if the user is not doing a full name. This options comes second to a full rename.
+        elif find is not None and find in stem:
+            stem = stem.replace(find, replace)
+        if renumber:
+            return f"{prefix}{stem}{sep}{format_frame(frame=number, padding=pad)}{ext}"
+        return f"{prefix}{stem}{ext}"
+    return name_for
+
+
+def plan_names(plan: RenamePlan, names: Sequence[str], start: int) -> List[str]:
+    """Return the new names of files renamed in order.
+
+    Args:
+        plan: Rename options to apply.
+        names: Current file names in renumbering order.
+        start: Renumbering number of the first file.
+    """
+    name_for = compile_plan(plan)
+    paddings = plan_paddings(plan=plan, names=names)
+    return [name_for(name, number, paddings.get(name)) for number, name in enumerate(names, start)]
+
+
+def plan_paddings(plan: RenamePlan, names: Sequence[str]) -> Dict[str, int]:
+    """Return the padding of the image sequence of every file whose frame number is kept, see frame_paddings.
+
+    Note:
+        An unpadded sequence shifted from frame 10 to 9 stays unpadded, where the frame number alone would be padded
+        to 09.
+
+    Args:
+        plan: Rename options to apply.
+        names: Current file names.
+
+    Returns:
+        Padding keyed by file name, empty unless plan keeps frame numbers.
+    """
+    return frame_paddings(names=names) if plan.keep_frames else {}
@@ -0,0 +1,54 @@
+from os import scandir
+from os.path import splitext
+from operator import itemgetter
+from typing import Iterator, List
+
+from .model import PreProcessedData
+
+
+def iter_directory(directory: str) -> Iterator[PreProcessedData]:
+    """Yield a PreProcessedData record for every file found in a directory.
+
+    Note:
+        DirEntry.is_file uses the file type reported by the directory listing, so no extra stat call is made per entry
+        unless the platform does not provide a type (or the entry is a symlink that has to be followed).
+
+    Args:
+        directory: Directory to scan.
+    """
+    with scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                name = entry.name
+                yield PreProcessedData(name=name, path=entry.path, ext=splitext(name)[-1])
+
+
+def scan_directory(directory: str) -> List[PreProcessedData]:
+    """Return PreProcessedData records for all files in a directory sorted by name.
+
+    Args:
+        directory: Directory to scan.
+    """
+    items = list(iter_directory(directory))
+    items.sort(key=itemgetter(0))
+    return items
+
+
+def iter_batches(directory: str, batch_size: int) -> Iterator[List[PreProcessedData]]:
+    """Yield PreProcessedData records for all files in a directory in batches.
+
+    Note:
+        Records are yielded in directory order, callers wanting name order must sort once the scan completes.
+
+    Args:
+        directory: Directory to scan.
+        batch_size: Maximum number of records per batch.
+    """
+    batch = []
+    for item in iter_directory(directory=directory):
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
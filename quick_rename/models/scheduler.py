@@ -0,0 +1,116 @@
+from typing import Container, Iterable, List, Sequence, Tuple
+
+# Temporary names used to break rename cycles, formatted with the name being moved aside and a counter.
+TEMP_FORMAT = "{}.quick_rename_tmp{}"
+
+
+def temp_name(name: str, taken: Container[str]) -> str:
+    """Return a temporary name for a file which is not in taken.
+
+    Args:
+        name: Name of the file moved aside.
+        taken: Names which may not be used.
+    """
+    counter = 0
+    while True:
+        temp = TEMP_FORMAT.format(name, counter or "")
+        if temp not in taken:
+            return temp
+        counter += 1
+
+
+def schedule_renames(renames: Iterable[Tuple[str, str]], taken: Container[str] = ()) -> List[List[Tuple[str, str]]]:
+    """Order a batch of renames so no file is renamed over another file of the batch.
+
+    Note:
+        The batch must be free of conflicts (see models.preflight.find_conflicts), every file then moves to a name which
+        is either free or vacated by another file of the batch. Following those moves gives chains, which are run from
+        the free end backwards, and cycles, which are broken by moving a single file aside to a temporary name. That is
+        the fewest temporary names possible, one per cycle, and the whole batch is ordered in linear time.
+
+    Args:
+        renames: (current name, new name) pairs of the batch, unchanged names are dropped.
+        taken: Names in the directory which temporary names may not use. Current and new names of the batch, and
+            temporary names already handed out, are always avoided.
+
+    Returns:
+        Chains of (current name, new name) steps. Steps of a chain must run in order, chains are independent of each
+        other and may run in any order.
+    """
+    moves = {src: dest for src, dest in renames if src != dest}
+    # Every new name is unique so each name is moved into by at most one file.
+    moved_into = {dest: src for src, dest in moves.items()}
+    chains = []
+    scheduled = set()
+    for end, src in moved_into.items():
+        if end in moves:
+            continue
+        # end is free, walk back to the start of the chain renaming into each name once it has been vacated.
+        chain = []
+        dest = end
+        while src is not None:
+            chain.append((src, dest))
+            scheduled.add(src)
+            dest = src
+            src = moved_into.get(dest)
+        chains.append(chain)
+
+    # Files left over all sit on cycles.
+    temps = set()
+    avoid = _Union(taken, moves, moved_into, temps)
+    for first in moves:
+        if first in scheduled:
+            continue
+        temp = temp_name(name=first, taken=avoid)
+        temps.add(temp)
+        chain = [(first, temp)]
+        scheduled.add(first)
+        dest = first
+        src = moved_into[dest]
+        while src != first:
+            chain.append((src, dest))
+            scheduled.add(src)
+            dest = src
+            src = moved_into[dest]
+        chain.append((temp, dest))
+        chains.append(chain)
+    return chains
+
+
+def flatten(chains: Sequence[Sequence[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+    """Return the steps of scheduled chains in an order they may run one after another.
+
+    Args:
+        chains: Chains returned by schedule_renames.
+    """
+    return [step for chain in chains for step in chain]
+
+
+def net_renames(chains: Iterable[Sequence[Tuple[str, str]]]) -> List[Tuple[str, str]]:
+    """Return the (current name, final name) pair of every file moved by scheduled chains, undoing schedule_renames.
+
+    Note:
+        Temporary names breaking cycles are followed through, so the result can be checked with
+        models.preflight.find_conflicts like any other batch.
+
+    Args:
+        chains: Chains returned by schedule_renames, or by models.journal.resume_steps and rollback_steps.
+    """
+    renames = []
+    for chain in chains:
+        origins = {}
+        for src, dest in chain:
+            origins[dest] = origins.pop(src, src)
+        renames.extend((src, dest) for dest, src in origins.items())
+    return renames
+
+
+class _Union(object):
+    """Membership test over several containers without copying them."""
+    __slots__ = ("_containers",)
+
+    def __init__(self, *containers: Container[str]):
+        self._containers = containers
+
+    def __contains__(self, item: object) -> bool:
+        return any(item in x for x in self._containers)
@@ -0,0 +1,144 @@
+from array import array
+from collections import defaultdict
+from re import compile as re_compile
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Frame number is the last run of digits before the extension, e.g. shot010_comp.0001.exr -> shot010_comp. 0001 .exr
+FRAME_PATTERN = re_compile(r"^(.*?)(\d+)(\.[^.]*)?$")
+
+
+class ImageSequence(NamedTuple):
+    """Files sharing a name and extension and differing only by frame number.
+
+    Attributes:
+        head: Name before the frame number.
+        ext: Extension after the frame number, may be empty.
+        padding: Digits frame numbers are padded to, 0 for frame numbers which are not padded.
+        rows: PreProcessed rows of the frames, in frame order.
+        frames: Frame numbers, matching rows.
+    """
+    head: str
+    ext: str
+    padding: int
+    rows: array
+    frames: array
+
+    @property
+    def label(self) -> str:
+        """Return the sequence as a single name, e.g. shot010_comp.####.exr [1-2400]."""
+        return f"{self.head}{'#' * max(self.padding, 1)}{self.ext} [{self.frames[0]}-{self.frames[-1]}]"
+
+    @property
+    def missing(self) -> int:
+        """Return the number of frames missing between the first and last frame."""
+        return self.frames[-1] - self.frames[0] + 1 - len(self.frames)
+
+
+def parse_frame(name: str) -> Optional[Tuple[str, str, str]]:
+    """Split a file name into head, frame number and extension, None if the name has no frame number.
+
+    Args:
+        name: File name to split.
+    """
+    match = FRAME_PATTERN.match(name)
+    if match is None:
+        return None
+    head, frame, ext = match.groups()
+    if ext is None:
+        # Digits inside the extension, as in clip.mp4, are not a frame number.
+        if "." in head.lstrip("."):
+            return None
+        ext = ""
+    return head, frame, ext
+
+
+def detect_sequences(names: Sequence[str], min_length: int = 2) -> List[ImageSequence]:
+    """Group file names into image sequences in a single pass of the frame pattern.
+
+    Note:
+        Frames of a sequence share their padding. Frame numbers of differing lengths are one unpadded sequence when
+        none of them has a leading zero, otherwise every length is a sequence of its own.
+
+    Args:
+        names: File names indexed by PreProcessed row.
+        min_length: Fewest frames making a sequence.
+
+    Returns:
+        Sequences ordered by their first row.
+    """
+    groups = defaultdict(list)
+    for row, name in enumerate(names):
+        parsed = parse_frame(name)
+        if parsed is None:
+            continue
+        head, frame, ext = parsed
+        groups[head, ext].append((int(frame), row, len(frame), len(frame) > 1 and frame[0] == "0"))
+
+    sequences = []
+    for (head, ext), members in groups.items():
+        if len(members) < min_length:
+            continue
+        lengths = {x[2] for x in members}
+        if len(lengths) == 1:
+            parts = {lengths.pop(): members}
+        elif not any(x[3] for x in members):
+            parts = {0: members}
+        else:
+            parts = defaultdict(list)
+            for member in members:
+                parts[member[2]].append(member)
+        for padding, part in parts.items():
+            if len(part) < min_length:
+                continue
+            part.sort()
+            sequences.append(ImageSequence(head=head, ext=ext, padding=padding, rows=array("l", (x[1] for x in part)),
+                                           frames=array("l", (x[0] for x in part))))
+    sequences.sort(key=lambda x: x.rows[0])
+    return sequences
+
+
+def format_frame(frame: int, padding: int) -> str:
+    """Return a frame number padded with zeros to padding digits, the sign does not count as a digit.
+
+    Args:
+        frame: Frame number to format.
+        padding: Digits to pad to, 0 to not pad.
+    """
+    if frame < 0:
+        return f"-{str(-frame).rjust(padding, '0')}"
+    return str(frame).rjust(padding, "0")
+
+
+def find_gaps(frames: Sequence[int]) -> List[Tuple[int, int]]:
+    """Return the first and last frame of every run of missing frames, in a single pass.
+
+    Args:
+        frames: Frame numbers in ascending order.
+    """
+    return [(frames[i - 1] + 1, frames[i] - 1) for i in range(1, len(frames)) if frames[i] - frames[i - 1] > 1]
+
+
+def format_gaps(gaps: Sequence[Tuple[int, int]], limit: int = 0) -> str:
+    """Return runs of missing frames as a comma separated list of ranges, e.g. 3-4, 6.
+
+    Args:
+        gaps: First and last frame of every run, see find_gaps.
+        limit: Most runs to list, 0 to list every run.
+    """
+    shown = gaps[:limit] if limit else gaps
+    return ", ".join(str(first) if first == last else f"{first}-{last}" for first, last in shown)
+
+
+def frame_paddings(names: Sequence[str]) -> Dict[str, int]:
+    """Return the padding of the sequence every file with a frame number belongs to, see detect_sequences.
+
+    Note:
+        A lone frame is a sequence of its own, padded to the length of its frame number.
+
+    Args:
+        names: File names.
+
+    Returns:
+        Padding keyed by file name, files without a frame number are left out.
+    """
+    return {names[row]: x.padding for x in detect_sequences(names=names, min_length=1) for row in x.rows}
@@ -0,0 +1,66 @@
+from os import stat
+from time import time
+from typing import Iterable, List, Set, Tuple, Optional
+
+from .model import PreProcessedData
+
+# Directory mtimes within this window of the snapshot are not trusted, a change in the same timestamp tick as the scan
+# would otherwise go unnoticed on file systems with coarse mtime resolution.
+RACY_WINDOW_NS = 2 * 10 ** 9
+
+
+def stat_directory(directory: str) -> Tuple[int, int]:
+    """Return the (mtime in nanoseconds, inode) pair identifying the current state of a directory.
+
+    Args:
+        directory: Directory to stat.
+    """
+    st = stat(directory)
+    return st.st_mtime_ns, st.st_ino
+
+
+class DirectorySnapshot(object):
+    """Model holding the file names found by the last scan of a directory."""
+    __slots__ = ("path", "mtime", "inode", "names", "taken")
+
+    def __init__(self, path: str, mtime: int, inode: int, names: Iterable[str], taken: Optional[int] = None):
+        """Initialization of DirectorySnapshot.
+
+        Args:
+            path: Directory scanned.
+            mtime: Modification time of the directory in nanoseconds, taken before the scan started.
+            inode: Inode of the directory, taken before the scan started.
+            names: File names found by the scan.
+            taken: Time in nanoseconds the directory was stat'ed, defaults to now.
+        """
+        self.path = path
+        self.mtime = mtime
+        self.inode = inode
+        self.names = frozenset(names)
+        self.taken = int(time() * 1e9) if taken is None else taken
+
+    def is_current(self) -> bool:
+        """Return if the directory is unchanged since the snapshot was taken."""
+        try:
+            mtime, inode = stat_directory(directory=self.path)
+        except OSError:
+            return False
+        return mtime == self.mtime and inode == self.inode and self.taken - mtime > RACY_WINDOW_NS
+
+    def diff(self, items: Iterable[PreProcessedData]) -> Tuple[List[PreProcessedData], Set[str]]:
+        """Compare a new scan of the directory against the snapshot.
+
+        Args:
+            items: Result of a new scan of the directory.
+
+        Returns:
+            Items missing from the snapshot and names in the snapshot which are no longer present.
+        """
+        names = self.names
+        added = []
+        current = set()
+        for item in items:
+            current.add(item.name)
+            if item.name not in names:
+                added.append(item)
+        return added, set(names - current)
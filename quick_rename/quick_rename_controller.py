@@ -1,20 +1,32 @@
-from typing import Union, Optional, Iterable
-from os import listdir, rename
-from os.path import join, exists
-from shutil import copy
-from re import search
-from collections import defaultdict
-
-from views.messaging_view import Alert, Question
+from typing import Optional, Tuple, Callable, FrozenSet, List, Dict
+from os import remove
+from os.path import basename, join
+from re import error as RegexError
+from functools import partial
+
+from PySide2.QtCore import Qt
+
+from views.messaging_view import Alert, Choice, Question
 from views.quick_rename_view import QuickRenameView
-from models.model import PreProcessed, RenameItem
+from models.model import PreProcessed
+from models.batch import (BackupError, BatchInterrupted, ConflictError, JournalError, NoSpaceError, recover_batch,
+                          run_batch)
+from models.filters import NameFilter, SUBSTRING
+from models.history import forget, list_history, read_inverse, record_batch
+from models.journal import JOURNAL_SUFFIX, Journal, is_running, pending_journals, read_journal, scan_inodes
+from models.preflight import find_conflicts
+from models.preview import Preview, build_preview
+from models.rename_plan import compile_plan
+from models.sequence import find_gaps, format_gaps
+from models.snapshot import DirectorySnapshot, stat_directory
 from controllers.folder_picker_controller import FolderPickerController
-from controllers.file_item_controller import FileItemController
 from controllers.limit_options_controller import LimitOptionsController
 from controllers.file_list_controller import FileListController
 from controllers.rename_options_controller import RenameOptionsController
 from controllers.bottom_buttons_controller import BottomButtonsController
-from widgets.custom_widgets import Item
+from controllers.preview_scheduler import PreviewScheduler
+from workers.preview_worker import PreviewWorker
+from workers.scan_worker import ScanWorker
 from defaults import quick_rename_prefs as prefs
 from defaults import folder_picker_prefs as fp_prefs
 
@@ -34,13 +46,23 @@ class QuickRenameController(object):
         buttons_controller (BottomButtonsController): Controls and provides a buttons view for launching rename process.
         view (QuickRenameView): Main view associated with QuickRename.
         pre_processed (PreProcessed): Model which holds candidate items for renaming.
+        preview_scheduler (PreviewScheduler): Coalesces the many option signals into one preview.
+        _scan_generation (int): Number of the most recent folder scan, batches from older scans are ignored.
+        _scan_workers (list): Folder scans which have not finished yet.
+        _limit_filter (Callable): Predicate applied to PreProcessedData by the limit options, None when not limiting.
+        _limit_exts (frozenset): Extensions files are limited to, None when not limiting by extension.
+        _name_filter (NameFilter): Compiled search limit, None when not limiting by name.
+        _snapshot (DirectorySnapshot): State of the selected folder when it was last scanned, None while scanning.
+        _pending_snapshot (DirectorySnapshot): State of the selected folder when the running scan started.
+        _refresh_items (list): Files found so far by a running refresh, None when the running scan fills the file list.
 
     """
 
     def __init__(self):
+        self.pre_processed = PreProcessed()
         self.folder_picker_controller = FolderPickerController()
         self.limit_controller = LimitOptionsController()
-        self.file_list_controller = FileListController()
+        self.file_list_controller = FileListController(source=self.pre_processed)
         self.rename_controller = RenameOptionsController()
         self.buttons_controller = BottomButtonsController()
 
@@ -50,7 +72,18 @@ class QuickRenameController(object):
                                     options_view=self.rename_controller.view,
                                     buttons_view=self.buttons_controller.view)
 
-        self.pre_processed = PreProcessed()
+        self.preview_scheduler = PreviewScheduler(callback=self.preview, cancel=self.cancel_preview)
+        self._preview_generation = 0
+        self._preview_workers = []
+        self._previewed = None
+        self._scan_generation = 0
+        self._scan_workers = []
+        self._limit_filter = None
+        self._limit_exts = None
+        self._name_filter = None
+        self._snapshot = None
+        self._pending_snapshot = None
+        self._refresh_items = None
         self._configure()
         self._configure_connections()
 
@@ -65,61 +98,116 @@ class QuickRenameController(object):
         """Configure connections to self.views widgets."""
         self.folder_picker_controller.view.file_browser_btn.clicked.connect(self.get_files_from_selected_folder)
         self.folder_picker_controller.view.file_browser_btn.clicked.connect(self.enable_view)
-        self.folder_picker_controller.view.refresh_btn.clicked.connect(self.get_files_from_selected_folder)
-        self.file_list_controller.view.clicked.connect(self.preview)
-
-        self.limit_controller.view.limit_type_cb.toggled.connect(self.get_files_from_selected_folder)
-        self.limit_controller.view.limit_type.editingFinished.connect(self.get_files_from_selected_folder)
-        self.limit_controller.view.search_cb.toggled.connect(self.get_files_from_selected_folder)
-        self.limit_controller.view.search.editingFinished.connect(self.get_files_from_selected_folder)
-
-        self.rename_controller.view.preview_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.change_ext_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.change_ext.editingFinished.connect(self.preview)
-        self.rename_controller.view.remove_ext_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.complete_rename_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.new_name.editingFinished.connect(self.preview)
-        self.rename_controller.view.search_and_replace_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.find.editingFinished.connect(self.preview)
-        self.rename_controller.view.replace.editingFinished.connect(self.preview)
-        self.rename_controller.view.add_prefix_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.prefix.editingFinished.connect(self.preview)
-        self.rename_controller.view.dot_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.renumber_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.start_num.editingFinished.connect(self.preview)
-        self.rename_controller.view.padding.currentIndexChanged.connect(self.preview)
-        self.rename_controller.view.change_ext_cb.stateChanged.connect(self.preview)
-        self.rename_controller.view.change_ext.textEdited.connect(self.preview)
+        self.folder_picker_controller.view.refresh_btn.clicked.connect(self.refresh)
+        self.file_list_controller.view.clicked.connect(self.preview_scheduler.request)
+
+        self.limit_controller.view.limit_type_cb.toggled.connect(self.apply_limits)
+        self.limit_controller.view.limit_type.editingFinished.connect(self.apply_limits)
+        self.limit_controller.view.search_cb.toggled.connect(self.apply_limits)
+        self.limit_controller.view.search.editingFinished.connect(self.apply_limits)
+        self.limit_controller.view.search.textEdited.connect(self.apply_limits)
+        self.limit_controller.view.search_mode.currentIndexChanged.connect(self.apply_limits)
+        self.limit_controller.view.collapse_cb.toggled.connect(self.collapse_sequences)
+
+        self.rename_controller.view.preview_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.change_ext_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.change_ext.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.change_ext.textEdited.connect(self.preview_scheduler.request)
+        self.rename_controller.view.remove_ext_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.complete_rename_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.new_name.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.search_and_replace_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.find.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.replace.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.add_prefix_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.prefix.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.dot_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.renumber_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.start_num.editingFinished.connect(self.preview_scheduler.request)
+        self.rename_controller.view.padding.currentIndexChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.keep_frames_cb.stateChanged.connect(self.preview_scheduler.request)
+        self.rename_controller.view.frame_offset.editingFinished.connect(self.preview_scheduler.request)
 
         self.buttons_controller.view.rename_btn.clicked.connect(self.launch_rename)
+        self.buttons_controller.view.undo_btn.clicked.connect(self.undo_rename)
+
+    def add_rows(self, start: int) -> None:
+        """Add PreProcessed rows to the FileListController, hiding those which do not pass the limit options.
 
-    def add_file(self, file_: object, item: object, idx: int, search_for: Optional[str] = None) -> bool:
-        """Add a current file to the FileListController.
         Args:
-            file_: file name to parse
-            item: Item to add to the ListWidget
-            idx: Index of item to add to the list (this should be a 1 based index)
-            search_for: string of text to search for
+            start: First PreProcessed row to add, every row after it is added too.
         """
-        if search_for is not None and search(search_for, file_.name):
-            self.file_list_controller.add_item(row=idx, col=0, view=item.view)
-            return True
-        else:
-            self.file_list_controller.add_item(row=idx, col=0, view=item.view)
-            return True
-        return False
+        accept = self._limit_filter
+        data = self.pre_processed.data
+        shown = None if accept is None else [accept(data[i]) for i in range(start, len(data))]
+        self.file_list_controller.add_rows(start=start, stop=len(data), shown=shown)
+
+    def add_scanned_batch(self, generation: int, batch: list) -> None:
+        """Receive a batch of files from the ScanWorker.
+
+        Args:
+            generation: Scan the batch belongs to, batches from cancelled scans are ignored.
+            batch: PreProcessedData items found by the scan.
+        """
+        if generation != self._scan_generation:
+            return None
+        if self._refresh_items is not None:
+            # Refreshes are patched into PreProcessed once the whole folder is known, see finish_refresh.
+            self._refresh_items.extend(batch)
+            return None
+        start = self.pre_processed.count()
+        self.pre_processed.add_items(items=batch)
+        self.add_rows(start=start)
+
+    def apply_limits(self) -> None:
+        """Show only the already scanned items which pass the current limit options.
+
+        Note:
+            Filtering is evaluated against PreProcessed, the folder is not scanned again.
+        """
+        if self.folder_picker_controller.get_dir_set():
+            self.update_limit_filter()
+            self.update_visible()
+            self.preview_scheduler.request()
+
+    def build_limit_filter(self) -> Optional[Callable]:
+        """Return a predicate accepting PreProcessedData which pass the limit options, None if nothing is limited."""
+        exts, name_filter = self._limit_exts, self._name_filter
+        if exts is None and name_filter is None:
+            return None
+
+        def accept(item) -> bool:
+            return (exts is None or item.ext.lower() in exts) and (name_filter is None or name_filter(item.name))
+        return accept
+
+    def cancel_preview(self) -> None:
+        """Abandon any preview being computed, its result is ignored if it still arrives."""
+        self._preview_generation += 1
+        self._previewed = None
+        for worker in self._preview_workers:
+            worker.cancel()
+
+    def cancel_scan(self) -> None:
+        """Stop any running folder scan."""
+        for worker in self._scan_workers:
+            worker.cancel()
+
+    def collapse_sequences(self) -> None:
+        """Show image sequences as a single row, or every frame, following the limit options."""
+        if self.folder_picker_controller.get_dir_set():
+            self.update_sequences()
+            self.preview_scheduler.request()
 
     def collect_folder_items(self) -> None:
-        """Collect all valid items found in the selected folder."""
+        """Start collecting all valid items found in the selected folder on a worker thread."""
         directory = self.folder_picker_controller.base_dir()
         if directory and directory != fp_prefs.SELECT_DIR:
-            dir_list = listdir(directory)
-            dir_list.sort()
-            for cur_file in dir_list:
-                self.pre_processed.add_item(item=cur_file, directory=directory)
-        else:
-            msg = Alert(title=fp_prefs.INVALID_FOLDER, message=fp_prefs.SELECT_DIR_MSG)
-            msg.exec_()
+            self._snapshot = None
+            self._refresh_items = None
+            if self.start_scan(directory=directory):
+                return None
+        msg = Alert(title=fp_prefs.INVALID_FOLDER, message=fp_prefs.SELECT_DIR_MSG)
+        msg.exec_()
 
     def enable_view(self) -> None:
         """Enable view."""
@@ -129,117 +217,457 @@ class QuickRenameController(object):
             self.rename_controller.set_enable()
             self.buttons_controller.set_enable()
 
+    def finish_scan(self, generation: int, completed: bool, error: str) -> None:
+        """Sort collected items once the ScanWorker is done and refresh the preview.
+
+        Args:
+            generation: Scan which finished.
+            completed: If the whole folder was scanned.
+            error: Error which stopped the scan, empty if none did.
+        """
+        if generation != self._scan_generation:
+            return None
+        if error:
+            directory = self._pending_snapshot.path
+            msg = Alert(title=prefs.SCAN_FAILED, message=prefs.SCAN_FAILED_MSG.format(directory, error))
+            msg.exec_()
+        if not completed:
+            self._refresh_items = None
+            return None
+        if self._refresh_items is not None:
+            self.finish_refresh()
+            return None
+        self.file_list_controller.remap(remap=self.pre_processed.sort())
+        self.file_list_controller.sort()
+        self.update_sequences()
+        self.update_visible()
+        pending = self._pending_snapshot
+        self._snapshot = DirectorySnapshot(path=pending.path, mtime=pending.mtime, inode=pending.inode,
+                                           names=(x.name for x in self.pre_processed.data), taken=pending.taken)
+        self.preview_scheduler.request()
+
     def get_files_from_selected_folder(self) -> None:
         """Collect items from directory."""
         if self.folder_picker_controller.get_dir_set():
             self.pre_processed.clear()
             self.file_list_controller.clear()
-            self.collect_folder_items()
             self.file_list_controller.set_header_labels()
+            self.update_limit_filter()
+            self.collect_folder_items()
+
+    def get_limits(self) -> Tuple[Optional[FrozenSet[str]], Optional[str]]:
+        """Return the extensions and search string files are limited to, None when a limit is not in use."""
+        do_search = self.limit_controller.search()
+        do_limit = self.limit_controller.limit()
+        if self.limit_controller.is_default_file_type(value=self.limit_controller.limit_to()):
+            do_limit = False
+        search_for = self.limit_controller.search_for()
+        if self.limit_controller.is_default_search_value(value=search_for):
+            do_search = False
+        return self.limit_controller.get_extension() if do_limit else None, search_for if do_search else None
+
+    def check_pending(self, base_dir: str) -> bool:
+        """Return if no earlier batch is left in base_dir, offering to resume or roll back interrupted ones.
 
-            do_search = self.limit_controller.search()
-            do_limit = self.limit_controller.limit()
-            if self.limit_controller.is_default_file_type(value=self.limit_controller.limit_to()):
-                do_limit = False
-            search_for = self.limit_controller.search_for()
-            if self.limit_controller.is_default_search_value(value=search_for):
-                do_search = False
-
-            ext_check = self.limit_controller.get_extension()
-            self.file_list_controller.set_row_count(rows=self.pre_processed.count(ext=ext_check if do_limit else None))
-
-            column_idx = 0
-            for cur_file in self.pre_processed.data:
-                # Construct a FileItemController. This will be sent to the FileListView.
-                item_controller = FileItemController(label=cur_file.name)
-                search_for = search_for if do_search else None
-                result = False
-                if do_limit:
-                    if cur_file.ext == ext_check:
-                        result = self.add_file(search_for=search_for, file_=cur_file, item=item_controller, idx=column_idx)
-                else:
-                    result = self.add_file(search_for=search_for, file_=cur_file, item=item_controller, idx=column_idx)
-                if result:
-                    column_idx += 1
-            self.preview()
+        Note:
+            Renaming while a batch is running, or was left for later, could rename over its files, so nothing is
+            renamed in base_dir until it is finished or rolled back. The command line refuses the same way.
+
+        Args:
+            base_dir: Base directory end user has selected.
+        """
+        pending = [x for x in pending_journals(journal_dir=prefs.JOURNAL_DIR, running=True) if x.directory == base_dir]
+        if not pending:
+            return True
+        if any(is_running(path=x.path) for x in pending):
+            msg = Alert(title=prefs.RECOVER, message=prefs.RUNNING_MSG.format(base_dir))
+            msg.exec_()
+            return False
+        for journal in pending:
+            count = sum(len(x) for x in journal.chains)
+            self.recover_journal(journal=journal, message=prefs.PENDING_MSG.format(count, base_dir))
+        # Recovered files change the folder, the end user is shown it again before renaming.
+        self.refresh()
+        return False
 
     def launch_rename(self) -> None:
         """Main method for renaming files."""
+        # Make sure the checks below see the same state the end user has just been shown.
+        self.preview_scheduler.flush()
         base_dir = self.folder_picker_controller.base_dir()
         checked_items = self.file_list_controller.get_checked_files()
         if not self.validate_rename(base_dir=base_dir, checked_items=checked_items):
             return None
+        if not self.check_pending(base_dir=base_dir):
+            return None
+
+        preview = self.rename_preview(base_dir=base_dir, checked_items=checked_items)
+        if preview is None:
+            return None
+        data = self.pre_processed.data
+        renames = [(data[row].name, dest) for row, dest in preview.names.items()]
+        listing = self.preflight_rename(base_dir=base_dir, rows=list(preview.names), renames=renames)
+        if listing is None:
+            return None
 
         if Question(title=prefs.RENAME_FILES, message=prefs.RENAME_FILES_MSG):
-            cur_num = self.rename_controller.start_num()
-            base_dir = self.folder_picker_controller.base_dir()
-            for i, item in enumerate(checked_items):
-                old = join(base_dir, item.name)
-                if self.rename_controller.do_backup():
-                    backup_name = join(self.folder_picker_controller.get_backup_dir(), item.name)
-                    copy(old, backup_name)
-
-                new = join(base_dir, self.rename_controller.configure_name(item_name=item.name, pad_number=cur_num))
-                if not exists(new):
-                    rename(old, new)
-                cur_num += 1
+            batch = self.run_batch(base_dir=base_dir, renames=renames, listing=listing,
+                                   backup=self.rename_controller.do_backup(),
+                                   deduplicate=self.rename_controller.do_deduplicate())
+            if batch is not None:
+                try:
+                    record_batch(history_dir=prefs.HISTORY_DIR, name=batch, directory=base_dir, renames=renames,
+                                 max_bytes=prefs.HISTORY_MAX_BYTES)
+                except OSError as err:
+                    msg = Alert(title=prefs.HISTORY_FAILED,
+                                message=prefs.HISTORY_FAILED_MSG.format(prefs.HISTORY_DIR, err))
+                    msg.exec_()
+
+            self.refresh()
+
+    def preflight_rename(self, base_dir: str, rows: Optional[List[int]], renames: List[Tuple[str, str]],
+                         message: str = prefs.CONFLICTS_MSG) -> Optional[Dict[str, int]]:
+        """Check every file is still in the folder and none would take a name already in use, before renaming.
 
-            self.get_files_from_selected_folder()
+        Args:
+            base_dir: Base directory end user has selected.
+            rows: PreProcessed rows being renamed, matching renames, missing and conflicting rows are highlighted.
+                None to not highlight.
+            renames: (current name, new name) pairs of the batch.
+            message: Message shown with the number of conflicts.
+
+        Returns:
+            Inodes of the entries in the directory keyed by name, None if the rename should not go ahead.
+        """
+        try:
+            listing = dict(scan_inodes(directory=base_dir))
+        except OSError:
+            msg = Alert(title=prefs.INVALID_FOLDER, message=prefs.INVALID_FOLDER_MSG)
+            msg.exec_()
+            return None
+        conflicts = find_conflicts(renames=renames, listing=listing)
+        if conflicts:
+            if rows is not None:
+                self.file_list_controller.set_invalid(rows=(rows[i] for i in conflicts))
+            msg = Alert(title=prefs.CONFLICTS, message=message.format(len(conflicts)))
+            msg.exec_()
+            return None
+        return listing
 
     def preview(self) -> bool:
-        """Display a preview of outcome of the renaming configuration against files marked for renaming."""
-        self.file_list_controller.clear_preview_column()
-        self.file_list_controller.set_header_labels()
-        for item in self.file_list_controller.all_items():
-            item.set_invalid(state=False)
-        if self.rename_controller.do_preview():
-            base_dir = self.folder_picker_controller.base_dir()
-            checked_items = self.file_list_controller.get_checked_files()
-            # Validate rename requires are correct before attempting to preview. Do not check that items are actually
-            # checked, we only want to do that when we perform the actual rename.
-            if not self.validate_rename(base_dir=base_dir, checked_items=checked_items, require_checked=False):
-                return False
-
-            preview_items = defaultdict(list)
-            self.collect_renamed_preview_items(checked_items=checked_items,
-                                               container=preview_items,
-                                               start=self.rename_controller.start_num())
-            if self.find_duplicate_preview_items(container=preview_items):
-                msg = Alert(title=prefs.DUPLICATES, message=prefs.DUPLICATES_MSG)
-                msg.exec_()
-                return False
+        """Display a preview of outcome of the renaming configuration against files marked for renaming.
+
+        Note:
+            The preview column is filled by the FileListView as rows are painted. Every new name is computed and
+            checked for duplicates by a PreviewWorker, see finish_preview.
+        """
+        self.cancel_preview()
+        self.file_list_controller.clear_invalid()
+        if not self.rename_controller.do_preview():
+            self.file_list_controller.clear_preview_column()
+            return True
+
+        base_dir = self.folder_picker_controller.base_dir()
+        checked_items = self.file_list_controller.get_checked_files()
+        # Validate rename requires are correct before attempting to preview. Do not check that items are actually
+        # checked, we only want to do that when we perform the actual rename.
+        if not self.validate_rename(base_dir=base_dir, checked_items=checked_items, require_checked=False):
+            self.file_list_controller.clear_preview_column()
+            return False
+
+        start = self.rename_controller.start_num()
+        plan = self.rename_controller.get_plan()
+        # Names painted right away are computed on demand, the worker fills in the rest.
+        self.file_list_controller.set_preview(func=compile_plan(plan), start=start)
+        if not checked_items:
+            return True
 
-            for item in (v[0] for v in preview_items.values()):
-                self.file_list_controller.view.model.setItem(item.row, item.col, item.dest)
+        data = self.pre_processed.data
+        worker = PreviewWorker(plan=plan, start=start, rows=checked_items,
+                               names=[data[x].name for x in checked_items], generation=self._preview_generation)
+        worker.preview_ready.connect(self.finish_preview, Qt.QueuedConnection)
+        worker.finished.connect(partial(self._preview_workers.remove, worker), Qt.QueuedConnection)
+        worker.finished.connect(worker.deleteLater)
+        # Hold a reference until the thread finishes, Qt aborts if a running QThread is garbage collected.
+        self._preview_workers.append(worker)
+        worker.start()
         return True
 
-    @staticmethod
-    def find_duplicate_preview_items(container: Iterable) -> bool:
-        """Iterate all potential rename items and validate that no duplicate items are present.
+    def finish_preview(self, generation: int, result: Preview) -> None:
+        """Apply a preview computed by a PreviewWorker.
+
+        Args:
+            generation: Preview the result belongs to, results made stale by later changes are ignored.
+            result: New names and duplicates of the checked files.
+        """
+        if generation != self._preview_generation:
+            return None
+        if result.duplicates:
+            self.file_list_controller.clear_preview_column()
+            self.file_list_controller.set_invalid(rows=result.duplicates)
+            msg = Alert(title=prefs.DUPLICATES, message=prefs.DUPLICATES_MSG)
+            msg.exec_()
+            return None
+        self.file_list_controller.set_preview(func=compile_plan(result.plan), start=result.start, names=result.names)
+        # Kept so launch_rename renames exactly what was shown without computing the names again.
+        self._previewed = self.folder_picker_controller.base_dir(), result
+
+    def rename_preview(self, base_dir: str, checked_items: List[int]) -> Optional[Preview]:
+        """Return the new names of the checked files, reusing the last preview if nothing changed since.
+
+        Args:
+            base_dir: Base directory end user has selected.
+            checked_items: PreProcessed rows to rename, in renumbering order.
+
+        Returns:
+            Preview, None if files would share a new name.
+        """
+        plan = self.rename_controller.get_plan()
+        start = self.rename_controller.start_num()
+        if self._previewed is not None:
+            previewed_dir, preview = self._previewed
+            if previewed_dir == base_dir and preview.matches(plan=plan, start=start, rows=checked_items):
+                return preview
+
+        data = self.pre_processed.data
+        preview = build_preview(plan=plan, start=start, rows=checked_items, names=[data[x].name for x in checked_items])
+        if preview.duplicates:
+            self.file_list_controller.set_invalid(rows=preview.duplicates)
+            msg = Alert(title=prefs.DUPLICATES, message=prefs.DUPLICATES_MSG)
+            msg.exec_()
+            return None
+        return preview
+
+    def run_batch(self, base_dir: str, renames: List[Tuple[str, str]], listing: Dict[str, int],
+                  backup: bool = False, deduplicate: bool = False) -> Optional[str]:
+        """Journal then run a batch of renames which passed preflight_rename, see models.batch.run_batch.
+
+        Args:
+            base_dir: Base directory end user has selected.
+            renames: (current name, new name) pairs of the batch.
+            listing: Inodes of the entries in the directory keyed by name, as returned by preflight_rename.
+            backup: Copy the files to the backup folder first.
+            deduplicate: Keep the backups in the deduplicated backup store.
 
         Note:
-            If duplicated items are found their source Item will be highlighted red.
+            If renaming stops part way the end user is offered to resume or roll back the batch right away.
+
+        Returns:
+            Name identifying the batch, None if it was not renamed or was rolled back.
+        """
+        backup_root = join(base_dir, prefs.BACKUP_DIR) if backup else None
+        store_root = join(backup_root, prefs.BACKUP_STORE_DIR) if backup and deduplicate else None
+        try:
+            return run_batch(directory=base_dir, renames=renames, listing=listing, journal_dir=prefs.JOURNAL_DIR,
+                             backup_root=backup_root, store_root=store_root,
+                             workers=self.rename_controller.workers())
+        except ConflictError as err:
+            msg = Alert(title=prefs.CONFLICTS, message=prefs.CONFLICTS_MSG.format(len(err.conflicts)))
+        except NoSpaceError:
+            msg = Alert(title=prefs.BACKUP_FAILED, message=prefs.BACKUP_SPACE_MSG.format(base_dir))
+        except BackupError as err:
+            msg = Alert(title=prefs.BACKUP_FAILED, message=str(err))
+        except JournalError as err:
+            msg = Alert(title=prefs.JOURNAL_FAILED, message=prefs.JOURNAL_FAILED_MSG.format(prefs.JOURNAL_DIR, err))
+        except BatchInterrupted as err:
+            try:
+                journal = read_journal(path=err.journal)
+            except OSError as read_err:
+                msg = Alert(title=prefs.RECOVER_FAILED, message=str(read_err))
+            else:
+                choice = self.recover_journal(journal=journal, message=prefs.INTERRUPTED_MSG.format(base_dir, err))
+                return basename(err.journal)[:-len(JOURNAL_SUFFIX)] if choice == prefs.RESUME else None
+        except OSError as err:
+            msg = Alert(title=prefs.RENAME_FAILED, message=prefs.RENAME_FAILED_MSG.format(err))
+        msg.exec_()
+        return None
+
+    def finish_refresh(self) -> None:
+        """Patch files added to or removed from the folder since the last scan into PreProcessed and the file list."""
+        items, self._refresh_items = self._refresh_items, None
+        added, removed = self._snapshot.diff(items=items)
+        if removed:
+            self.file_list_controller.remap(remap=self.pre_processed.remove_items(names=removed))
+        if added:
+            start = self.pre_processed.count()
+            self.pre_processed.add_items(items=added)
+            self.add_rows(start=start)
+            self.file_list_controller.remap(remap=self.pre_processed.sort())
+        self.update_sequences()
+        pending = self._pending_snapshot
+        self._snapshot = DirectorySnapshot(path=pending.path, mtime=pending.mtime, inode=pending.inode,
+                                           names=(x.name for x in items), taken=pending.taken)
+        self.preview_scheduler.request()
+
+    def refresh(self) -> None:
+        """Bring the file list up to date with the selected folder.
+
+        Note:
+            If the folder is unchanged since the last scan nothing is done, otherwise the folder is scanned again by a
+            ScanWorker and only files which were added or removed are patched in, see finish_refresh.
+        """
+        if not self.folder_picker_controller.get_dir_set():
+            return None
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.path != self.folder_picker_controller.base_dir():
+            self.get_files_from_selected_folder()
+            return None
+        if snapshot.is_current():
+            return None
+
+        self._refresh_items = []
+        if not self.start_scan(directory=snapshot.path):
+            self.get_files_from_selected_folder()
+
+    def recover_journal(self, journal: Journal, message: str) -> Optional[str]:
+        """Offer to resume or roll back an interrupted batch.
 
         Args:
-            container: Iterable holding potential rename candidates.
+            journal: Interrupted batch.
+            message: Message asking the end user what to do.
+
+        Returns:
+            prefs.RESUME or prefs.ROLLBACK once done, None if the batch was left for later or could not be recovered.
         """
-        duplicates_found = False
-        for k, v in container.items():
-            if len(v) > 1:
-                duplicates_found = True
-                for item in v:
-                    item.src.set_invalid(state=True)
-        return duplicates_found
-
-    def collect_renamed_preview_items(self, checked_items: Iterable, container: dict, start: int) -> None:
-        """Iterate through checked file_item_views and create a preview RenameItem."""
-        for i, item in enumerate(checked_items):
-            name = self.rename_controller.configure_name(item_name=item.name, pad_number=i + start)
-            container[name].append(RenameItem(row=item.row(), col=1, name=name, src=item, dest=Item(label=name)))
+        choice = Choice(title=prefs.RECOVER, message=message,
+                        choices=(prefs.RESUME, prefs.ROLLBACK, prefs.IGNORE)).choose()
+        if choice not in (prefs.RESUME, prefs.ROLLBACK):
+            return None
+        try:
+            recover_batch(journal=journal, resume=choice == prefs.RESUME, workers=self.rename_controller.workers())
+        except BlockingIOError:
+            msg = Alert(title=prefs.RECOVER_FAILED, message=prefs.RUNNING_MSG.format(journal.directory))
+        except ConflictError as err:
+            msg = Alert(title=prefs.RECOVER_FAILED, message=prefs.RECOVER_CONFLICTS_MSG.format(
+                len(err.conflicts), journal.directory, err.conflicts[0][1]))
+        except OSError as err:
+            msg = Alert(title=prefs.RECOVER_FAILED, message=str(err))
+        else:
+            return choice
+        msg.exec_()
+        return None
+
+    def recover_renames(self) -> None:
+        """Offer to resume or roll back renames which were interrupted, found from their journals."""
+        for journal in pending_journals(journal_dir=prefs.JOURNAL_DIR):
+            if not journal.planned:
+                # The plan was never fully written, so no file was renamed.
+                try:
+                    remove(journal.path)
+                except OSError:
+                    pass
+                continue
+            count = sum(len(x) for x in journal.chains)
+            self.recover_journal(journal=journal, message=prefs.RECOVER_MSG.format(count, journal.directory))
+        self.refresh()
 
     def show(self) -> None:
-        """Show current QuickRenameView."""
+        """Show current QuickRenameView, then offer to recover interrupted renames."""
         self.view.show()
+        self.recover_renames()
+
+    def undo_rename(self) -> None:
+        """Undo the last rename made in the selected folder, renaming every file of the batch back in one pass."""
+        if not self.folder_picker_controller.get_dir_set():
+            return None
+        base_dir = self.folder_picker_controller.base_dir()
+        entries = list_history(history_dir=prefs.HISTORY_DIR, directory=base_dir)
+        if not entries:
+            msg = Alert(title=prefs.NOTHING_TO_UNDO, message=prefs.NOTHING_TO_UNDO_MSG)
+            msg.exec_()
+            return None
+        entry = entries[0]
+        choice = Choice(title=prefs.UNDO, message=prefs.UNDO_MSG.format(entry.count, base_dir),
+                        choices=(prefs.UNDO, prefs.CANCEL)).choose()
+        if choice != prefs.UNDO or not self.check_pending(base_dir=base_dir):
+            return None
+
+        self.preview_scheduler.flush()
+        try:
+            renames = read_inverse(entry=entry)
+        except (OSError, ValueError) as err:
+            msg = Alert(title=prefs.HISTORY_FAILED, message=str(err))
+            msg.exec_()
+            return None
+        # Files changed since the batch ran may block the undo, nothing is renamed back unless all of it can be.
+        listing = self.preflight_rename(base_dir=base_dir, rows=None, renames=renames, message=prefs.UNDO_CONFLICTS_MSG)
+        if listing is None:
+            return None
+        if self.run_batch(base_dir=base_dir, renames=renames, listing=listing) is not None:
+            try:
+                forget(entry=entry)
+            except OSError as err:
+                msg = Alert(title=prefs.HISTORY_FAILED,
+                            message=prefs.FORGET_FAILED_MSG.format(prefs.HISTORY_DIR, err))
+                msg.exec_()
+        self.refresh()
+
+    def start_scan(self, directory: str) -> bool:
+        """Scan a folder on a worker thread, stopping any running scan, see add_scanned_batch and finish_scan.
+
+        Args:
+            directory: Folder to scan.
+
+        Returns:
+            If the scan started, False when the folder could not be read.
+        """
+        self.cancel_scan()
+        # Stat before scanning so changes made while the scan runs are picked up by the next refresh.
+        try:
+            mtime, inode = stat_directory(directory=directory)
+        except OSError:
+            return False
+        self._pending_snapshot = DirectorySnapshot(path=directory, mtime=mtime, inode=inode, names=())
+        self._scan_generation += 1
+        worker = ScanWorker(directory=directory, generation=self._scan_generation)
+        worker.batch_ready.connect(self.add_scanned_batch, Qt.QueuedConnection)
+        worker.scan_finished.connect(self.finish_scan, Qt.QueuedConnection)
+        worker.finished.connect(partial(self._scan_workers.remove, worker), Qt.QueuedConnection)
+        worker.finished.connect(worker.deleteLater)
+        # Hold a reference until the thread finishes, Qt aborts if a running QThread is garbage collected.
+        self._scan_workers.append(worker)
+        worker.start()
+        return True
+
+    def update_limit_filter(self) -> None:
+        """Compile the current limit options, used to filter files until the options change again."""
+        self._limit_exts, search_for = self.get_limits()
+        self._name_filter = None
+        if search_for is not None:
+            try:
+                self._name_filter = NameFilter(pattern=search_for, mode=self.limit_controller.search_mode())
+            except RegexError:
+                # Incomplete patterns are common while typing, match them literally.
+                self._name_filter = NameFilter(pattern=search_for, mode=SUBSTRING)
+        self._limit_filter = self.build_limit_filter()
+
+    def update_sequences(self) -> None:
+        """Collapse image sequences found in PreProcessed into a single row when the limit options ask for it."""
+        groups = None
+        if self.limit_controller.collapse():
+            groups = {}
+            for x in self.pre_processed.sequences():
+                if not x.missing:
+                    groups[x.rows[0]] = (x.label, x.rows, None)
+                    continue
+                gaps = find_gaps(frames=x.frames)
+                tooltip = prefs.MISSING_FRAMES_TIP.format(format_gaps(gaps=gaps, limit=prefs.MISSING_FRAMES_RANGES))
+                if len(gaps) > prefs.MISSING_FRAMES_RANGES:
+                    tooltip += prefs.MISSING_FRAMES_MORE.format(len(gaps) - prefs.MISSING_FRAMES_RANGES)
+                groups[x.rows[0]] = (prefs.MISSING_FRAMES.format(x.label, x.missing), x.rows, tooltip)
+        self.file_list_controller.set_groups(groups=groups)
+
+    def update_visible(self) -> None:
+        """Hide rows in the FileListController which do not pass the current limit filter."""
+        rows = None
+        if self._limit_filter is not None:
+            # Walk only the rows with a matching extension, found through the PreProcessed extension index.
+            data = self.pre_processed.data
+            exts = self._limit_exts
+            rows = range(len(data)) if exts is None else self.pre_processed.indices(ext=exts)
+            if self._name_filter is not None:
+                rows = [rows[i] for i in self._name_filter.apply(names=[data[x].name for x in rows])]
+        self.file_list_controller.set_visible(rows=rows)
 
     def validate_rename(self, base_dir: str, checked_items: list, require_checked: Optional[bool] = True) -> bool:
         """Validate that renaming options are valid before previewing or renaming.
@@ -260,7 +688,7 @@ class QuickRenameController(object):
             return False
 
         if all([self.rename_controller.do_rename(),
-                self.file_list_controller.get_checked_files_count() > 1,
+                len(checked_items) > 1,
                 not self.rename_controller.do_renumber()]):
             msg = Alert(title=prefs.MISCONFIGURATION, message=prefs.RENUMBER_MSG)
             msg.exec_()
@@ -271,7 +699,6 @@ class QuickRenameController(object):
 if __name__ == "__main__":
     from sys import argv
     from PySide2.QtWidgets import QApplication
-    from PySide2.QtCore import Qt
 
     app = QApplication(argv)
     app.setAttribute(Qt.AA_EnableHighDpiScaling)
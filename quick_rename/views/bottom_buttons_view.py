@@ -8,11 +8,14 @@ class BottomButtonsView(QWidget):
     def __init__(self):
         super(BottomButtonsView, self).__init__()
         self.layout = QHBoxLayout()
+        self.undo_btn = QPushButton(prefs.UNDO)
         self.rename_btn = QPushButton(prefs.RENAME)
         self._configure()
 
     def _configure(self) -> None:
         """Configure the current BottomButtonsView."""
+        self.undo_btn.setToolTip(prefs.UNDO_TOOLTIP)
+        self.layout.addWidget(self.undo_btn)
         self.layout.addWidget(self.rename_btn)
         self.setLayout(self.layout)
 
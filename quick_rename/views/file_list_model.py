@@ -0,0 +1,418 @@
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide2.QtGui import QColor, QFont
+
+from models.bitset import BitSet
+from defaults import file_list_prefs as prefs
+from defaults import file_item_prefs as item_prefs
+
+
+class FileListModel(QAbstractTableModel):
+    """Table model serving file names straight from PreProcessed.
+
+    Note:
+        Rows are only indexes into PreProcessed.data (data rows). Nothing is allocated per file other than an entry in
+        the row arrays and a bit in the check state, so the view only pays for the rows it actually paints.
+        Preview names are computed in data() for the rows being painted and memoized until the rename options, check
+        states or row order change.
+        Image sequences may be collapsed into the row of their first frame, checking that row checks every frame.
+        A collapsed row is shown while any of its frames passes the filter and stands for only the frames passing it.
+
+    Attributes:
+        source (PreProcessed): Items shown by the model.
+    """
+
+    def __init__(self, source: object):
+        """Initialization of FileListModel.
+
+        Args:
+            source: PreProcessed holding the items shown by the model.
+        """
+        super(FileListModel, self).__init__()
+        self.source = source
+        self._headers = list(prefs.HEADERS)
+        self._rows = array("l")
+        self._shown = None
+        self._visible = array("l")
+        self._checked = BitSet()
+        self._invalid = set()
+        self._preview = {}
+        self._preview_func = None
+        self._preview_start = 0
+        self._ordinals = None
+        self._groups = {}
+        self._labels = {}
+        self._tooltips = {}
+        self._group_of = {}
+        self._invalid_color = QColor(item_prefs.COLOR_INVALID)
+        self._invalid_font = QFont()
+        self._invalid_font.setWeight(QFont.Bold)
+        self._invalid_font.setItalic(True)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of visible rows."""
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Return number of columns."""
+        return 0 if parent.isValid() else prefs.ITEM_COLS
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """Return data for a cell, the file name in the first column and the preview name in the second."""
+        if not index.isValid():
+            return None
+        row = self._visible[index.row()]
+        if index.column() == 0:
+            if role == Qt.DisplayRole:
+                return self._labels.get(row) or self.source.data[row].name
+            if role == Qt.ToolTipRole:
+                return self._tooltips.get(row)
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked else Qt.Unchecked
+            if row in self._invalid:
+                if role == Qt.ForegroundRole:
+                    return self._invalid_color
+                if role == Qt.FontRole:
+                    return self._invalid_font
+            return None
+        if role == Qt.DisplayRole:
+            return self.preview_name(row=row)
+        if role == Qt.ForegroundRole:
+            return self._invalid_color
+        if role == Qt.FontRole:
+            return self._invalid_font
+        return None
+
+    def flags(self, index: QModelIndex) -> int:
+        """Return item flags, only the file column is checkable."""
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable | Qt.ItemIsDropEnabled
+        return flags
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole) -> object:
+        """Return header labels."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole) -> bool:
+        """Store the check state of a file."""
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        row = self._visible[index.row()]
+        if value == Qt.Checked:
+            self._checked.add(row)
+        else:
+            self._checked.discard(row)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        # Checking a row shifts the renumbering of every checked row after it.
+        self._invalidate_preview()
+        return True
+
+    def supportedDropActions(self) -> int:
+        """Rows are moved internally when reordering for renumbering."""
+        return Qt.MoveAction | Qt.CopyAction
+
+    def append_rows(self, start: int, stop: int, shown: Optional[Sequence[bool]] = None) -> None:
+        """Append data rows to the end of the model.
+
+        Args:
+            start: First data row to append.
+            stop: Data row to stop before.
+            shown: Per data row, if it passes the current filter. All rows are shown when None.
+        """
+        new_rows = range(start, stop)
+        self._rows.extend(new_rows)
+        if shown is not None and self._shown is None:
+            self._shown = bytearray(b"\x01") * start
+        if self._shown is not None:
+            self._shown.extend(bytearray(b"\x01") * len(new_rows) if shown is None else bytearray(shown))
+            visible = [x for x in new_rows if self._shown[x]]
+        else:
+            visible = new_rows
+        if visible:
+            first = len(self._visible)
+            self.beginInsertRows(QModelIndex(), first, first + len(visible) - 1)
+            self._visible.extend(visible)
+            self.endInsertRows()
+
+    def checked_rows(self) -> List[int]:
+        """Return checked, visible, data rows in display order, with the visible frames of collapsed sequences."""
+        checked = self._checked
+        if not len(checked):
+            return []
+        groups = self._groups
+        if not groups:
+            return [x for x in self._visible if x in checked]
+        rows = []
+        for x in self._visible:
+            if x in checked:
+                members = groups.get(x)
+                if members is None:
+                    rows.append(x)
+                else:
+                    rows.extend(self._shown_members(row=x))
+        return rows
+
+    def clear(self) -> None:
+        """Remove all rows from the model."""
+        self.beginResetModel()
+        self._rows = array("l")
+        self._shown = None
+        self._visible = array("l")
+        self._checked.clear()
+        self._invalid = set()
+        self._preview = {}
+        self._preview_func = None
+        self._ordinals = None
+        self._groups = {}
+        self._labels = {}
+        self._tooltips = {}
+        self._group_of = {}
+        self.endResetModel()
+
+    def clear_invalid(self) -> None:
+        """Remove invalid highlighting from all rows."""
+        if self._invalid:
+            self._invalid = set()
+            self._emit_column_changed(column=0)
+
+    def clear_preview(self) -> None:
+        """Remove all preview names."""
+        if self._preview_func is not None:
+            self._preview_func = None
+            self._invalidate_preview()
+
+    def move_rows(self, rows: Iterable[int], target: int) -> None:
+        """Move visible rows so they sit before the target row.
+
+        Args:
+            rows: Visible rows to move.
+            target: Visible row to drop before, rows are moved to the end if out of range.
+        """
+        moved = [self._visible[x] for x in sorted(set(rows))]
+        if not moved:
+            return None
+        moving = set(moved)
+        anchor = None
+        for x in self._visible[target:]:
+            if x not in moving:
+                anchor = x
+                break
+        ordered = array("l")
+        for x in self._rows:
+            if x == anchor:
+                ordered.extend(moved)
+            if x not in moving:
+                ordered.append(x)
+        if anchor is None:
+            ordered.extend(moved)
+        self.beginResetModel()
+        self._rows = ordered
+        self._update_visible()
+        self.endResetModel()
+        self._invalidate_preview()
+
+    def remap(self, remap: Sequence[int]) -> None:
+        """Follow data rows being reordered or removed in PreProcessed.
+
+        Args:
+            remap: New data row of every previous data row, -1 for removed rows.
+        """
+        self.beginResetModel()
+        # Sequences are found again once rows settle.
+        self._expand_groups()
+        self._rows = array("l", (remap[x] for x in self._rows if remap[x] >= 0))
+        self._checked = BitSet(values=(remap[x] for x in self._checked if remap[x] >= 0))
+        self._invalid = {remap[x] for x in self._invalid if remap[x] >= 0}
+        if self._shown is not None:
+            shown = bytearray(len(self.source.data))
+            for old, new in enumerate(remap):
+                if new >= 0 and self._shown[old]:
+                    shown[new] = 1
+            self._shown = shown
+        self._update_visible()
+        self.endResetModel()
+        self._invalidate_preview()
+
+    def set_groups(self, groups: Optional[Dict[int, Tuple[str, Sequence[int], Optional[str]]]]) -> None:
+        """Collapse groups of data rows, such as image sequences, into a single row.
+
+        Note:
+            A collapsed row is checked if every row of its group was checked. Expanding a group gives every row of the
+            group the check state of the collapsed row.
+
+        Args:
+            groups: Label, data rows and tooltip, or None, of every group keyed by the data row shown for the group,
+                which must be the first row of the group. Every group is expanded when None.
+        """
+        if not groups and not self._groups:
+            return None
+        self.beginResetModel()
+        self._expand_groups()
+        if groups:
+            checked = self._checked
+            self._groups = {x: members for x, (label, members, tooltip) in groups.items()}
+            self._labels = {x: label for x, (label, members, tooltip) in groups.items()}
+            self._tooltips = {x: tooltip for x, (label, members, tooltip) in groups.items() if tooltip}
+            self._group_of = {y: x for x, members in self._groups.items() for y in members}
+            for x, members in self._groups.items():
+                if all(y in checked for y in members):
+                    checked.add(x)
+                else:
+                    checked.discard(x)
+            group_of = self._group_of
+            self._rows = array("l", (x for x in self._rows if group_of.get(x, x) == x))
+            self._invalid.update([group_of[x] for x in self._invalid if x in group_of])
+        self._update_visible()
+        self.endResetModel()
+        self._invalidate_preview()
+
+    def set_headers(self, labels: Sequence[str]) -> None:
+        """Set header labels.
+
+        Args:
+            labels: Labels applied to header.
+        """
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def set_invalid(self, rows: Iterable[int]) -> None:
+        """Highlight data rows as invalid.
+
+        Args:
+            rows: Data rows to highlight.
+        """
+        rows = list(rows)
+        self._invalid.update(rows)
+        if self._group_of:
+            # Highlight the collapsed row of invalid frames.
+            self._invalid.update([self._group_of[x] for x in rows if x in self._group_of])
+        self._emit_column_changed(column=0)
+
+    def set_preview(self, func: Callable[[str, int], str], start: int, names: Optional[Dict[int, str]] = None) -> None:
+        """Show preview names, computed on demand for the rows being painted.
+
+        Args:
+            func: Returns the new name of a file given its current name and its renumbering number.
+            start: Renumbering number of the first checked row.
+            names: Preview names already computed, keyed by data row.
+        """
+        self._preview_func = func
+        self._preview_start = start
+        self._invalidate_preview()
+        if names:
+            self._preview.update(names)
+
+    def preview_name(self, row: int) -> Optional[str]:
+        """Return the preview name of a data row, None if it is not being renamed.
+
+        Note:
+            Collapsed rows preview the new names of their first and last visible rows.
+
+        Args:
+            row: Data row to preview.
+        """
+        if row in self._groups:
+            members = self._shown_members(row=row)
+            if not members:
+                return None
+            first = self._preview_row(row=members[0])
+            last = self._preview_row(row=members[-1])
+            return None if first is None else prefs.GROUP_PREVIEW.format(first, last)
+        return self._preview_row(row=row)
+
+    def _preview_row(self, row: int) -> Optional[str]:
+        """Return the preview name of a single data row, None if it is not being renamed."""
+        name = self._preview.get(row)
+        if name is None and self._preview_func is not None and self._group_of.get(row, row) in self._checked:
+            if self._ordinals is None:
+                self._ordinals = {x: i for i, x in enumerate(self.checked_rows())}
+            ordinal = self._ordinals.get(row)
+            if ordinal is not None:
+                name = self._preview[row] = self._preview_func(self.source.data[row].name,
+                                                               self._preview_start + ordinal)
+        return name
+
+    def set_visible(self, rows: Optional[Iterable[int]]) -> None:
+        """Show only the given data rows.
+
+        Args:
+            rows: Data rows passing the current filter, all rows are shown when None.
+        """
+        if rows is None:
+            shown = None
+        else:
+            shown = bytearray(len(self.source.data))
+            for x in rows:
+                shown[x] = 1
+        self.beginResetModel()
+        self._shown = shown
+        self._update_visible()
+        self.endResetModel()
+        self._invalidate_preview()
+
+    def sort_rows(self) -> None:
+        """Order rows as they are ordered in PreProcessed."""
+        self.beginResetModel()
+        self._rows = array("l", sorted(self._rows))
+        self._update_visible()
+        self.endResetModel()
+        self._invalidate_preview()
+
+    def _emit_column_changed(self, column: int) -> None:
+        """Tell views every cell of a column changed, only visible cells are repainted."""
+        if self._visible:
+            self.dataChanged.emit(self.index(0, column), self.index(len(self._visible) - 1, column))
+
+    def _expand_groups(self) -> None:
+        """Put rows of collapsed groups back after the row shown for them, passing its check state on."""
+        groups = self._groups
+        if not groups:
+            return None
+        checked = self._checked
+        rows = array("l")
+        for x in self._rows:
+            members = groups.get(x)
+            if members is None:
+                rows.append(x)
+                continue
+            rows.extend(members)
+            if x in checked:
+                for y in members:
+                    checked.add(y)
+            else:
+                for y in members:
+                    checked.discard(y)
+        self._rows = rows
+        self._groups = {}
+        self._labels = {}
+        self._tooltips = {}
+        self._group_of = {}
+
+    def _invalidate_preview(self) -> None:
+        """Forget memoized preview names and renumbering order, visible rows are recomputed when repainted."""
+        self._preview = {}
+        self._ordinals = None
+        self._emit_column_changed(column=1)
+
+    def _shown_members(self, row: int) -> Sequence[int]:
+        """Return the data rows of the group collapsed into a data row which pass the filter."""
+        members = self._groups[row]
+        shown = self._shown
+        return members if shown is None else [x for x in members if shown[x]]
+
+    def _update_visible(self) -> None:
+        """Rebuild visible rows from display ordered rows and the filter, collapsed rows show if any member passes."""
+        shown = self._shown
+        if shown is None:
+            self._visible = self._rows[:]
+            return None
+        groups = self._groups
+        self._visible = array("l", (x for x in self._rows
+                                    if shown[x] or (x in groups and any(shown[y] for y in groups[x]))))
@@ -1,9 +1,8 @@
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from PySide2.QtWidgets import QAbstractItemView, QHeaderView, QTableView
-from PySide2.QtGui import  QStandardItemModel
 from PySide2.QtCore import Qt
 
-from controllers.file_item_controller import FileItemController
+from views.file_list_model import FileListModel
 from defaults import file_list_prefs as prefs
 
 
@@ -12,23 +11,23 @@ class FileListView(QTableView):
     CustomTable which inherits the QTableView Class.
 
     Notes:
-        This implementation fixes an apparent issue with the QTableView where if you drag and drop internally
-        The dragged item when dropped would overwrite the item it was dropped on and leave a hole in the table
-        where the dragged item originates from.
+        Internal drag and drop is handled in dropEvent by reordering rows in the model, rather than letting the
+        QTableView overwrite the item the drag was dropped on and leave a hole where the dragged item originates from.
 
     Attributes:
-        model (QStandardItemModel): Model associated with FileListView.
+        model (FileListModel): Model associated with FileListView.
         header (QHeaderView): Header associated with FileListView.
-        controller (FileItemController): View controller for FileListView.
+        controller (FileListController): View controller for FileListView.
     """
-    def __init__(self, controller: object):
+    def __init__(self, controller: object, source: object):
         """Init method for FileListView.
 
         Args:
             controller: View controller for FileListView.
+            source: PreProcessed holding the items shown in the view.
         """
         super(FileListView, self).__init__()
-        self.model = QStandardItemModel(prefs.ITEM_ROWS, prefs.ITEM_COLS)
+        self.model = FileListModel(source=source)
         self.header = self.horizontalHeader()
         self.controller = controller
 
@@ -39,7 +38,6 @@ class FileListView(QTableView):
         self.setModel(self.model)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.verticalHeader().hide()
-        self.model.setHorizontalHeaderLabels(prefs.HEADERS)
         self.setAlternatingRowColors(True)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setMinimumHeight(prefs.MIN_HEIGHT)
@@ -49,71 +47,54 @@ class FileListView(QTableView):
         self.setDragDropOverwriteMode(False)
         self.setDefaultDropAction(Qt.MoveAction)
         self.setDragDropMode(QAbstractItemView.InternalMove)
-
-        self.verticalHeader().setSectionsMovable(True)
-        self.verticalHeader().setDragEnabled(True)
-        self.verticalHeader().setDragDropMode(QAbstractItemView.InternalMove)
+        # Rows share one height so the view never has to measure rows it is not painting.
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         self.header.setSectionResizeMode(QHeaderView.Stretch)
 
     def dropEvent(self, event) -> None:
         """Implementation of dropEvent to handle how we need to drop the item."""
-        # The QTableWidget from which selected rows will be moved
-        drop_row = self.model.itemFromIndex(self.indexAt(event.pos())).row()
-        # Move item.
-        for data in (x for x in event.source().selected_items() if x.text() and x.column() == 0):
-            new_item = FileItemController(label=data.text())
-            new_item.set_check_state(check_state=data.checkState())
-            self.model.insertRow(drop_row, new_item.view)
+        index = self.indexAt(event.pos())
+        drop_row = index.row() if index.isValid() else self.model.rowCount()
+        self.model.move_rows(rows=(x.row() for x in self.selectionModel().selectedRows()), target=drop_row)
+        self.clearSelection()
+        # The rows have already been moved, report a copy so the view does not remove the dragged rows afterwards.
+        event.setDropAction(Qt.CopyAction)
         event.accept()
 
-    def selected_items(self) -> List[object]:
-        """Returns a list of selected items.
+    def append_rows(self, start: int, stop: int, shown: Optional[Sequence[bool]] = None) -> None:
+        """Append PreProcessed rows to the end of the model.
 
-        Note:
-            This is helper method we are adding to specifically help PySide know what is selected for drag and drop
-            functionality.
+        Args:
+            start: First PreProcessed row to append.
+            stop: PreProcessed row to stop before.
+            shown: Per row, if it passes the current filter.
         """
-        selected_rows = []
-        for index in self.selectedIndexes():
-            item = self.model.itemFromIndex(index)
-            for selected in selected_rows:
-                if selected.text() == item.text():
-                    break
-            else:
-                selected_rows.append(item)
-        return selected_rows
-
-    def all_items(self) -> Iterable:
-        """Yield all file items from the file list column (first column)."""
-        # Walk through the available rows and collect the items. Only collect items which are valid.
-        for i in range(self.model.rowCount()):
-            item = self.model.item(i, 0)
-            if item:
-                yield item
+        self.model.append_rows(start=start, stop=stop, shown=shown)
 
     def clear(self) -> None:
         """Clear the model."""
         self.model.clear()
 
+    def clear_invalid(self) -> None:
+        """Remove invalid highlighting from all rows."""
+        self.model.clear_invalid()
+
     def clear_preview(self) -> None:
         """Clear items in the preview column."""
-        # Walk through the rows and del all items found in the second column
-        for i in range(self.model.rowCount()):
-            item = self.model.takeItem(i, 1)
-            if item:
-                del item
-        # Remove the preview column and then re-add a column. If we do not do this The View does not always refresh and
-        # remove the items.
-        self.model.removeColumn(1)
-        self.model.setColumnCount(2)
-
-    def get_checked_rows(self) -> Iterable:
-        """Yield all rows in self.model and return checked items."""
-        for i in range(self.model.rowCount()):
-            item = self.model.item(i, 0)
-            if item.checked():
-                yield item
+        self.model.clear_preview()
+
+    def get_checked_rows(self) -> List[int]:
+        """Return the PreProcessed rows of all visible, checked, items in display order."""
+        return self.model.checked_rows()
+
+    def remap(self, remap: Sequence[int]) -> None:
+        """Follow rows being reordered or removed in PreProcessed.
+
+        Args:
+            remap: New row of every previous row, -1 for removed rows.
+        """
+        self.model.remap(remap=remap)
 
     def set_disabled(self) -> None:
         """Disable View."""
@@ -123,27 +104,48 @@ class FileListView(QTableView):
         """Enable View."""
         self.setEnabled(True)
 
+    def set_groups(self, groups: Optional[Dict[int, Tuple[str, Sequence[int], Optional[str]]]]) -> None:
+        """Collapse groups of rows, such as image sequences, into a single row.
+
+        Args:
+            groups: Label, PreProcessed rows and tooltip, or None, of every group keyed by its first row, None to expand
+                every group.
+        """
+        self.model.set_groups(groups=groups)
+
     def set_header_labels(self, labels: List[str]) -> None:
         """Set header labels in view.
 
         labels: Labels applied to header.
         """
-        self.model.setHorizontalHeaderLabels(labels)
+        self.model.set_headers(labels=labels)
+
+    def set_invalid(self, rows: Iterable[int]) -> None:
+        """Highlight rows as invalid.
+
+        Args:
+            rows: PreProcessed rows to highlight.
+        """
+        self.model.set_invalid(rows=rows)
 
-    def set_item(self, row: int, col: int, item: object) -> None:
-        """Add a FileItemView to the model.
+    def set_preview(self, func: Callable[[str, int], str], start: int, names: Optional[Dict[int, str]] = None) -> None:
+        """Show preview names in the preview column, computed as rows are painted.
 
         Args:
-            row: Row to add item to.
-            col: Column to add item to.
-            item: Item to add to model.
+            func: Returns the new name of a file given its current name and its renumbering number.
+            start: Renumbering number of the first checked row.
+            names: Preview names already computed, keyed by PreProcessed row.
         """
-        self.model.setItem(row, col, item)
+        self.model.set_preview(func=func, start=start, names=names)
 
-    def set_row_count(self, rows: int) -> None:
-        """Set number of rows in view.
+    def set_visible(self, rows: Optional[Iterable[int]]) -> None:
+        """Show only the given rows.
 
         Args:
-            rows: Number of rows in view.
+            rows: PreProcessed rows to show, if None all rows are shown.
         """
-        self.model.setRowCount(rows)
+        self.model.set_visible(rows=rows)
+
+    def sort_items(self) -> None:
+        """Order rows as they are ordered in PreProcessed."""
+        self.model.sort_rows()
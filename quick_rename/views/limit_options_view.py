@@ -1,6 +1,8 @@
-from PySide2.QtWidgets import QWidget, QCheckBox, QLineEdit, QVBoxLayout, QHBoxLayout, QSpacerItem, QFrame, QLabel
+from PySide2.QtWidgets import (QWidget, QCheckBox, QLineEdit, QVBoxLayout, QHBoxLayout, QSpacerItem, QFrame, QLabel,
+                               QComboBox)
 from PySide2.QtCore import Qt
 
+from models.filters import MODES
 from defaults import limit_options_prefs as prefs
 
 
@@ -16,6 +18,8 @@ class LimitOptionsView(QWidget):
         limit_type (QLineEdit): File type to limit to.
         search_cb (QCheckBox): CheckBox which controls if the view should limit by a search word.
         search (QLineEdit): Word to search for when renaming.
+        search_mode (QComboBox): How search is matched against file names, see models.filters.MODES.
+        collapse_cb (QCheckBox): CheckBox which controls if image sequences are shown as a single row.
     """
     def __init__(self):
         super(LimitOptionsView, self).__init__()
@@ -27,6 +31,8 @@ class LimitOptionsView(QWidget):
         self.limit_type = QLineEdit(prefs.LIMIT_DEFAULT)
         self.search_cb = QCheckBox(prefs.SEARCH)
         self.search = QLineEdit(prefs.SEARCH_DEFAULT)
+        self.search_mode = QComboBox()
+        self.collapse_cb = QCheckBox(prefs.COLLAPSE)
 
         self._configure()
 
@@ -36,12 +42,18 @@ class LimitOptionsView(QWidget):
         self.layout.setAlignment(Qt.AlignLeft)
         self.limit_type_cb.setToolTip(prefs.LIMIT_TOOLTIP)
         self.search_cb.setToolTip(prefs.SEARCH_TOOLTIP)
+        self.search_mode.setToolTip(prefs.SEARCH_MODE_TOOLTIP)
+        self.search_mode.addItems(MODES)
+        self.collapse_cb.setToolTip(prefs.COLLAPSE_TOOLTIP)
 
         self.frame_layout.addWidget(self.limit_type_cb)
         self.frame_layout.addWidget(self.limit_type)
         self.frame_layout.addSpacerItem(QSpacerItem(*prefs.ITEM_SPACING))
         self.frame_layout.addWidget(self.search_cb)
         self.frame_layout.addWidget(self.search)
+        self.frame_layout.addWidget(self.search_mode)
+        self.frame_layout.addSpacerItem(QSpacerItem(*prefs.ITEM_SPACING))
+        self.frame_layout.addWidget(self.collapse_cb)
         self.layout.addWidget(self.title)
         self.layout.addWidget(self.frame)
         self.setLayout(self.layout)
@@ -59,8 +71,8 @@ class LimitOptionsView(QWidget):
         self.limit_type.setEnabled(True)
 
     def enable_search(self) -> None:
-        """Enable limit type functionality."""
-        self.limit_type.setEnabled(True)
+        """Enable search functionality."""
+        self.search.setEnabled(True)
 
     def get_limit_type(self) -> str:
         """Return the limit type."""
@@ -74,6 +86,14 @@ class LimitOptionsView(QWidget):
         """Return the search value."""
         return str(self.search.text())
 
+    def get_search_mode(self) -> str:
+        """Return how the search value is matched."""
+        return str(self.search_mode.currentText())
+
+    def get_do_collapse(self) -> bool:
+        """Return if the end user wants image sequences shown as a single row."""
+        return self.collapse_cb.isChecked()
+
     def get_do_search(self) -> bool:
         """Return if the end user wants to limit files by a search."""
         return self.search_cb.isChecked()
@@ -1,3 +1,5 @@
+from typing import Optional, Sequence
+
 from PySide2.QtWidgets import QMessageBox
 from PySide2.QtCore import Qt
 
@@ -44,3 +46,24 @@ class Alert(Message):
         super(Alert, self).__init__(title=title, message=message)
         self.setIcon(QMessageBox.Information)
         self.setStandardButtons(QMessageBox.Ok)
+
+
+class Choice(Message):
+    """A Messaging widget asking end user to pick one of several actions."""
+
+    def __init__(self, title: str, message: str, choices: Sequence[str]):
+        """Initialization of Choice Messaging View.
+
+        Args:
+            title: Title applied to Message.
+            message: Message to display.
+            choices: Label of a button per action.
+        """
+        super(Choice, self).__init__(title=title, message=message)
+        self.setIcon(QMessageBox.Question)
+        self._buttons = {self.addButton(x, QMessageBox.AcceptRole): x for x in choices}
+
+    def choose(self) -> Optional[str]:
+        """Show the message and return the label of the button pressed, None if closed without choosing."""
+        self.exec_()
+        return self._buttons.get(self.clickedButton())
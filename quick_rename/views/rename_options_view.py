@@ -16,12 +16,15 @@ class RenameOptionsView(QWidget):
         complete_rename_h_layout (QHBoxLayout): Layout holding complete rename options.
         search_and_replace_h_layout (QHBoxLayout): Layout holding search and replace options.
         renumber_h_layout (QHBoxLayout): Layout holding renumber options.
+        keep_frames_h_layout (QHBoxLayout): Layout holding frame number options.
         remove_ext_h_layout (QHBoxLayout): Layout holding remove options.
         change_ext_h_layout (QHBoxLayout): Layout holding change extension options.
         create_backup_h_layout (QHBoxLayout): Layout holding backup options.
         preview_h_layout (QHBoxLayout): Layout holding preview options.
         start_lbl (QLabel): Label for renumbering start.
         padding_lbl (QLabel): Label for renumbering padding.
+        frame_offset_lbl (QLabel): Label for frame offset.
+        workers_lbl (QLabel): Label for workers.
         add_prefix_cb (QCheckBox): Used to signify the user wants to add a prefix to the renaming.
         prefix (QLineEdit): prefix to add.
         complete_rename_cb (QCheckBox): Used to signify the user wants to completely rename the file.
@@ -33,8 +36,12 @@ class RenameOptionsView(QWidget):
         start_num (QSpinBox): Number to start with when renumbering files.
         padding (QComboBox): Padding to apply to renaming when renumbering files.
         dot_cb (QCheckBox): When checked a dot will be used to separate the renumber from the name.
+        keep_frames_cb (QCheckBox): Used to signify the user wants to keep the frame numbers of files when renumbering.
+        frame_offset (QSpinBox): Frames to shift kept frame numbers by.
         remove_ext_cb (QCheckBox): Used to signify the user wants to remove extensions when renaming.
         backup_files_cb (QCheckBox): Used to signify the user wants to backup old files before renaming.
+        deduplicate_cb (QCheckBox): Used to signify the user wants backups kept in the deduplicated backup store.
+        workers (QSpinBox): Files renamed and backed up at the same time.
         change_ext_cb (QCheckBox): Used to signify the user wants to change the extension while renaming.
         change_ext (QLineEdit): New extension to add to the renamed file.
         preview_cb (QCheckBox): Used to signify the user wants to preview the rename before renaming.
@@ -49,12 +56,15 @@ class RenameOptionsView(QWidget):
         self.complete_rename_h_layout = QHBoxLayout()
         self.search_and_replace_h_layout = QHBoxLayout()
         self.renumber_h_layout = QHBoxLayout()
+        self.keep_frames_h_layout = QHBoxLayout()
         self.remove_ext_h_layout = QHBoxLayout()
         self.change_ext_h_layout = QHBoxLayout()
         self.create_backup_h_layout = QHBoxLayout()
         self.preview_h_layout = QHBoxLayout()
         self.start_lbl = QLabel(prefs.START_NUM)
         self.padding_lbl = QLabel(prefs.PADDING)
+        self.frame_offset_lbl = QLabel(prefs.FRAME_OFFSET)
+        self.workers_lbl = QLabel(prefs.WORKERS)
         self.add_prefix_cb = QCheckBox(prefs.PREFIX)
         self.prefix = QLineEdit(prefs.PREFIX_DEFAULT)
         self.complete_rename_cb = QCheckBox(prefs.COMPLETE_RENAME)
@@ -66,8 +76,12 @@ class RenameOptionsView(QWidget):
         self.start_num = QSpinBox()
         self.padding = QComboBox()
         self.dot_cb = QCheckBox(prefs.USE_DOT)
+        self.keep_frames_cb = QCheckBox(prefs.KEEP_FRAMES)
+        self.frame_offset = QSpinBox()
         self.remove_ext_cb = QCheckBox(prefs.REMOVE_EXT)
         self.backup_files_cb = QCheckBox(prefs.BACKUP)
+        self.deduplicate_cb = QCheckBox(prefs.DEDUPLICATE)
+        self.workers = QSpinBox()
         self.change_ext_cb = QCheckBox(prefs.CHANGE_EXT)
         self.change_ext = QLineEdit(prefs.CHANGE_EXT_DEFAULT)
         self.preview_cb = QCheckBox(prefs.PREVIEW)
@@ -110,11 +124,23 @@ class RenameOptionsView(QWidget):
         self.dot_cb.setChecked(True)
         self.dot_cb.setMinimumWidth(prefs.DOT_WIDTH)
         self.dot_cb.setMaximumWidth(prefs.DOT_WIDTH)
+        self.keep_frames_cb.setToolTip(prefs.KEEP_FRAMES_TOOLTIP)
+        self.keep_frames_cb.setDisabled(True)
+        self.frame_offset.setToolTip(prefs.FRAME_OFFSET_TOOLTIP)
+        self.frame_offset.setDisabled(True)
+        self.frame_offset.setRange(-prefs.FRAME_OFFSET_MAX, prefs.FRAME_OFFSET_MAX)
+        self.frame_offset.setValue(prefs.FRAME_OFFSET_DEFAULT)
+        self.frame_offset.setMinimumWidth(prefs.FRAME_OFFSET_MIN_WIDTH)
         self.remove_ext_cb.setToolTip(prefs.REMOVE_EXT_TOOLTIP)
         self.change_ext.setToolTip(prefs.CHANGE_EXT_TOOLTIP)
         self.change_ext.setDisabled(True)
         self.backup_files_cb.setToolTip(prefs.BACKUP_TOOLTIP)
         self.backup_files_cb.setChecked(True)
+        self.deduplicate_cb.setToolTip(prefs.DEDUPLICATE_TOOLTIP)
+        self.workers.setToolTip(prefs.WORKERS_TOOLTIP)
+        self.workers.setRange(1, prefs.WORKERS_MAX)
+        self.workers.setValue(prefs.WORKERS_DEFAULT)
+        self.workers.setMinimumWidth(prefs.WORKERS_MIN_WIDTH)
         self.preview_cb.setToolTip(prefs.PREVIEW_TOOLTIP)
         self.preview_cb.setChecked(True)
 
@@ -142,6 +168,13 @@ class RenameOptionsView(QWidget):
         self.renumber_h_layout.addWidget(self.dot_cb)
         self.frame_layout.addLayout(self.renumber_h_layout)
 
+        self.keep_frames_h_layout.addSpacerItem(QSpacerItem(*prefs.SPACER_SIZE))
+        self.keep_frames_h_layout.addWidget(self.keep_frames_cb)
+        self.keep_frames_h_layout.addStretch(1)
+        self.keep_frames_h_layout.addWidget(self.frame_offset_lbl)
+        self.keep_frames_h_layout.addWidget(self.frame_offset)
+        self.frame_layout.addLayout(self.keep_frames_h_layout)
+
         self.change_ext_h_layout.addWidget(self.change_ext_cb)
         self.change_ext_h_layout.addWidget(self.change_ext)
         self.frame_layout.addLayout(self.change_ext_h_layout)
@@ -150,6 +183,10 @@ class RenameOptionsView(QWidget):
         self.frame_layout.addLayout(self.remove_ext_h_layout)
 
         self.create_backup_h_layout.addWidget(self.backup_files_cb)
+        self.create_backup_h_layout.addWidget(self.deduplicate_cb)
+        self.create_backup_h_layout.addStretch(1)
+        self.create_backup_h_layout.addWidget(self.workers_lbl)
+        self.create_backup_h_layout.addWidget(self.workers)
         self.frame_layout.addLayout(self.create_backup_h_layout)
 
         self.preview_h_layout.addWidget(self.preview_cb)
@@ -167,6 +204,14 @@ class RenameOptionsView(QWidget):
         """Disable dot checkbox."""
         self.dot_cb.setDisabled(True)
 
+    def disable_frame_offset(self) -> None:
+        """Disable frame offset."""
+        self.frame_offset.setDisabled(True)
+
+    def disable_keep_frames(self) -> None:
+        """Disable keep frames checkbox."""
+        self.keep_frames_cb.setDisabled(True)
+
     def disable_find(self) -> None:
         """Disable find."""
         self.find.setDisabled(True)
@@ -200,6 +245,14 @@ class RenameOptionsView(QWidget):
         """Enable dot checkbox."""
         self.dot_cb.setEnabled(True)
 
+    def enable_frame_offset(self) -> None:
+        """Enable frame offset."""
+        self.frame_offset.setEnabled(True)
+
+    def enable_keep_frames(self) -> None:
+        """Enable keep frames checkbox."""
+        self.keep_frames_cb.setEnabled(True)
+
     def enable_find(self) -> None:
         """Enable find."""
         self.find.setEnabled(True)
@@ -236,6 +289,10 @@ class RenameOptionsView(QWidget):
         """Return if end user wants to backup files."""
         return self.backup_files_cb.isChecked()
 
+    def get_do_deduplicate(self) -> bool:
+        """Return if end user wants backups kept in the deduplicated backup store."""
+        return self.deduplicate_cb.isChecked()
+
     def get_change_ext(self) -> bool:
         """Return if the change extension checkbox is checked."""
         return self.change_ext_cb.isChecked()
@@ -263,6 +320,10 @@ class RenameOptionsView(QWidget):
             return False
         return result
 
+    def get_do_keep_frames(self) -> bool:
+        """Return if the end user wants to keep frame numbers when renumbering."""
+        return self.keep_frames_cb.isChecked()
+
     def get_do_padding(self) -> bool:
         """Return if the end user wants to add padding."""
         return False if self.get_padding() == 0 else True
@@ -310,6 +371,10 @@ class RenameOptionsView(QWidget):
         """Return new_name value."""
         return str(self.new_name.text())
 
+    def get_frame_offset(self) -> int:
+        """Return frame offset from view."""
+        return int(self.frame_offset.value())
+
     def get_padding(self) -> int:
         """Return the current padding value."""
         return int(self.padding.currentText())
@@ -334,6 +399,10 @@ class RenameOptionsView(QWidget):
         """Return start number from view."""
         return int(self.start_num.value())
 
+    def get_workers(self) -> int:
+        """Return how many files end user wants renamed and backed up at the same time."""
+        return int(self.workers.value())
+
     def set_change_ext_style(self, style: str) -> None:
         """Set style of change extension.
 
@@ -1,8 +1,5 @@
 from typing import Union
 from PySide2.QtWidgets import QFileDialog
-from PySide2.QtGui import QStandardItem, QColor, QFont
-
-from defaults import file_item_prefs as prefs
 
 
 class FileDirectoryDialog(QFileDialog):
@@ -26,16 +23,3 @@ class FileDirectoryDialog(QFileDialog):
         result = self.getExistingDirectory()
         return str(result) if result else None
 
-
-class Item(QStandardItem):
-    """A QStandardItem with a bold font applied."""
-    def __init__(self, label):
-        """Initialization of the StandardItem."""
-        super(Item, self).__init__()
-        self.setText(label)
-        self.setCheckable(False)
-        self.setForeground(QColor(prefs.COLOR_INVALID))
-        font = QFont()
-        font.setWeight(QFont.Bold)
-        font.setItalic(True)
-        self.setFont(font)
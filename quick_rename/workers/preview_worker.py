@@ -0,0 +1,52 @@
+from typing import Sequence
+
+from PySide2.QtCore import QThread, Signal
+
+from models.preview import build_preview
+from models.rename_plan import RenamePlan
+
+
+class PreviewWorker(QThread):
+    """Thread which computes the new names of the checked files.
+
+    Note:
+        Receivers should connect using Qt.QueuedConnection so the preview is applied on the GUI thread. Call cancel to
+        abandon the preview, nothing is emitted once cancelled.
+
+    Attributes:
+        preview_ready (Signal): Emitted with the preview generation and a models.preview.Preview.
+    """
+    preview_ready = Signal(int, object)
+
+    def __init__(self, plan: RenamePlan, start: int, rows: Sequence[int], names: Sequence[str], generation: int):
+        """Initialization of PreviewWorker.
+
+        Args:
+            plan: Rename options to apply.
+            start: Renumbering number of the first file.
+            rows: PreProcessed rows of the checked files, in renumbering order.
+            names: Current names of the checked files, matching rows.
+            generation: Number identifying this preview, emitted with the result so stale previews can be ignored.
+        """
+        super(PreviewWorker, self).__init__()
+        self._plan = plan
+        self._start = start
+        self._rows = rows
+        self._names = names
+        self._generation = generation
+
+    @property
+    def generation(self) -> int:
+        """Number identifying this preview."""
+        return self._generation
+
+    def cancel(self) -> None:
+        """Request the preview stops."""
+        self.requestInterruption()
+
+    def run(self) -> None:
+        """Compute the preview, emitting preview_ready unless cancelled."""
+        result = build_preview(plan=self._plan, start=self._start, rows=self._rows, names=self._names,
+                               interrupted=self.isInterruptionRequested)
+        if result is not None and not self.isInterruptionRequested():
+            self.preview_ready.emit(self._generation, result)
@@ -0,0 +1,57 @@
+from PySide2.QtCore import QThread, Signal
+
+from models.scanner import iter_batches
+from defaults import quick_rename_prefs as prefs
+
+
+class ScanWorker(QThread):
+    """Thread which scans a directory and emits the files found in batches.
+
+    Note:
+        Receivers should connect using Qt.QueuedConnection so batches are handled on the GUI thread. Call cancel to stop
+        the scan, the current batch is finished first.
+
+    Attributes:
+        batch_ready (Signal): Emitted with the scan generation and a list of PreProcessedData.
+        scan_finished (Signal): Emitted with the scan generation, whether the whole directory was scanned and the error
+            which stopped the scan, empty if none did.
+    """
+    batch_ready = Signal(int, object)
+    scan_finished = Signal(int, bool, str)
+
+    def __init__(self, directory: str, generation: int, batch_size: int = prefs.SCAN_BATCH_SIZE):
+        """Initialization of ScanWorker.
+
+        Args:
+            directory: Directory to scan.
+            generation: Number identifying this scan, emitted with every batch so stale batches can be ignored.
+            batch_size: Number of files sent per batch.
+        """
+        super(ScanWorker, self).__init__()
+        self._directory = directory
+        self._generation = generation
+        self._batch_size = batch_size
+
+    @property
+    def generation(self) -> int:
+        """Number identifying this scan."""
+        return self._generation
+
+    def cancel(self) -> None:
+        """Request the scan stops."""
+        self.requestInterruption()
+
+    def run(self) -> None:
+        """Scan the directory, emitting batch_ready per batch and scan_finished once done."""
+        completed = True
+        error = ""
+        try:
+            for batch in iter_batches(directory=self._directory, batch_size=self._batch_size):
+                if self.isInterruptionRequested():
+                    completed = False
+                    break
+                self.batch_ready.emit(self._generation, batch)
+        except OSError as err:
+            completed = False
+            error = str(err)
+        self.scan_finished.emit(self._generation, completed, error)
@@ -0,0 +1,66 @@
+from pytest import mark
+
+
+@mark.parametrize("link", [True, False])
+def test_backup_file(tmp_path, link):
+    """Test that backups hold the file contents whatever the strategy."""
+    from quick_rename.models.backup import COPY, COPY_RANGE, LINK, REFLINK, backup_file
+    src = tmp_path / "plate.exr"
+    src.write_bytes(b"\x00\x01" * 100000)
+    strategy = backup_file(src=str(src), dest=str(tmp_path / "backup.exr"), link=link)
+    assert strategy in ((LINK,) if link else (REFLINK, COPY_RANGE, COPY))
+    assert (tmp_path / "backup.exr").read_bytes() == src.read_bytes()
+
+
+def test_backup_fallback(tmp_path, monkeypatch):
+    """Test that a streaming copy is made when nothing cheaper is available."""
+    from quick_rename.models import backup
+    monkeypatch.setattr(backup, "CAN_REFLINK", False)
+    monkeypatch.setattr(backup, "CAN_COPY_RANGE", False)
+    (tmp_path / "plate.exr").write_text("plate")
+    strategy = backup.backup_file(src=str(tmp_path / "plate.exr"), dest=str(tmp_path / "backup.exr"), link=False)
+    assert strategy == backup.COPY
+    assert (tmp_path / "backup.exr").read_text() == "plate"
+
+
+def test_backup_session(tmp_path):
+    """Test that sessions get their own folder and list every file backed up in their manifest."""
+    from json import loads
+    from quick_rename.models.backup import MANIFEST, BackupSession
+    for name in ("a.exr", "b.exr"):
+        (tmp_path / name).write_text(name)
+    sessions = [BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup")) for _ in range(2)]
+    for session in sessions:
+        with session:
+            assert session.has_space(names=["a.exr", "b.exr"])
+            session.backup(name="a.exr")
+            session.backup(name="b.exr")
+    assert sessions[0].path != sessions[1].path and sorted(x.path for x in sessions) == [x.path for x in sessions]
+    with open(f"{sessions[0].path}/{MANIFEST}", encoding="utf-8") as manifest:
+        records = [loads(x) for x in manifest]
+    assert records[0][2] == str(tmp_path)
+    assert [x[1] for x in records[1:]] == ["a.exr", "b.exr"] and [x[3] for x in records[1:]] == [5, 5]
+
+
+def test_required_bytes(tmp_path):
+    """Test that only files which cannot be hard linked need space."""
+    from quick_rename.models.backup import BackupSession
+    (tmp_path / "a.exr").write_bytes(b"a" * 100)
+    linked = BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup"))
+    copied = BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup"), link=False)
+    assert linked.required_bytes(names=["a.exr"]) == 0
+    assert copied.required_bytes(names=["a.exr"]) == 100
+    assert not list((tmp_path / "backup").iterdir())
+
+
+def test_required_bytes_without_links(tmp_path, monkeypatch):
+    """Test that files are counted in full where hard links fail, as on SMB shares."""
+    import os
+    from quick_rename.models.backup import BackupSession
+
+    def refuse(src, dest):
+        raise PermissionError(src)
+    (tmp_path / "a.exr").write_bytes(b"a" * 100)
+    monkeypatch.setattr(os, "link", refuse)
+    session = BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup"))
+    assert session.required_bytes(names=["a.exr"]) == 100
@@ -0,0 +1,71 @@
+def test_run_batch(tmp_path):
+    """Test that a batch is backed up, renamed and its journal removed."""
+    import os
+    from quick_rename.models.batch import run_batch
+    from quick_rename.models.journal import scan_inodes
+    folder = tmp_path / "shots"
+    folder.mkdir()
+    for name in "ab":
+        (folder / name).write_text(name)
+    listing = dict(scan_inodes(directory=str(folder)))
+    run_batch(directory=str(folder), renames=[("a", "b"), ("b", "a")], listing=listing,
+              journal_dir=str(tmp_path / "journal"), backup_root=str(tmp_path / "backup"))
+    assert (folder / "a").read_text() == "b" and (folder / "b").read_text() == "a"
+    assert os.listdir(str(tmp_path / "journal")) == [] and len(os.listdir(str(tmp_path / "backup"))) == 1
+
+
+def test_run_batch_errors(tmp_path, monkeypatch):
+    """Test that nothing is renamed for a missing file or an unwritable journal, and an interrupted batch is kept."""
+    from pytest import raises
+    from quick_rename.models import executor
+    from quick_rename.models.batch import BatchInterrupted, ConflictError, JournalError, run_batch
+    from quick_rename.models.journal import pending_journals, scan_inodes
+    folder = tmp_path / "shots"
+    folder.mkdir()
+    for name in "ab":
+        (folder / name).write_text(name)
+    listing = dict(scan_inodes(directory=str(folder)))
+    (tmp_path / "file").write_text("")
+    with raises(JournalError):
+        run_batch(directory=str(folder), renames=[("a", "c")], listing=listing, journal_dir=str(tmp_path / "file"))
+    assert (folder / "a").exists()
+
+    # b vanished after the listing was taken.
+    (folder / "b").unlink()
+    del listing["b"]
+    with raises(ConflictError) as err:
+        run_batch(directory=str(folder), renames=[("a", "c"), ("b", "d")], listing=listing,
+                  journal_dir=str(tmp_path / "journal"))
+    assert err.value.conflicts == [("b", "d")] and (folder / "a").exists()
+    assert pending_journals(journal_dir=str(tmp_path / "journal")) == []
+
+    def fail(self, chains):
+        raise OSError("disk unplugged")
+    monkeypatch.setattr(executor.RenameExecutor, "run_chains", fail)
+    with raises(BatchInterrupted) as err:
+        run_batch(directory=str(folder), renames=[("a", "c")], listing=listing, journal_dir=str(tmp_path / "journal"))
+    journal, = pending_journals(journal_dir=str(tmp_path / "journal"))
+    assert journal.path == err.value.journal
+
+
+def test_recover_batch_checks_the_folder(tmp_path):
+    """Test that resuming does not rename over a file created since the batch stopped, and rolling back still works."""
+    from pytest import raises
+    from quick_rename.models.batch import ConflictError, recover_batch
+    from quick_rename.models.journal import has_pending, pending_journals, scan_inodes, write_journal
+    from quick_rename.models.scheduler import schedule_renames
+    folder = tmp_path / "shots"
+    folder.mkdir()
+    (folder / "a").write_text("a")
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    write_journal(path=str(journal_dir / "batch.journal"), directory=str(folder),
+                  chains=schedule_renames(renames=[("a", "b")]), inodes=dict(scan_inodes(str(folder)))).close()
+    (folder / "b").write_text("new")
+    journal, = pending_journals(journal_dir=str(journal_dir))
+    assert has_pending(journal_dir=str(journal_dir), directory=str(folder))
+    with raises(ConflictError):
+        recover_batch(journal=journal, resume=True)
+    assert (folder / "a").read_text() == "a" and (folder / "b").read_text() == "new"
+    recover_batch(journal=journal, resume=False)
+    assert not has_pending(journal_dir=str(journal_dir), directory=str(folder))
@@ -0,0 +1,32 @@
+VALUES = (0, 7, 8, 1000)
+
+
+def test_bitset_contains():
+    """Test that added values are members and others are not."""
+    from quick_rename.models.bitset import BitSet
+    bits = BitSet(values=VALUES)
+    assert all(x in bits for x in VALUES) and 1 not in bits and 5000 not in bits
+
+
+def test_bitset_iter_sorted():
+    """Test that iterating yields values in ascending order."""
+    from quick_rename.models.bitset import BitSet
+    assert list(BitSet(values=reversed(VALUES))) == list(VALUES)
+
+
+def test_bitset_count():
+    """Test that the length follows adds and discards, ignoring duplicates."""
+    from quick_rename.models.bitset import BitSet
+    bits = BitSet(values=VALUES)
+    bits.add(7)
+    bits.discard(8)
+    bits.discard(9)
+    assert len(bits) == len(VALUES) - 1 and 8 not in bits
+
+
+def test_bitset_clear():
+    """Test that clear empties the set."""
+    from quick_rename.models.bitset import BitSet
+    bits = BitSet(values=VALUES)
+    bits.clear()
+    assert len(bits) == 0 and not list(bits)
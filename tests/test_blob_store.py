@@ -0,0 +1,53 @@
+def test_hash_file(tmp_path):
+    """Test that chunked hashing matches hashing the whole file."""
+    from hashlib import sha256
+    from quick_rename.models.blob_store import hash_file
+    data = bytes(range(256)) * 1000
+    (tmp_path / "plate.exr").write_bytes(data)
+    assert hash_file(path=str(tmp_path / "plate.exr"), chunk_size=1000) == sha256(data).hexdigest()
+
+
+def test_put_deduplicates(tmp_path):
+    """Test that identical contents are stored once."""
+    from quick_rename.models.blob_store import DEDUPLICATED, BlobStore
+    for name in ("a.exr", "b.exr"):
+        (tmp_path / name).write_text("same")
+    store = BlobStore(root=str(tmp_path / "store"))
+    digest, strategy = store.put(path=str(tmp_path / "a.exr"))
+    assert strategy != DEDUPLICATED
+    assert store.put(path=str(tmp_path / "b.exr")) == (digest, DEDUPLICATED)
+    with open(store.blob_path(digest=digest), encoding="utf-8") as blob:
+        assert blob.read() == "same"
+
+
+def test_digest_cache(tmp_path):
+    """Test that digests are cached across stores until the file changes."""
+    from os import stat
+    from quick_rename.models.blob_store import BlobStore
+    path = tmp_path / "a.exr"
+    path.write_text("first")
+    store = BlobStore(root=str(tmp_path / "store"))
+    digest = store.digest(path=str(path))
+    store.save()
+    assert BlobStore(root=str(tmp_path / "store")).cached_digest(st=stat(path)) == digest
+    path.write_text("second!")
+    assert BlobStore(root=str(tmp_path / "store")).cached_digest(st=stat(path)) is None
+
+
+def test_session_with_store(tmp_path):
+    """Test that repeat backup sessions of unchanged files only write manifests."""
+    from json import loads
+    from quick_rename.models.backup import MANIFEST, BackupSession
+    from quick_rename.models.blob_store import DEDUPLICATED, BlobStore
+    (tmp_path / "a.exr").write_text("a")
+    strategies = []
+    for _ in range(2):
+        store = BlobStore(root=str(tmp_path / "backup" / "store"))
+        with BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup"), store=store) as session:
+            session.has_space(names=["a.exr"])
+            strategies.append(session.backup(name="a.exr"))
+    assert strategies[1] == DEDUPLICATED
+    with open(f"{session.path}/{MANIFEST}", encoding="utf-8") as manifest:
+        record = [loads(x) for x in manifest][1]
+    assert record[1] == "a.exr" and store.has_blob(digest=record[4])
+    assert BackupSession(directory=str(tmp_path), root="", store=store).required_bytes(names=["a.exr"]) == 0
@@ -0,0 +1,95 @@
+from io import StringIO
+
+from pytest import fixture
+
+
+@fixture
+def folder(tmp_path, monkeypatch):
+    """Return a folder holding a short sequence, with journals and history kept in tmp_path."""
+    from quick_rename.defaults import quick_rename_prefs
+    monkeypatch.setattr(quick_rename_prefs, "JOURNAL_DIR", str(tmp_path / "journal"))
+    monkeypatch.setattr(quick_rename_prefs, "HISTORY_DIR", str(tmp_path / "history"))
+    folder = tmp_path / "shots"
+    folder.mkdir()
+    for name in ("shot.0001.exr", "shot.0002.exr", "notes.txt"):
+        (folder / name).write_text(name)
+    return folder
+
+
+def run(*argv, stdin=""):
+    """Run the command line and return its exit status, stdout and stderr."""
+    from quick_rename.cli import main
+    stdout, stderr = StringIO(), StringIO()
+    status = main(argv=[str(x) for x in argv], stdin=StringIO(stdin), stdout=stdout, stderr=stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def test_dry_run(folder):
+    """Test that a dry run prints the new names of every file sorted by name without renaming."""
+    status, out, err = run(folder, "--name", "plate", "--renumber", "--padding", "2", "--ext", "tif", "-n")
+    assert status == 0 and not err
+    assert out == "notes.txt\tplate.01.tif\nshot.0001.exr\tplate.02.tif\nshot.0002.exr\tplate.03.tif\n"
+    assert sorted(x.name for x in folder.iterdir()) == ["notes.txt", "shot.0001.exr", "shot.0002.exr"]
+
+
+def test_rename_from_stdin(folder, tmp_path):
+    """Test that names read from stdin are shifted over themselves, then recorded for undo."""
+    from quick_rename.models.history import list_history
+    status, out, err = run(folder, "-", "--frame-offset", "1", stdin="shot.0001.exr\nshot.0002.exr\n")
+    assert status == 0 and out == "shot.0001.exr\tshot.0002.exr\nshot.0002.exr\tshot.0003.exr\n"
+    assert (folder / "shot.0002.exr").read_text() == "shot.0001.exr"
+    assert (folder / "shot.0003.exr").read_text() == "shot.0002.exr"
+    assert list_history(history_dir=str(tmp_path / "history"))[0].count == 2
+
+
+def test_parallel_rename(folder):
+    """Test that renames spread over several workers still rename every file once."""
+    status, out, err = run(folder, "--prefix", "v2_", "--workers", "4", "--backup")
+    assert status == 0 and not err
+    assert sorted(x.name for x in folder.iterdir() if x.is_file()) == ["v2_notes.txt", "v2_shot.0001.exr",
+                                                                          "v2_shot.0002.exr"]
+
+
+def test_errors(folder):
+    """Test that nothing is renamed when a name is missing, given twice, taken, or every file gets the same name."""
+    assert run(folder, "missing.exr", "--prefix", "v2_")[0] == 1
+    status, out, err = run(folder, "shot.0002.exr", "--frame-offset", "-1")
+    assert status == 1 and not out and "shot.0001.exr" in err
+    assert run(folder, "--name", "plate")[0] == 1
+    status, out, err = run(folder, "notes.txt", "notes.txt", "--name", "x", "--renumber")
+    assert status == 1 and not out and "notes.txt" in err
+    assert run(folder / "notes.txt")[0] == 1
+    assert sorted(x.name for x in folder.iterdir()) == ["notes.txt", "shot.0001.exr", "shot.0002.exr"]
+
+
+def test_cli_does_not_import_qt():
+    """Test that the command line can be used without PySide2."""
+    import sys
+    import quick_rename.cli  # noqa: F401
+    assert not any(x.startswith("PySide2") for x in sys.modules)
+
+
+def test_manifest(folder, tmp_path):
+    """Test that a manifest is renamed chunk by chunk with one JSONL result per row."""
+    import json
+    from quick_rename.models.history import list_history
+    manifest = tmp_path / "renames.csv"
+    manifest.write_text("old,new\nshot.0001.exr,shot.0002.exr\nshot.0002.exr,shot.0001.exr\nmissing.exr,a.exr\n"
+                        "notes.txt,shot.0002.exr\nshot.0001.exr,plate.exr\n")
+    status, out, err = run(folder, "--manifest", manifest, "--chunk-size", "3")
+    results = [json.loads(x) for x in out.splitlines()]
+    assert status == 1 and "3 renamed, 2 rejected" in err
+    assert [x["status"] for x in results] == ["renamed", "renamed", "missing", "conflict", "renamed"]
+    assert results[4] == {"row": 4, "old": "shot.0001.exr", "new": "plate.exr", "status": "renamed"}
+    assert (folder / "plate.exr").read_text() == "shot.0002.exr"
+    assert (folder / "shot.0002.exr").read_text() == "shot.0001.exr"
+    assert len(list_history(history_dir=str(tmp_path / "history"))) == 2
+
+
+def test_manifest_dry_run_from_stdin(folder, tmp_path):
+    """Test that a JSONL manifest read from stdin is checked without renaming."""
+    status, out, err = run(folder, "--manifest", "-", "--format", "jsonl", "--results", tmp_path / "results.jsonl",
+                           "-n", stdin='{"old": "notes.txt", "new": "readme.txt"}\n')
+    assert status == 0 and not out
+    assert '"status": "planned"' in (tmp_path / "results.jsonl").read_text()
+    assert (folder / "notes.txt").exists()
@@ -0,0 +1,72 @@
+from os import listdir
+from time import perf_counter, sleep
+
+from pytest import mark
+
+
+@mark.parametrize("use_dir_fd", [True, False])
+def test_run(tmp_path, use_dir_fd):
+    """Test that scheduled steps are renamed relative to the directory, with and without a directory descriptor."""
+    from quick_rename.models.executor import RenameExecutor
+    for name in ("a", "b"):
+        (tmp_path / name).write_text(name)
+    with RenameExecutor(directory=str(tmp_path), use_dir_fd=use_dir_fd) as executor:
+        count = executor.run(steps=[("a", "t"), ("b", "a"), ("t", "b")])
+    assert count == 3
+    assert sorted(listdir(tmp_path)) == ["a", "b"]
+    assert (tmp_path / "a").read_text() == "b" and (tmp_path / "b").read_text() == "a"
+
+
+LATENCY = 0.01
+
+
+def slow_executor(**kwargs):
+    """Return a RenameExecutor standing in for a network share, every rename and copy takes a round trip."""
+    from quick_rename.models.executor import RenameExecutor
+
+    class SlowExecutor(RenameExecutor):
+        def rename(self, src, dest):
+            sleep(LATENCY)
+            super(SlowExecutor, self).rename(src, dest)
+
+        def backup(self, session, name):
+            sleep(LATENCY)
+            return super(SlowExecutor, self).backup(session, name)
+    return SlowExecutor(**kwargs)
+
+
+def timed_chains(directory, workers):
+    """Shift 10 chains of 4 files by one, return how long it took."""
+    from quick_rename.models.scheduler import schedule_renames
+    renames = [(f"{c}_{i}", f"{c}_{i + 1}") for c in range(10) for i in range(4)]
+    for src, dest in renames:
+        (directory / src).write_text(src)
+    start = perf_counter()
+    with slow_executor(directory=str(directory), workers=workers) as executor:
+        assert executor.run_chains(chains=schedule_renames(renames=renames)) == len(renames)
+    elapsed = perf_counter() - start
+    for src, dest in renames:
+        assert (directory / dest).read_text() == src
+    assert sorted(listdir(directory)) == sorted(f"{c}_{i}" for c in range(10) for i in range(1, 5))
+    return elapsed
+
+
+def test_pooled_chains(tmp_path):
+    """Test that chains keep their order on a thread pool and that throughput scales with workers."""
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "pooled").mkdir()
+    serial = timed_chains(directory=tmp_path / "serial", workers=1)
+    pooled = timed_chains(directory=tmp_path / "pooled", workers=10)
+    assert pooled < serial / 3
+
+
+def test_pooled_backups(tmp_path):
+    """Test that backups are all made on a thread pool."""
+    from quick_rename.models.backup import BackupSession
+    names = [f"f{i}" for i in range(20)]
+    for name in names:
+        (tmp_path / name).write_text(name)
+    with slow_executor(directory=str(tmp_path), workers=4) as executor:
+        with BackupSession(directory=str(tmp_path), root=str(tmp_path / "backup")) as session:
+            assert sorted(executor.run_backups(session=session, names=names)) == sorted(names)
+    assert sorted(listdir(session.path)) == sorted(names + ["manifest.jsonl"])
@@ -0,0 +1,43 @@
+from pytest import raises
+
+NAMES = ("shot010_comp.0001.exr", "shot010_comp.0002.exr", "shot020_bg.0001.tif", "notes (v2).txt")
+
+
+def test_substring_filter():
+    """Test that substring filters treat regex characters literally."""
+    from quick_rename.models.filters import NameFilter, SUBSTRING
+    assert NameFilter(pattern="(v2)", mode=SUBSTRING).apply(names=NAMES) == [3]
+
+
+def test_glob_filter():
+    """Test that glob filters match the whole name."""
+    from quick_rename.models.filters import NameFilter, GLOB
+    assert NameFilter(pattern="shot0?0_*.exr", mode=GLOB).apply(names=NAMES) == [0, 1]
+
+
+def test_glob_substring_fast_path():
+    """Test that a *text* glob behaves like a substring search."""
+    from quick_rename.models.filters import NameFilter, GLOB
+    name_filter = NameFilter(pattern="*0001*", mode=GLOB)
+    assert name_filter.apply(names=NAMES) == [0, 2] and name_filter("a0001b")
+
+
+def test_regex_filter():
+    """Test that regex filters search anywhere in the name."""
+    from quick_rename.models.filters import NameFilter, REGEX
+    assert NameFilter(pattern=r"\d{4}\.tif$", mode=REGEX).apply(names=NAMES) == [2]
+
+
+def test_invalid_regex():
+    """Test that an invalid regex is reported when compiling."""
+    from re import error
+    from quick_rename.models.filters import NameFilter, REGEX
+    with raises(error):
+        NameFilter(pattern="shot[", mode=REGEX)
+
+
+def test_unknown_mode():
+    """Test that unknown modes are rejected."""
+    from quick_rename.models.filters import NameFilter
+    with raises(ValueError):
+        NameFilter(pattern="shot", mode="fuzzy")
@@ -0,0 +1,27 @@
+def test_record_and_undo(tmp_path):
+    """Test that the inverse of a batch is stored and listed per directory, newest first."""
+    from quick_rename.models.history import list_history, read_inverse, record_batch
+    renames = [("a", "b"), ("b", "c"), ("d", "d")]
+    record_batch(history_dir=str(tmp_path), name="001", directory="/shots", renames=renames, max_bytes=1 << 20)
+    record_batch(history_dir=str(tmp_path), name="002", directory="/plates", renames=[("x", "y")], max_bytes=1 << 20)
+    assert [x.directory for x in list_history(history_dir=str(tmp_path))] == ["/plates", "/shots"]
+    entry, = list_history(history_dir=str(tmp_path), directory="/shots")
+    assert entry.count == 2
+    assert read_inverse(entry=entry) == [("b", "a"), ("c", "b")]
+
+
+def test_eviction(tmp_path):
+    """Test that the oldest batches are evicted once over the size limit, keeping the newest."""
+    from quick_rename.models.history import list_history, record_batch
+    renames = [(f"shot_{i:04d}", f"plate_{i:04d}") for i in range(100)]
+    for name in ("001", "002", "003"):
+        record_batch(history_dir=str(tmp_path), name=name, directory="/shots", renames=renames, max_bytes=7000)
+    assert [x.path[-11:] for x in list_history(history_dir=str(tmp_path))] == ["003.history", "002.history"]
+    record_batch(history_dir=str(tmp_path), name="004", directory="/shots", renames=renames, max_bytes=10)
+    assert [x.path[-11:] for x in list_history(history_dir=str(tmp_path))] == ["004.history"]
+
+
+def test_listing_no_history(tmp_path):
+    """Test that a missing history directory has nothing to undo."""
+    from quick_rename.models.history import list_history
+    assert list_history(history_dir=str(tmp_path / "missing")) == []
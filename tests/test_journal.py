@@ -0,0 +1,82 @@
+from os import listdir
+
+from pytest import mark
+
+RENAMES = [("a", "b"), ("b", "c"), ("c", "a"), ("d", "e"), ("e", "f"), ("g", "h")]
+
+
+def make_batch(tmp_path):
+    """Create the files of RENAMES, journal the batch, return the journal path and scheduled chains."""
+    from quick_rename.models.journal import scan_inodes, write_journal
+    from quick_rename.models.scheduler import schedule_renames
+    directory = tmp_path / "files"
+    directory.mkdir()
+    for name in "abcdeg":
+        (directory / name).write_text(name)
+    chains = schedule_renames(renames=RENAMES)
+    path = str(tmp_path / "batch.journal")
+    write_journal(path=path, directory=str(directory), chains=chains,
+                  inodes=dict(scan_inodes(str(directory)))).close()
+    return path, chains
+
+
+def contents(directory):
+    return {x: (directory / x).read_text() for x in listdir(directory)}
+
+
+@mark.parametrize("interrupt_after", [0, 1, 2, 3])
+def test_resume_and_rollback(tmp_path, interrupt_after):
+    """Test that an interrupted batch is finished or undone from the directory state alone."""
+    from quick_rename.models.executor import RenameExecutor
+    from quick_rename.models.journal import pending_journals, read_journal, resume_steps, rollback_steps
+    path, chains = make_batch(tmp_path)
+    directory = tmp_path / "files"
+    original = contents(directory)
+    with RenameExecutor(directory=str(directory)) as executor:
+        executor.run_chains(chains=[x[:interrupt_after] for x in chains])
+        journal, = pending_journals(journal_dir=str(tmp_path))
+        assert journal.planned and not journal.committed
+        executor.run_chains(chains=resume_steps(journal=journal))
+        assert contents(directory) == {"a": "c", "b": "a", "c": "b", "e": "d", "f": "e", "h": "g"}
+        executor.run_chains(chains=rollback_steps(journal=read_journal(path=path)))
+    assert contents(directory) == original
+
+
+def test_commit(tmp_path):
+    """Test that committed journals are removed."""
+    from quick_rename.models.journal import commit_journal, pending_journals
+    path, chains = make_batch(tmp_path)
+    commit_journal(path=path)
+    assert pending_journals(journal_dir=str(tmp_path)) == []
+    assert not (tmp_path / "batch.journal").exists()
+
+
+def test_torn_plan(tmp_path):
+    """Test that a plan cut short is not planned, so nothing is resumed or rolled back."""
+    from quick_rename.models.journal import read_journal, resume_steps, rollback_steps
+    path, chains = make_batch(tmp_path)
+    with open(path, "r+", encoding="utf-8") as journal:
+        text = journal.read()
+        journal.seek(0)
+        journal.truncate()
+        journal.write(text[:len(text) // 2])
+    journal = read_journal(path=path)
+    assert not journal.planned
+    assert resume_steps(journal=journal) == [] and rollback_steps(journal=journal) == []
+
+
+def test_running_batches_are_not_pending(tmp_path):
+    """Test that a batch whose journal is still locked is only returned when asked for running batches."""
+    from quick_rename.models.journal import is_running, pending_journals, scan_inodes, write_journal
+    from quick_rename.models.scheduler import schedule_renames
+    directory = tmp_path / "files"
+    directory.mkdir()
+    (directory / "a").write_text("a")
+    path = str(tmp_path / "batch.journal")
+    journal = write_journal(path=path, directory=str(directory), chains=schedule_renames(renames=[("a", "b")]),
+                            inodes=dict(scan_inodes(str(directory))))
+    assert is_running(path=path) and not list(tmp_path.glob("*.partial"))
+    assert pending_journals(journal_dir=str(tmp_path)) == []
+    assert len(pending_journals(journal_dir=str(tmp_path), running=True)) == 1
+    journal.close()
+    assert not is_running(path=path) and len(pending_journals(journal_dir=str(tmp_path))) == 1
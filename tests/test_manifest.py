@@ -0,0 +1,67 @@
+from io import StringIO
+
+
+def test_read_manifest():
+    """Test that CSV and JSONL rows are read as pairs, keeping unreadable rows as None."""
+    from quick_rename.models.manifest import CSV, JSONL, read_manifest
+    csv = StringIO('old,new\na.exr,b.exr\n"c,1.exr",d.exr\nbroken\n')
+    assert list(read_manifest(stream=csv, fmt=CSV)) == [("a.exr", "b.exr"), ("c,1.exr", "d.exr"), None]
+    # The bare carriage return is rejected by the csv module, the next row is still read.
+    csv = StringIO('a\rb,c\nd,e\n')
+    assert list(read_manifest(stream=csv, fmt=CSV)) == [None, ("d", "e")]
+    jsonl = StringIO('{"old": "a", "new": "b"}\n\n["c", "d"]\n{"old": "e"}\nnot json\n[1, 2]\n')
+    assert list(read_manifest(stream=jsonl, fmt=JSONL)) == [("a", "b"), ("c", "d"), None, None, None]
+
+
+def test_iter_chunks():
+    """Test that rows are split into chunks of at most size rows."""
+    from quick_rename.models.manifest import iter_chunks
+    assert list(iter_chunks(rows=range(5), size=2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_check_chunk():
+    """Test that rejected rows are dropped until the remaining renames are free of conflicts."""
+    from quick_rename.models.manifest import CONFLICT, INVALID, MISSING, UNCHANGED, check_chunk
+    listing = {name: i for i, name in enumerate("abcdefx")}
+    rows = [("a", "b"), ("b", "a"), ("c", "x"), ("d", "c"), ("e", "e"), ("z", "y"), None, ("f", "../f"), ("g", "h"),
+            ("h", "i")]
+    listing["g"] = 7
+    renames, statuses = check_chunk(rows=rows, listing=listing)
+    # d -> c is only rejected once c -> x is, c then stays in place.
+    assert renames == [("a", "b"), ("b", "a"), ("g", "h")]
+    assert statuses == {2: CONFLICT, 3: CONFLICT, 4: UNCHANGED, 5: MISSING, 6: INVALID, 7: INVALID, 9: MISSING}
+
+
+def test_check_chunk_moving_a_file_twice():
+    """Test that every row moving the same file is rejected."""
+    from quick_rename.models.manifest import CONFLICT, check_chunk
+    renames, statuses = check_chunk(rows=[("a", "b"), ("a", "c")], listing={"a": 1})
+    assert renames == [] and statuses == {0: CONFLICT, 1: CONFLICT}
+
+
+def test_apply_renames():
+    """Test that renamed files keep their inode under their new name."""
+    from quick_rename.models.manifest import apply_renames
+    listing = {"a": 1, "b": 2}
+    apply_renames(renames=[("a", "b"), ("b", "a")], listing=listing)
+    assert listing == {"a": 2, "b": 1}
+
+
+def test_interrupted_statuses(tmp_path):
+    """Test that rows renamed before a batch stopped are told apart from rows left in place or moved aside."""
+    import os
+    from quick_rename.models.journal import read_journal, scan_inodes, write_journal
+    from quick_rename.models.manifest import FAILED, RENAMED, interrupted_statuses
+    from quick_rename.models.scheduler import flatten, schedule_renames
+    for name in "abc":
+        (tmp_path / name).write_text(name)
+    listing = dict(scan_inodes(directory=str(tmp_path)))
+    renames = [("a", "b"), ("b", "a"), ("c", "d")]
+    chains = schedule_renames(renames=renames, taken=listing)
+    path = str(tmp_path / "batch.journal")
+    write_journal(path=path, directory=str(tmp_path), chains=chains, inodes=listing).close()
+    # Stop after moving a aside to break the swap and renaming b over it.
+    for src, dest in [x for x in flatten(chains) if x[0] != "c"][:2]:
+        os.rename(str(tmp_path / src), str(tmp_path / dest))
+    journal = read_journal(path=path)
+    assert interrupted_statuses(journal=journal, renames=renames, listing=listing) == [FAILED, RENAMED, FAILED]
@@ -100,3 +100,64 @@ def test_preprocessed_data(add_preprocessed):
     pre, f = add_preprocessed
     assert len(pre.data) == 1 and isinstance(pre.data[0], PreProcessedData)
     remove_temp(f)
+
+
+@fixture
+def indexed_preprocessed(get_preprocessed):
+    """PreProcessed holding items with mixed case extensions."""
+    from quick_rename.models.model import PreProcessedData
+    pre = get_preprocessed
+    pre.add_items(items=[PreProcessedData(name=x, path=x, ext=x[x.rfind("."):])
+                         for x in ("a.exr", "b.EXR", "c.tif", "d.png")])
+    return pre
+
+
+def test_preprocessed_count_ext(indexed_preprocessed):
+    """Test that counting by extension is case insensitive."""
+    assert indexed_preprocessed.count(ext=".exr") == 2
+
+
+def test_preprocessed_count_exts(indexed_preprocessed):
+    """Test that several extensions can be counted at once."""
+    assert indexed_preprocessed.count(ext={".exr", ".png", ".jpg"}) == 3
+
+
+def test_preprocessed_items_ext(indexed_preprocessed):
+    """Test that items are returned in row order for several extensions."""
+    assert [x.name for x in indexed_preprocessed.items(ext={".png", ".EXR"})] == ["a.exr", "b.EXR", "d.png"]
+
+
+def test_preprocessed_index_after_remove(indexed_preprocessed):
+    """Test that the extension index follows removed items."""
+    pre = indexed_preprocessed
+    pre.remove_items(names={"a.exr"})
+    assert [x.name for x in pre.items(ext=".exr")] == ["b.EXR"]
+
+
+def test_parse_extensions():
+    """Test that extensions are normalised from a comma or space separated string."""
+    from quick_rename.models.model import parse_extensions
+    assert parse_extensions(value="exr, .TIF png,,") == {".exr", ".tif", ".png"}
+
+
+def test_preprocessed_sort_remap(indexed_preprocessed):
+    """Test that sorting returns the new row of every previous row."""
+    from quick_rename.models.model import PreProcessedData
+    pre = indexed_preprocessed
+    pre.add_items(items=[PreProcessedData(name="0.exr", path="0.exr", ext=".exr")])
+    remap = pre.sort()
+    assert remap == [1, 2, 3, 4, 0] and pre.data[0].name == "0.exr"
+
+
+def test_preprocessed_remove_remap(indexed_preprocessed):
+    """Test that removing returns the new row of every previous row."""
+    assert indexed_preprocessed.remove_items(names={"b.EXR"}) == [0, -1, 1, 2]
+
+
+def test_preprocessed_sequences():
+    """Test that sequences are reported with PreProcessed rows."""
+    from quick_rename.models.model import PreProcessed, PreProcessedData
+    pre = PreProcessed()
+    pre.add_items(items=[PreProcessedData(name=x, path=x, ext=".exr") for x in ("a.0001.exr", "a.0002.exr", "b.exr")])
+    sequence, = pre.sequences()
+    assert sequence.label == "a.####.exr [1-2]" and list(sequence.rows) == [0, 1]
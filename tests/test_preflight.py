@@ -0,0 +1,26 @@
+def test_no_conflicts():
+    """Test that names vacated by the batch may be reused, whatever the order."""
+    from quick_rename.models.preflight import find_conflicts
+    renames = [("a", "b"), ("b", "c"), ("c", "a")]
+    assert find_conflicts(renames=renames, listing=["a", "b", "c", "d"]) == []
+
+
+def test_existing_conflicts():
+    """Test that names kept on disk conflict, including names of files renamed to themselves."""
+    from quick_rename.models.preflight import find_conflicts
+    renames = [("a", "d"), ("b", "b"), ("c", "b"), ("e", "f")]
+    assert find_conflicts(renames=renames, listing=["a", "b", "c", "d", "e"]) == [0, 2]
+
+
+def test_batch_conflicts():
+    """Test that every rename sharing a new name is reported."""
+    from quick_rename.models.preflight import find_conflicts
+    renames = [("a", "x"), ("b", "y"), ("c", "x"), ("d", "x")]
+    assert find_conflicts(renames=renames, listing=["a", "b", "c", "d"]) == [0, 2, 3]
+
+
+def test_missing_conflicts():
+    """Test that renames of files missing from the listing are reported."""
+    from quick_rename.models.preflight import find_conflicts
+    renames = [("a", "b"), ("gone", "c"), ("d", "gone")]
+    assert find_conflicts(renames=renames, listing=["a", "d"]) == [1]
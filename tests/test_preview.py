@@ -0,0 +1,36 @@
+def test_build_preview_names():
+    """Test that new names are keyed by row in renumbering order."""
+    from quick_rename.models.preview import build_preview
+    from quick_rename.models.rename_plan import RenamePlan
+    preview = build_preview(plan=RenamePlan(new_name="plate", renumber=True), start=5, rows=[3, 1],
+                            names=["a.exr", "b.exr"])
+    assert list(preview.names.items()) == [(3, "plate.5.exr"), (1, "plate.6.exr")]
+    assert preview.duplicates == []
+
+
+def test_build_preview_duplicates():
+    """Test that every row sharing a new name is reported once."""
+    from quick_rename.models.preview import build_preview
+    from quick_rename.models.rename_plan import RenamePlan
+    preview = build_preview(plan=RenamePlan(remove_ext=True), start=1, rows=[0, 1, 2, 3],
+                            names=["a.exr", "a.tif", "b.exr", "a.jpg"])
+    assert preview.duplicates == [0, 1, 3]
+
+
+def test_build_preview_interrupted():
+    """Test that an interrupted preview returns nothing."""
+    from quick_rename.models.preview import build_preview
+    from quick_rename.models.rename_plan import RenamePlan
+    assert build_preview(plan=RenamePlan(), start=1, rows=[0], names=["a"], interrupted=lambda: True) is None
+
+
+def test_preview_matches():
+    """Test that a preview only matches the options and checked order it was computed for."""
+    from quick_rename.models.preview import build_preview
+    from quick_rename.models.rename_plan import RenamePlan
+    plan = RenamePlan(prefix="v2_")
+    preview = build_preview(plan=plan, start=1, rows=[2, 0], names=["a", "b"])
+    assert preview.matches(plan=RenamePlan(prefix="v2_"), start=1, rows=[2, 0])
+    assert not preview.matches(plan=plan, start=1, rows=[0, 2])
+    assert not preview.matches(plan=plan, start=2, rows=[2, 0])
+    assert not preview.matches(plan=RenamePlan(), start=1, rows=[2, 0])
@@ -0,0 +1,75 @@
+from pytest import mark
+
+NAME = "shot_comp.exr"
+
+
+@mark.parametrize("plan_args, number, expected", [
+    ({}, 1, "shot_comp.exr"),
+    ({"remove_ext": True}, 1, "shot_comp"),
+    ({"new_ext": ".tif"}, 1, "shot_comp.tif"),
+    ({"remove_ext": True, "new_ext": ".tif"}, 1, "shot_comp"),
+    ({"new_name": "plate"}, 1, "plate.exr"),
+    ({"find": "comp", "replace": "bg"}, 1, "shot_bg.exr"),
+    ({"new_name": "plate", "find": "comp", "replace": "bg"}, 1, "plate.exr"),
+    ({"prefix": "v2_"}, 1, "v2_shot_comp.exr"),
+    ({"renumber": True}, 7, "shot_comp.7.exr"),
+    ({"renumber": True, "padding": 4}, 7, "shot_comp.0007.exr"),
+    ({"renumber": True, "dot": "", "padding": 3, "new_name": "plate"}, 12, "plate012.exr"),
+])
+def test_plan_name(plan_args, number, expected):
+    """Test that compiled plans apply options in the same order as RenameOptionsController.configure_name."""
+    from quick_rename.models.rename_plan import RenamePlan, compile_plan
+    assert compile_plan(RenamePlan(**plan_args))(NAME, number) == expected
+
+
+@mark.parametrize("name, plan_args, expected", [
+    ("shot.0001.exr", {"frame_offset": 10}, "shot.0011.exr"),
+    ("shot.0001.exr", {"frame_offset": 0, "padding": 5}, "shot.00001.exr"),
+    ("shot.0001.exr", {"frame_offset": -2}, "shot.-0001.exr"),
+    ("shot.0001.exr", {"frame_offset": 1, "dot": "_"}, "shot_0002.exr"),
+    ("plate_0001.exr", {"frame_offset": 1}, "plate_0002.exr"),
+    ("plate_0001.exr", {"frame_offset": 1, "new_name": "bg"}, "bg.0002.exr"),
+    ("notes.txt", {"frame_offset": 1}, "notes.7.txt"),
+])
+def test_plan_keeps_frames(name, plan_args, expected):
+    """Test that a frame offset shifts the existing frame numbers instead of numbering by position."""
+    from quick_rename.models.rename_plan import RenamePlan, compile_plan
+    assert compile_plan(RenamePlan(renumber=True, **plan_args))(name, 7) == expected
+
+
+def test_plan_keeps_sequence_padding():
+    """Test that kept frame numbers are padded as their sequence is, not as their own frame number."""
+    from quick_rename.models.rename_plan import RenamePlan, plan_names
+    names = ["a.9.exr", "a.10.exr", "a.11.exr", "b.0010.exr", "b.0011.exr"]
+    assert plan_names(plan=RenamePlan(renumber=True, frame_offset=-1), names=names, start=1) == [
+        "a.8.exr", "a.9.exr", "a.10.exr", "b.0009.exr", "b.0010.exr"]
+    assert plan_names(plan=RenamePlan(renumber=True, frame_offset=0, padding=3), names=names[:2], start=1) == [
+        "a.009.exr", "a.010.exr"]
+
+
+def test_plan_is_hashable():
+    """Test that equal plans hash equally so they can be cached."""
+    from quick_rename.models.rename_plan import RenamePlan
+    assert hash(RenamePlan(prefix="a")) == hash(RenamePlan(prefix="a")) and RenamePlan() != RenamePlan(prefix="a")
+
+
+def test_plan_names_numbers_in_order():
+    """Test that plan_names numbers files from start in the given order."""
+    from quick_rename.models.rename_plan import RenamePlan, plan_names
+    plan = RenamePlan(new_name="plate", renumber=True, padding=2)
+    assert plan_names(plan=plan, names=["b.exr", "a.exr"], start=9) == ["plate.09.exr", "plate.10.exr"]
+
+
+def test_plan_does_not_import_qt():
+    """Test that the rename engine can be used without PySide2."""
+    import sys
+    import quick_rename.models.rename_plan  # noqa: F401
+    assert not any(x.startswith("PySide2") for x in sys.modules)
+
+
+@mark.parametrize("name", ["a.exr", "a.b.exr", "a", ".hidden", "..x", ".a.exr", "a.", "", "..."])
+def test_split_ext_matches_splitext(name):
+    """Test that split_ext agrees with os.path.splitext for file names."""
+    from os.path import splitext
+    from quick_rename.models.rename_plan import split_ext
+    assert split_ext(name) == splitext(name)
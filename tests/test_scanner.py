@@ -0,0 +1,49 @@
+from pytest import fixture
+
+FILES = ("b.exr", "a.exr", "c.tif")
+FOLDER = "sub_dir"
+
+
+@fixture
+def populated_dir(tmp_path):
+    """Directory holding a few files and a sub directory."""
+    for name in FILES:
+        (tmp_path / name).write_text("")
+    (tmp_path / FOLDER).mkdir()
+    return tmp_path
+
+
+def test_scan_only_returns_files(populated_dir):
+    """Test that directories are not collected by the scanner."""
+    from quick_rename.models.scanner import scan_directory
+    names = [x.name for x in scan_directory(directory=str(populated_dir))]
+    assert FOLDER not in names and len(names) == len(FILES)
+
+
+def test_scan_is_sorted(populated_dir):
+    """Test that scanned items are sorted by name."""
+    from quick_rename.models.scanner import scan_directory
+    names = [x.name for x in scan_directory(directory=str(populated_dir))]
+    assert names == sorted(FILES)
+
+
+def test_scan_matches_add_item(populated_dir):
+    """Test that the scanner produces the same records as PreProcessed.add_item."""
+    from os import listdir
+    from quick_rename.models.model import PreProcessed
+    from quick_rename.models.scanner import scan_directory
+    directory = str(populated_dir)
+    expected = PreProcessed()
+    for name in sorted(listdir(directory)):
+        expected.add_item(item=name, directory=directory)
+    scanned = PreProcessed()
+    scanned.add_items(items=scan_directory(directory=directory))
+    assert scanned.data == expected.data
+
+
+def test_scan_batches(populated_dir):
+    """Test that batches are bounded by batch_size and cover every file."""
+    from quick_rename.models.scanner import iter_batches
+    batches = list(iter_batches(directory=str(populated_dir), batch_size=2))
+    assert [len(x) for x in batches] == [2, 1]
+    assert sorted(x.name for batch in batches for x in batch) == sorted(FILES)
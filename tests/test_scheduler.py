@@ -0,0 +1,67 @@
+from pytest import mark
+
+
+def apply(names, steps):
+    """Run steps against a set of names, failing if a name would be overwritten."""
+    names = set(names)
+    for src, dest in steps:
+        assert src in names and dest not in names
+        names.remove(src)
+        names.add(dest)
+    return names
+
+
+def test_shift():
+    """Test that renumbering a sequence onto itself runs from the free end."""
+    from quick_rename.models.scheduler import flatten, schedule_renames
+    renames = [(f"shot_{i:03d}", f"shot_{i + 1:03d}") for i in range(1, 501)]
+    chains = schedule_renames(renames=renames)
+    assert len(chains) == 1
+    assert apply([src for src, dest in renames], flatten(chains)) == {f"shot_{i:03d}" for i in range(2, 502)}
+
+
+@mark.parametrize("size", [2, 3, 10])
+def test_cycle(size):
+    """Test that a cycle is broken with a single temporary name."""
+    from quick_rename.models.scheduler import flatten, schedule_renames
+    renames = [(str(i), str((i + 1) % size)) for i in range(size)]
+    chains = schedule_renames(renames=renames)
+    steps = flatten(chains)
+    assert len(chains) == 1 and len(steps) == size + 1
+    temps = {dest for src, dest in steps} - {str(i) for i in range(size)}
+    assert len(temps) == 1
+    assert apply([str(i) for i in range(size)], steps) == {str(i) for i in range(size)}
+
+
+def test_mixed():
+    """Test that chains, cycles, independent and unchanged renames are scheduled together."""
+    from quick_rename.models.scheduler import flatten, schedule_renames
+    renames = [("a", "b"), ("b", "a"), ("c", "d"), ("d", "e"), ("f", "g"), ("h", "h")]
+    chains = schedule_renames(renames=renames)
+    assert len(chains) == 3
+    assert apply("abcdfh", flatten(chains)) == set("abdegh")
+
+
+def test_temp_name_avoids_taken():
+    """Test that temporary names skip names already in the directory."""
+    from quick_rename.models.scheduler import TEMP_FORMAT, schedule_renames
+    taken = {TEMP_FORMAT.format("a", "")}
+    steps = schedule_renames(renames=[("a", "b"), ("b", "a")], taken=taken)[0]
+    assert steps[0] == ("a", TEMP_FORMAT.format("a", 1))
+
+
+def test_temp_name_avoids_new_names():
+    """Test that a temporary name is never a name another file of the batch moves into."""
+    from quick_rename.models.scheduler import TEMP_FORMAT, flatten, schedule_renames
+    temp = TEMP_FORMAT.format("a", "")
+    renames = [("a", "b"), ("b", "a"), ("c", temp)]
+    steps = flatten(schedule_renames(renames=renames))
+    assert (temp, "b") not in steps and ("a", temp) not in steps
+    assert apply("abc", steps) == {"a", "b", temp}
+
+
+def test_net_renames():
+    """Test that the steps of scheduled chains are followed back to the renames of the batch."""
+    from quick_rename.models.scheduler import net_renames, schedule_renames
+    renames = [("a", "b"), ("b", "a"), ("c", "d"), ("d", "e"), ("f", "g")]
+    assert sorted(net_renames(chains=schedule_renames(renames=renames))) == sorted(renames)
@@ -0,0 +1,58 @@
+def test_parse_frame():
+    """Test that the frame number is the last digits before the extension."""
+    from quick_rename.models.sequence import parse_frame
+    assert parse_frame("shot010_comp.0001.exr") == ("shot010_comp.", "0001", ".exr")
+    assert parse_frame("plate_12") == ("plate_", "12", "")
+    assert parse_frame("clip.mp4") is None
+    assert parse_frame("notes.txt") is None
+
+
+def test_detect_sequences():
+    """Test that frames are grouped by name, extension and padding, in frame order."""
+    from quick_rename.models.sequence import detect_sequences
+    names = ["a.0002.exr", "a.0001.exr", "a.0001.tif", "a.0003.tif", "b.1.exr", "b.10.exr", "b.2.exr", "c.exr",
+             "d.01.exr", "d.001.exr", "d.002.exr"]
+    sequences = detect_sequences(names=names)
+    assert [x.label for x in sequences] == ["a.####.exr [1-2]", "a.####.tif [1-3]", "b.#.exr [1-10]",
+                                            "d.###.exr [1-2]"]
+    assert list(sequences[0].rows) == [1, 0]
+    assert list(sequences[2].frames) == [1, 2, 10] and sequences[2].padding == 0
+
+
+def test_missing_frames():
+    """Test that frames missing between the first and last frame are counted."""
+    from quick_rename.models.sequence import detect_sequences
+    sequence = detect_sequences(names=["a.1.exr", "a.4.exr", "a.2.exr"])[0]
+    assert sequence.missing == 1
+
+
+def test_find_gaps():
+    """Test that every run of missing frames is found and listed as a range."""
+    from quick_rename.models.sequence import find_gaps, format_gaps
+    assert find_gaps([1, 2, 5, 7, 8]) == [(3, 4), (6, 6)]
+    assert find_gaps([3]) == [] and find_gaps([]) == []
+    assert format_gaps([(3, 4), (6, 6)]) == "3-4, 6"
+    assert format_gaps([(3, 4), (6, 6)], limit=1) == "3-4"
+
+
+def test_frame_paddings():
+    """Test that every file with a frame number gets the padding of its sequence."""
+    from quick_rename.models.sequence import frame_paddings
+    names = ["a.9.exr", "a.10.exr", "b.0010.exr", "c.0100.exr", "notes.txt"]
+    assert frame_paddings(names=names) == {"a.9.exr": 0, "a.10.exr": 0, "b.0010.exr": 4, "c.0100.exr": 4}
+
+
+def test_overlapping_shift_is_scheduled():
+    """Test that a sequence shifted over itself renames without overwriting a frame."""
+    from quick_rename.models.preflight import find_conflicts
+    from quick_rename.models.rename_plan import RenamePlan, plan_names
+    from quick_rename.models.scheduler import flatten, schedule_renames
+    names = [f"a.{i:04d}.exr" for i in range(1, 11)]
+    renames = list(zip(names, plan_names(plan=RenamePlan(renumber=True, frame_offset=2), names=names, start=1)))
+    assert not find_conflicts(renames=renames, listing=set(names))
+    files = set(names)
+    for src, dest in flatten(schedule_renames(renames=renames, taken=files)):
+        assert dest not in files
+        files.remove(src)
+        files.add(dest)
+    assert files == {f"a.{i:04d}.exr" for i in range(3, 13)}
@@ -0,0 +1,61 @@
+from pytest import fixture
+
+FILES = ("a.exr", "b.exr")
+PAST = 1000000000
+
+
+@fixture
+def snapshot_dir(tmp_path):
+    """Directory holding a few files with an mtime well outside the racy window."""
+    from os import utime
+    for name in FILES:
+        (tmp_path / name).write_text("")
+    utime(str(tmp_path), (PAST, PAST))
+    return tmp_path
+
+
+@fixture
+def get_snapshot(snapshot_dir):
+    """Snapshot of snapshot_dir."""
+    from quick_rename.models.snapshot import DirectorySnapshot, stat_directory
+    mtime, inode = stat_directory(directory=str(snapshot_dir))
+    return DirectorySnapshot(path=str(snapshot_dir), mtime=mtime, inode=inode, names=FILES)
+
+
+def test_snapshot_is_current(get_snapshot):
+    """Test that an unchanged directory is reported as current."""
+    assert get_snapshot.is_current()
+
+
+def test_snapshot_not_current_after_change(snapshot_dir, get_snapshot):
+    """Test that adding a file invalidates the snapshot."""
+    (snapshot_dir / "c.exr").write_text("")
+    assert not get_snapshot.is_current()
+
+
+def test_snapshot_racy_mtime_not_current(snapshot_dir):
+    """Test that a directory modified right before the snapshot is not trusted."""
+    from quick_rename.models.snapshot import DirectorySnapshot, stat_directory
+    (snapshot_dir / "c.exr").write_text("")
+    mtime, inode = stat_directory(directory=str(snapshot_dir))
+    snapshot = DirectorySnapshot(path=str(snapshot_dir), mtime=mtime, inode=inode, names=FILES)
+    assert not snapshot.is_current()
+
+
+def test_snapshot_diff(snapshot_dir, get_snapshot):
+    """Test that diff reports only added and removed files."""
+    from quick_rename.models.scanner import scan_directory
+    (snapshot_dir / "a.exr").unlink()
+    (snapshot_dir / "c.exr").write_text("")
+    added, removed = get_snapshot.diff(items=scan_directory(directory=str(snapshot_dir)))
+    assert [x.name for x in added] == ["c.exr"] and removed == {"a.exr"}
+
+
+def test_preprocessed_remove_items(snapshot_dir):
+    """Test that items can be removed from PreProcessed by name."""
+    from quick_rename.models.model import PreProcessed
+    from quick_rename.models.scanner import scan_directory
+    pre = PreProcessed()
+    pre.add_items(items=scan_directory(directory=str(snapshot_dir)))
+    pre.remove_items(names={"a.exr"})
+    assert [x.name for x in pre.data] == ["b.exr"]